@@ -0,0 +1,112 @@
+"""
+Throughput benchmark against the in-process Notion API stand-in.
+
+Creates cards concurrently, lists them back through paginated queries and
+reads each one, with NotionService talking to ``FakeNotionAPI`` instead of
+the network. Server latency, jitter, its rate limit (429) and error rate
+are configurable, as is the client-side rate limiter, so bulk settings can
+be compared offline.
+
+Usage:
+    python benchmarks/bench_fake_api.py [--cards 60] [--latency-ms 120] [--client-rate 3]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+
+async def run(args: argparse.Namespace) -> None:
+    from services.fake_notion_api import FakeNotionAPI
+    from services.notion_service import NotionAPIError, NotionService
+    from services.rate_limiter import AsyncRateLimiter
+    from utils.concurrency import gather_bounded
+
+    api = FakeNotionAPI(
+        latency_seconds=args.latency_ms / 1000,
+        jitter_seconds=args.jitter_ms / 1000,
+        rate_limit_per_second=args.server_rate or None,
+        error_probability=args.error_rate,
+        seed=args.seed,
+    )
+    database_id = api.add_database("Bench", {"Name": "title", "Status": "status"})
+    service = NotionService(
+        token="bench_token",
+        rate_limiter=AsyncRateLimiter(args.client_rate),
+        transport=api,
+    )
+
+    def card(index: int) -> dict:
+        return {
+            "Name": service.build_title_property(f"Card {index:04d}"),
+            "Status": service.build_status_property("Para Fazer"),
+        }
+
+    phases = {}
+    try:
+        start = time.perf_counter()
+        created = await gather_bounded(
+            (service.create_page(database_id, card(index)) for index in range(args.cards)),
+            limit=args.concurrency,
+            return_exceptions=True,
+        )
+        phases["create"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        try:
+            pages = await service.query_database_all(database_id)
+        except NotionAPIError as exc:  # E.g., a 429 with the client limiter off
+            print(f"query_all failed: {exc}")
+            pages = []
+        phases["query_all"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        await gather_bounded(
+            (service.get_page(page["id"]) for page in pages),
+            limit=args.concurrency,
+            return_exceptions=True,
+        )
+        phases["read"] = time.perf_counter() - start
+    finally:
+        await service.close()
+
+    failed = sum(isinstance(result, BaseException) for result in created)
+    total = sum(api.requests.values())
+    elapsed = sum(phases.values())
+    print(
+        "  ".join(f"{name}={seconds * 1000:8.1f}ms" for name, seconds in phases.items())
+        + f"  requests={total}  req/s={total / elapsed:6.1f}"
+        + f"  created={len(created) - failed}  failed={failed}"
+        + f"  status={dict(sorted(api.statuses.items()))}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--cards", type=int, default=60)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=120.0)
+    parser.add_argument("--jitter-ms", type=float, default=60.0)
+    parser.add_argument("--server-rate", type=float, default=3.0, help="0 disables server 429s")
+    parser.add_argument("--client-rate", type=float, default=3.0, help="0 disables the limiter")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    sys.path.insert(0, str(SRC_DIR))
+    import runtime
+
+    runtime.configure_logging()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
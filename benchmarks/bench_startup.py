@@ -0,0 +1,113 @@
+"""
+Startup benchmark for the MCP server.
+
+Compares a cold boot (fresh interpreter: imports + app + tool registration)
+with a warm boot (app + tool registration again in an already loaded
+process). Uses dummy credentials; no request reaches the Notion API.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+BENCH_ENV = {
+    "NOTION_API_TOKEN": "bench_token",
+    "NOTION_WORK_DATABASE_ID": "work_db",
+    "NOTION_STUDIES_DATABASE_ID": "studies_db",
+    "NOTION_PERSONAL_DATABASE_ID": "personal_db",
+    "NOTION_YOUTUBER_DATABASE_ID": "youtuber_db",
+    "LOG_LEVEL": "WARNING",
+}
+
+_BOOT_SNIPPET = """
+import json, time
+start = time.perf_counter()
+import runtime
+runtime.configure_logging()
+imported = time.perf_counter()
+app = runtime.create_fastmcp_app()
+created = time.perf_counter()
+app.ensure_tools()
+registered = time.perf_counter()
+print(json.dumps({
+    "import": (imported - start) * 1000,
+    "create_app": (created - imported) * 1000,
+    "register_tools": (registered - created) * 1000,
+    "total": (registered - start) * 1000,
+}))
+"""
+
+
+def cold_boot(runs: int) -> list[dict]:
+    env = {**os.environ, **BENCH_ENV, "LOG_FILE_PATH": os.devnull, "PYTHONPATH": str(SRC_DIR)}
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _BOOT_SNIPPET],
+            env=env,
+            cwd=SRC_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        samples.append(json.loads(output.stdout.strip().splitlines()[-1]))
+    return samples
+
+
+def warm_boot(runs: int) -> list[dict]:
+    os.environ.update(BENCH_ENV)
+    os.environ["LOG_FILE_PATH"] = os.devnull
+    sys.path.insert(0, str(SRC_DIR))
+
+    import runtime
+
+    runtime.configure_logging()
+    # Prime imports once so every measured run is warm
+    runtime.create_fastmcp_app().ensure_tools()
+
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        app = runtime.create_fastmcp_app()
+        created = time.perf_counter()
+        app.ensure_tools()
+        registered = time.perf_counter()
+        samples.append(
+            {
+                "import": 0.0,
+                "create_app": (created - start) * 1000,
+                "register_tools": (registered - created) * 1000,
+                "total": (registered - start) * 1000,
+            }
+        )
+    return samples
+
+
+def _report(label: str, samples: list[dict]) -> None:
+    columns = ("import", "create_app", "register_tools", "total")
+    medians = {column: statistics.median(sample[column] for sample in samples) for column in columns}
+    row = "  ".join(f"{column}={medians[column]:8.1f}ms" for column in columns)
+    print(f"{label:<5} (median of {len(samples)}): {row}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    _report("cold", cold_boot(args.runs))
+    _report("warm", warm_boot(args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,15 @@ Base class for custom Notion implementations
 Provides common functionality for all custom Notion classes.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 import structlog
 
 from services.notion_service import NotionService
 from utils import (
+    CONFLICT_CHECK_MODES,
     DEFAULT_STATUS,
     DESCRIPTION_FIELD,
     RELATION_FIELD,
@@ -19,6 +21,8 @@ from utils import (
     DatabaseType,
     validate_card_data,
 )
+from utils.metrics import METRICS
+from utils.tracing import TRACER
 
 logger = structlog.get_logger(__name__)
 
@@ -57,6 +61,13 @@ class CustomNotion(ABC):
         self.date_field = DATE_FIELD.get(database_type)
         self.description_field = DESCRIPTION_FIELD.get(database_type)
 
+        self.service.store.register_database(
+            database_id,
+            title_field=self.title_field,
+            relation_field=self.relation_field,
+            date_field=self.date_field,
+        )
+
         logger.info(
             "custom_notion_initialized",
             database_type=database_type.value,
@@ -202,6 +213,186 @@ class CustomNotion(ABC):
 
         return result.get("results", [])
 
+    async def query_all_cards(
+        self,
+        filter_conditions: Optional[Dict[str, Any]] = None,
+        sorts: Optional[List[Dict[str, str]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Query every matching card, following pagination cursors
+
+        Args:
+            filter_conditions: Filter configuration
+            sorts: Sort configuration
+
+        Returns:
+            List of all matching cards
+        """
+        logger.info(
+            "querying_all_cards",
+            database_type=self.database_type.value,
+            has_filter=filter_conditions is not None,
+        )
+
+        return await self.service.query_database_all(
+            database_id=self.database_id,
+            filter_conditions=filter_conditions,
+            sorts=sorts,
+        )
+
+    async def sync_store(self) -> int:
+        """
+        Load every card of this database into the service card store
+
+        Stored cards missing from the listing (deleted or archived
+        elsewhere) are dropped.
+
+        Returns:
+            Number of cards fetched
+        """
+        cards = await self.query_all_cards()
+        pruned = self.service.store.prune(self.database_id, (card["id"] for card in cards))
+        logger.info(
+            "card_store_synced",
+            database_type=self.database_type.value,
+            count=len(cards),
+            pruned=pruned,
+        )
+        return len(cards)
+
+    async def _create_page(
+        self,
+        properties: Dict[str, Any],
+        icon: Optional[Dict[str, Any]] = None,
+        idempotent: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Create a page in this database, optionally deduplicated
+
+        With ``idempotent``, the (title, parent, date) of ``properties`` is
+        looked up in the service card store first. A match is returned
+        without any request, and concurrent creates of the same key share
+        a single request. The store only knows pages this process has seen
+        (responses and ``sync_store``).
+
+        Args:
+            properties: Page properties
+            icon: Page icon
+            idempotent: Return an existing matching card instead of creating one
+
+        Returns:
+            Created (or existing) page object
+        """
+        with TRACER.span(
+            "custom.create_page",
+            **{"notion.database_type": self.database_type.value, "notion.idempotent": idempotent},
+        ) as span:
+            if not idempotent:
+                return await self.service.create_page(
+                    database_id=self.database_id,
+                    properties=properties,
+                    icon=icon,
+                )
+
+            store = self.service.store
+            key = store.dedup_key(self.database_id, properties)
+            existing = store.find(key)
+            METRICS.record_cache("card_store_dedup", existing is not None)
+            span.set_attribute("notion.deduplicated", existing is not None)
+            if existing is not None:
+                logger.info(
+                    "card_create_deduplicated",
+                    database_type=self.database_type.value,
+                    page_id=existing.get("id"),
+                )
+                return existing
+
+            if key is None:
+                return await self.service.create_page(
+                    database_id=self.database_id,
+                    properties=properties,
+                    icon=icon,
+                )
+
+            in_flight = store.pending(key)
+            if in_flight is not None:
+                return await asyncio.shield(in_flight)
+
+            store.begin(key)
+            try:
+                page = await self.service.create_page(
+                    database_id=self.database_id,
+                    properties=properties,
+                    icon=icon,
+                )
+            except BaseException as exc:
+                store.finish(key, error=exc)
+                raise
+            store.finish(key, page=page)
+            return page
+
+    def _check_schedule(
+        self,
+        periods: Sequence[Optional[Dict[str, Any]]],
+        mode: str = "off",
+        exclude: Iterable[str] = (),
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Check planned periods for overlaps before any request is sent
+
+        Planned periods are compared with every timed card in the service
+        card store (all databases, as warm as syncs and responses made it)
+        and with each other.
+
+        Args:
+            periods: Planned periods (``{"start", "end"}``), in input order
+            mode: ``off`` skips the check, ``report`` returns the conflicts,
+                ``reject`` raises when there is any
+            exclude: Page IDs to ignore (e.g., cards being rescheduled)
+
+        Returns:
+            Conflicts (see ``ScheduleIndex.find_conflicts``, with ``title``
+            added to stored pages), or ``None`` when ``mode`` is ``off``
+
+        Raises:
+            ValueError: Unknown mode, or conflicts found with ``reject``
+        """
+        if mode not in CONFLICT_CHECK_MODES:
+            raise ValueError(
+                f"Invalid check_conflicts '{mode}'. Options: {', '.join(CONFLICT_CHECK_MODES)}"
+            )
+        if mode == "off":
+            return None
+
+        store = self.service.store
+        conflicts = store.schedule.find_conflicts(periods, exclude)
+        for entry in conflicts:
+            for clash in entry["conflicts"]:
+                if "page_id" in clash:
+                    clash["title"] = store.title(clash["page_id"])
+
+        logger.info(
+            "schedule_conflicts_checked",
+            database_type=self.database_type.value,
+            mode=mode,
+            planned=len(periods),
+            conflicting=len(conflicts),
+            indexed=len(store.schedule),
+        )
+
+        if conflicts and mode == "reject":
+            details = "; ".join(
+                f"#{entry['index']} ({entry['period']['start']}) overlaps "
+                + ", ".join(
+                    f"'{clash['title']}'" if "page_id" in clash else f"#{clash['index']}"
+                    for clash in entry["conflicts"]
+                )
+                for entry in conflicts
+            )
+            raise ValueError(f"Schedule conflicts: {details}")
+
+        return conflicts
+
     def _validate_and_prepare(
         self,
         data: Dict[str, Any],
@@ -217,7 +408,8 @@ class CustomNotion(ABC):
         Raises:
             ValidationError: If validation fails
         """
-        validate_card_data(data, self.database_type, parent_id)
+        with TRACER.span("custom.validate", **{"notion.database_type": self.database_type.value}):
+            validate_card_data(data, self.database_type, parent_id)
 
     async def _build_properties(
         self,
@@ -236,21 +428,22 @@ class CustomNotion(ABC):
         Returns:
             Properties dict
         """
-        properties: Dict[str, Any] = {
-            self.title_field: self.service.build_title_property(title),
-        }
-
-        # Add status (use default if not provided)
-        if status is None:
-            status = DEFAULT_STATUS[self.database_type]
-
-        properties["Status"] = self.service.build_status_property(status)
-
-        # Add parent relation if provided
-        if "parent_id" in kwargs and self.relation_field:
-            properties[self.relation_field] = self.service.build_relation_property([
-                kwargs["parent_id"]
-            ])
+        with TRACER.span("custom.build_properties"):
+            properties: Dict[str, Any] = {
+                self.title_field: self.service.build_title_property(title),
+            }
+
+            # Add status (use default if not provided)
+            if status is None:
+                status = DEFAULT_STATUS[self.database_type]
+
+            properties["Status"] = self.service.build_status_property(status)
+
+            # Add parent relation if provided
+            if "parent_id" in kwargs and self.relation_field:
+                properties[self.relation_field] = self.service.build_relation_property([
+                    kwargs["parent_id"]
+                ])
 
         return properties
 
@@ -9,7 +9,7 @@ Handles personal tasks and events with specific business rules:
 
 import calendar
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import structlog
 
@@ -19,10 +19,12 @@ from utils import (
     DATE_FIELD,
     DESCRIPTION_FIELD,
     RELATION_FIELD,
+    TEMPLATE_RECURRENCE_MAX_OCCURRENCES,
     TITLE_FIELD,
     DatabaseType,
     PersonalStatus,
     create_period,
+    gather_bounded,
 )
 
 logger = structlog.get_logger(__name__)
@@ -101,6 +103,7 @@ class PersonalNotion(CustomNotion):
         data: Optional[Dict[str, Any]] = None,
         descricao: Optional[str] = None,
         icon: Optional[str] = None,
+        idempotent: bool = False,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """
@@ -113,6 +116,7 @@ class PersonalNotion(CustomNotion):
             data: Date period (mapped to Notion property "Data")
             descricao: Description
             icon: Emoji icon (default: 👤)
+            idempotent: Return an existing matching card instead of creating a duplicate
             **kwargs: Additional properties
 
         Returns:
@@ -169,11 +173,7 @@ class PersonalNotion(CustomNotion):
             atividade=atividade,
         )
 
-        return await self.service.create_page(
-            database_id=self.database_id,
-            properties=properties,
-            icon=icon_dict,
-        )
+        return await self._create_page(properties, icon_dict, idempotent=idempotent)
 
     async def create_subitem(
         self,
@@ -183,6 +183,7 @@ class PersonalNotion(CustomNotion):
         data: Optional[Dict[str, Any]] = None,
         descricao: Optional[str] = None,
         icon: Optional[str] = None,
+        idempotent: bool = False,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """
@@ -195,6 +196,7 @@ class PersonalNotion(CustomNotion):
             data: Date period
             descricao: Description
             icon: Emoji icon (default: ✅)
+            idempotent: Return an existing matching card instead of creating a duplicate
             **kwargs: Additional properties
 
         Returns:
@@ -237,11 +239,7 @@ class PersonalNotion(CustomNotion):
             title=title,
         )
 
-        return await self.service.create_page(
-            database_id=self.database_id,
-            properties=properties,
-            icon=icon_dict,
-        )
+        return await self._create_page(properties, icon_dict, idempotent=idempotent)
 
     async def use_template(
         self,
@@ -272,6 +270,150 @@ class PersonalNotion(CustomNotion):
             icon=payload.get("icon", self.get_default_icon()),
         )
 
+    async def use_template_recurring(
+        self,
+        template_name: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: int = 1,
+        overrides: Optional[Dict[str, Any]] = None,
+        check_conflicts: str = "off",
+    ) -> Dict[str, Any]:
+        """
+        Expand a template over a date range and create the missing occurrences
+
+        Every occurrence is computed up front (every ``interval`` weeks for
+        weekday templates, every ``interval`` months for monthly ones). One
+        paginated query loads the cards already created from the template in
+        the range; occurrences with the same title and date are skipped and
+        the rest are created as one concurrent batch. An occurrence that
+        fails to be created does not abort the others.
+
+        Args:
+            template_name: Key of ``TEMPLATES``
+            start_date: First day of the range (inclusive)
+            end_date: Last day of the range (inclusive)
+            interval: Weeks (weekday templates) or months (monthly templates)
+                between occurrences
+            overrides: Fields replacing the template values
+            check_conflicts: ``off``, ``report`` or ``reject`` overlaps of the
+                new occurrences with scheduled cards of every database
+
+        Returns:
+            Dict with ``template``, ``occurrences`` (count), ``created``
+            pages (``None`` for failed occurrences), ``skipped`` (``start``
+            and ``id`` of existing cards), ``errors`` (``index`` in
+            ``created``, ``start``, ``error`` per failure) and, unless
+            ``check_conflicts`` is ``off``, ``conflicts`` (indexes in
+            ``created`` order)
+
+        Example:
+            >>> result = await personal.use_template_recurring(
+            ...     "weekly_planning", datetime(2025, 1, 1), datetime(2025, 12, 31)
+            ... )
+        """
+        template = self.TEMPLATES.get(template_name)
+        if template is None:
+            raise ValueError(f"Unknown personal template: {template_name}")
+        if interval <= 0:
+            raise ValueError("interval must be greater than zero")
+        if end_date < start_date:
+            raise ValueError("end_date must not be before start_date")
+
+        payload: Dict[str, Any] = {**template}
+        if overrides:
+            payload.update(overrides)
+
+        schedules = [
+            self._build_template_schedule(payload, reference)
+            for reference in self._recurrence_references(payload, start_date, end_date, interval)
+        ]
+
+        title = payload["title"]
+        if schedules:
+            # Loads (and indexes in the card store) the occurrences created before
+            await self.query_all_cards(
+                filter_conditions={
+                    "and": [
+                        {"property": self.title_field, "title": {"equals": title}},
+                        {
+                            "property": self.date_field,
+                            "date": {"on_or_after": schedules[0]["start"]},
+                        },
+                        {
+                            "property": self.date_field,
+                            "date": {"on_or_before": schedules[-1]["start"]},
+                        },
+                    ]
+                }
+            )
+
+        store = self.service.store
+        pending: List[Dict[str, Any]] = []
+        skipped: List[Dict[str, Any]] = []
+        for schedule in schedules:
+            key = store.dedup_key(
+                self.database_id,
+                {
+                    self.title_field: self.service.build_title_property(title),
+                    self.date_field: self.service.build_date_property(
+                        schedule["start"], schedule.get("end")
+                    ),
+                },
+            )
+            existing = store.find(key)
+            if existing is not None:
+                skipped.append({"start": schedule["start"], "id": existing["id"]})
+            else:
+                pending.append(schedule)
+
+        conflicts = self._check_schedule(pending, check_conflicts)
+
+        results = await gather_bounded(
+            (
+                self.create_card(
+                    title=title,
+                    atividade=payload.get("atividade"),
+                    status=payload.get("status", PersonalStatus.NAO_INICIADO.value),
+                    data=schedule,
+                    descricao=payload.get("descricao"),
+                    icon=payload.get("icon", self.get_default_icon()),
+                    idempotent=True,
+                )
+                for schedule in pending
+            ),
+            return_exceptions=True,
+        )
+
+        created: List[Optional[Dict[str, Any]]] = []
+        errors: List[Dict[str, Any]] = []
+        for index, (schedule, outcome) in enumerate(zip(pending, results, strict=True)):
+            if isinstance(outcome, BaseException):
+                errors.append({"index": index, "start": schedule["start"], "error": str(outcome)})
+                created.append(None)
+            else:
+                created.append(outcome)
+
+        logger.info(
+            "personal_template_expanded",
+            template=template_name,
+            occurrences=len(schedules),
+            created=len(created) - len(errors),
+            skipped=len(skipped),
+            error_count=len(errors),
+        )
+
+        result: Dict[str, Any] = {
+            "template": template_name,
+            "occurrences": len(schedules),
+            "created": created,
+            "skipped": skipped,
+            "errors": errors,
+        }
+        if conflicts is not None:
+            result["conflicts"] = conflicts
+        return result
+
     async def create_medical_appointment(
         self,
         doctor: str,
@@ -356,6 +498,45 @@ class PersonalNotion(CustomNotion):
 
         raise ValueError("Template is missing scheduling details (weekday or monthly_day)")
 
+    def _recurrence_references(
+        self,
+        template: Dict[str, Any],
+        start_date: datetime,
+        end_date: datetime,
+        interval: int,
+    ) -> List[datetime]:
+        """Reference dates of every occurrence of ``template`` within the range"""
+        first_day = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        last_day = end_date.date()
+        references: List[datetime] = []
+
+        if "weekday" in template:
+            current = self._resolve_weekday_date(first_day, int(template["weekday"]))
+            while current.date() <= last_day:
+                references.append(current)
+                current += timedelta(weeks=interval)
+        elif "monthly_day" in template:
+            year, month = first_day.year, first_day.month
+            while True:
+                occurrence = self._resolve_monthly_date(
+                    datetime(year, month, 1), int(template["monthly_day"])
+                )
+                if occurrence.date() > last_day:
+                    break
+                if occurrence >= first_day:
+                    references.append(occurrence)
+                year, month = divmod(year * 12 + month - 1 + interval, 12)
+                month += 1
+        else:
+            raise ValueError("Template is missing scheduling details (weekday or monthly_day)")
+
+        if len(references) > TEMPLATE_RECURRENCE_MAX_OCCURRENCES:
+            raise ValueError(
+                f"Recurrence expands to {len(references)} occurrences; the limit is "
+                f"{TEMPLATE_RECURRENCE_MAX_OCCURRENCES}. Shorten the range or raise the interval."
+            )
+        return references
+
     @staticmethod
     def _resolve_weekday_date(reference: datetime, weekday: int) -> datetime:
         base = reference.replace(hour=0, minute=0, second=0, microsecond=0)
@@ -10,32 +10,43 @@ Handles courses, phases, sections, and classes with specific business rules:
 """
 
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import structlog
 
 from .base import CustomNotion
+from services.card_store import property_text
 from services.notion_service import NotionService
+from services.rollups import build_tree, compute_rollups
 from utils import (
     DATE_FIELD,
     DESCRIPTION_FIELD,
     RELATION_FIELD,
     TITLE_FIELD,
+    CheckpointManifest,
     DatabaseType,
     Priority,
     StudiesStatus,
+    StudySlotCalendar,
     create_period,
+    duration_to_seconds,
     enforce_study_hours_limit,
     format_date_gmt3,
     format_duration,
-    get_next_business_day,
+    format_seconds,
+    gather_bounded,
     get_study_hours,
     parse_duration,
 )
+from utils.progress import report_stage
+from utils.timing import PhaseTimer
 from utils.validators import validate_status
 
 logger = structlog.get_logger(__name__)
 
+# (create_section kwargs, [create_class kwargs, ...])
+SectionPlan = Tuple[Dict[str, Any], List[Dict[str, Any]]]
+
 
 class StudyNotion(CustomNotion):
     """
@@ -67,6 +78,7 @@ class StudyNotion(CustomNotion):
         tempo_total: Optional[str] = None,
         descricao: Optional[str] = None,
         icon: Optional[str] = None,
+        idempotent: bool = False,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """
@@ -81,6 +93,7 @@ class StudyNotion(CustomNotion):
             tempo_total: Total duration (e.g., "40:00:00" for 40 hours)
             descricao: Description
             icon: Emoji icon (default: 🎓)
+            idempotent: Return an existing matching card instead of creating a duplicate
             **kwargs: Additional properties
 
         Returns:
@@ -145,11 +158,7 @@ class StudyNotion(CustomNotion):
             has_time=periodo and "T" in periodo.get("start", "") if periodo else False,
         )
 
-        return await self.service.create_page(
-            database_id=self.database_id,
-            properties=properties,
-            icon=icon_dict,
-        )
+        return await self._create_page(properties, icon_dict, idempotent=idempotent)
 
     async def create_course_complete(
         self,
@@ -159,93 +168,215 @@ class StudyNotion(CustomNotion):
         periodo: Optional[Dict[str, Any]] = None,
         icon: Optional[str] = None,
         descricao: Optional[str] = None,
+        resume: bool = True,
+        check_conflicts: str = "off",
     ) -> Dict[str, Any]:
-        """Create a full course with phases, sections, and classes."""
+        """
+        Create a full course with phases, sections, and classes.
 
-        course = await self.create_card(
-            title=title,
-            categorias=categorias,
-            periodo=periodo,
-            descricao=descricao,
-            icon=icon,
+        The whole payload is validated before the first request. Cards are
+        then created level by level (course, all phases, all sections, all
+        classes), each level concurrently under the service rate limiter.
+        Per-level timings are logged with ``study_course_created``.
+
+        Every created card is recorded in a checkpoint manifest keyed by
+        database and course title (node paths like ``"0.1.3"`` for phase 0,
+        section 1, class 3), saved after each level. Rerunning a failed
+        import skips recorded nodes and returns ``{"object": "page", "id": ...}``
+        stubs for them; a completed import deletes the manifest.
+
+        Args:
+            resume: Reuse nodes recorded by a previous run (False starts over)
+            check_conflicts: ``off``, ``report`` or ``reject`` overlaps of the
+                classes with scheduled cards of every database
+
+        Returns:
+            Dict with ``course``, ``phases`` (same order as ``fases``),
+            ``checkpoint`` (manifest path, created and skipped counts) and,
+            unless ``check_conflicts`` is ``off``, ``conflicts`` (indexes in
+            class order)
+        """
+        phase_plans = [self._plan_phase(phase_data) for phase_data in fases or []]
+        manifest = CheckpointManifest.for_import(self.database_id, title, resume=resume)
+        conflicts = self._check_schedule(
+            [
+                create_period(
+                    plan["start_time"],
+                    plan["start_time"] + timedelta(minutes=plan["duration_minutes"]),
+                )
+                for _, sections in phase_plans
+                for _, classes in sections
+                for plan in classes
+            ],
+            check_conflicts,
+            exclude=manifest.page_ids(),
         )
+        timer = PhaseTimer()
+
+        with timer.phase("course"), manifest.saving():
+            report_stage("course")
+            course = await self._create_checkpointed(
+                manifest,
+                "course",
+                self.create_card,
+                title=title,
+                categorias=categorias,
+                periodo=periodo,
+                descricao=descricao,
+                icon=icon,
+            )
 
-        created_phases: List[Dict[str, Any]] = []
-
-        for phase_data in fases or []:
-            phase_title = phase_data.get("title")
-            if not phase_title:
-                raise ValueError("Each course phase must define a 'title'.")
-
-            phase = await self.create_phase(
-                parent_id=course["id"],
-                title=phase_title,
-                periodo=phase_data.get("periodo"),
-                tempo_total=phase_data.get("tempo_total"),
-                icon=phase_data.get("icon", "📖"),
-                categorias=phase_data.get("categorias"),
-                prioridade=phase_data.get("prioridade", Priority.NORMAL.value),
-                descricao=phase_data.get("descricao"),
+        with timer.phase("phases"), manifest.saving():
+            report_stage("phases")
+            phases = await gather_bounded(
+                self._create_checkpointed(
+                    manifest,
+                    str(phase_index),
+                    self.create_phase,
+                    parent_id=course["id"],
+                    **phase_kwargs,
+                )
+                for phase_index, (phase_kwargs, _) in enumerate(phase_plans)
             )
 
-            sections_payload: List[Dict[str, Any]] = []
-            for section_data in phase_data.get("sections", []):
-                section_title = section_data.get("title")
-                if not section_title:
-                    raise ValueError("Each section must define a 'title'.")
-
-                section = await self.create_section(
-                    parent_id=phase["id"],
-                    title=section_title,
-                    periodo=section_data.get("periodo"),
-                    tempo_total=section_data.get("tempo_total"),
-                    icon=section_data.get("icon", "📑"),
-                    categorias=section_data.get("categorias"),
-                    prioridade=section_data.get("prioridade", Priority.NORMAL.value),
-                    descricao=section_data.get("descricao"),
+        section_plans = [
+            (phase_index, f"{phase_index}.{section_index}", section_kwargs, class_plans)
+            for phase_index, (_, sections) in enumerate(phase_plans)
+            for section_index, (section_kwargs, class_plans) in enumerate(sections)
+        ]
+        with timer.phase("sections"), manifest.saving():
+            report_stage("sections")
+            sections = await gather_bounded(
+                self._create_checkpointed(
+                    manifest,
+                    node,
+                    self.create_section,
+                    parent_id=phases[phase_index]["id"],
+                    **section_kwargs,
                 )
+                for phase_index, node, section_kwargs, _ in section_plans
+            )
 
-                classes_payload: List[Dict[str, Any]] = []
-                for class_data in section_data.get("classes", []):
-                    class_title = class_data.get("title")
-                    if not class_title:
-                        raise ValueError("Each class must provide a 'title'.")
+        class_plans = [
+            (section_index, f"{section_node}.{class_index}", class_kwargs)
+            for section_index, (_, section_node, _, classes) in enumerate(section_plans)
+            for class_index, class_kwargs in enumerate(classes)
+        ]
+        with timer.phase("classes"), manifest.saving():
+            report_stage("classes")
+            classes = await gather_bounded(
+                self._create_checkpointed(
+                    manifest,
+                    node,
+                    self.create_class,
+                    parent_id=sections[section_index]["id"],
+                    **class_kwargs,
+                )
+                for section_index, node, class_kwargs in class_plans
+            )
 
-                    start_value = class_data.get("start" ) or class_data.get("start_time")
-                    if start_value is None:
-                        raise ValueError(
-                            f"Class '{class_title}' must define 'start' as datetime or ISO string."
-                        )
+        manifest.complete()
 
-                    start_dt = self._parse_start_datetime(start_value)
+        # Reassemble the nested result in input order
+        created_phases: List[Dict[str, Any]] = [
+            {"phase": phase, "sections": []} for phase in phases
+        ]
+        sections_payload: List[Dict[str, Any]] = []
+        for (phase_index, _, _, _), section in zip(section_plans, sections, strict=True):
+            entry = {"section": section, "classes": []}
+            created_phases[phase_index]["sections"].append(entry)
+            sections_payload.append(entry)
+        for (section_index, _, _), class_card in zip(class_plans, classes, strict=True):
+            sections_payload[section_index]["classes"].append(class_card)
 
-                    duration_minutes = int(class_data.get("duration_minutes", 120))
+        logger.info(
+            "study_course_created",
+            title=title,
+            phase_count=len(phases),
+            section_count=len(sections),
+            class_count=len(classes),
+            checkpoint=manifest.summary(),
+            timings_ms=timer.as_dict(),
+        )
 
-                    class_card = await self.create_class(
-                        parent_id=section["id"],
-                        title=class_title,
-                        start_time=start_dt,
-                        duration_minutes=duration_minutes,
-                        icon=class_data.get("icon", "🎯"),
-                        status=class_data.get("status", StudiesStatus.PARA_FAZER.value),
-                        categorias=class_data.get("categorias"),
-                        prioridade=class_data.get("prioridade", Priority.NORMAL.value),
-                        descricao=class_data.get("descricao"),
-                    )
+        result = {"course": course, "phases": created_phases, "checkpoint": manifest.summary()}
+        if conflicts is not None:
+            result["conflicts"] = conflicts
+        return result
 
-                    classes_payload.append(class_card)
+    @staticmethod
+    async def _create_checkpointed(
+        manifest: CheckpointManifest,
+        node: str,
+        create: Callable[..., Awaitable[Dict[str, Any]]],
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Create a card unless the manifest already holds it, then record it"""
+        page_id = manifest.get(node, kwargs["title"])
+        if page_id is not None:
+            return {"object": "page", "id": page_id}
+
+        page = await create(**kwargs)
+        manifest.record(node, kwargs["title"], page["id"])
+        return page
+
+    def _plan_phase(self, phase_data: Dict[str, Any]) -> Tuple[Dict[str, Any], List[SectionPlan]]:
+        """Validate a phase payload and build create_* kwargs for it and its children"""
+        phase_title = phase_data.get("title")
+        if not phase_title:
+            raise ValueError("Each course phase must define a 'title'.")
+
+        sections: List[SectionPlan] = []
+        for section_data in phase_data.get("sections", []):
+            section_title = section_data.get("title")
+            if not section_title:
+                raise ValueError("Each section must define a 'title'.")
+
+            classes = [
+                self._plan_class(class_data) for class_data in section_data.get("classes", [])
+            ]
+            sections.append((self._subitem_kwargs(section_data, section_title, "📑"), classes))
+
+        return self._subitem_kwargs(phase_data, phase_title, "📖"), sections
 
-                sections_payload.append({"section": section, "classes": classes_payload})
+    @staticmethod
+    def _subitem_kwargs(data: Dict[str, Any], title: str, default_icon: str) -> Dict[str, Any]:
+        return {
+            "title": title,
+            "periodo": data.get("periodo"),
+            "tempo_total": data.get("tempo_total"),
+            "icon": data.get("icon", default_icon),
+            "categorias": data.get("categorias"),
+            "prioridade": data.get("prioridade", Priority.NORMAL.value),
+            "descricao": data.get("descricao"),
+        }
 
-            created_phases.append({"phase": phase, "sections": sections_payload})
+    def _plan_class(self, class_data: Dict[str, Any]) -> Dict[str, Any]:
+        class_title = class_data.get("title")
+        if not class_title:
+            raise ValueError("Each class must provide a 'title'.")
 
-        logger.info(
-            "study_course_created",
-            title=title,
-            phase_count=len(created_phases),
-        )
+        start_value = class_data.get("start") or class_data.get("start_time")
+        if start_value is None:
+            raise ValueError(
+                f"Class '{class_title}' must define 'start' as datetime or ISO string."
+            )
 
-        return {"course": course, "phases": created_phases}
+        start_dt = self._parse_start_datetime(start_value)
+        duration_minutes = int(class_data.get("duration_minutes", 120))
+        # Fail before any card exists rather than halfway through the tree
+        enforce_study_hours_limit(start_dt, duration_minutes)
+
+        return {
+            "title": class_title,
+            "start_time": start_dt,
+            "duration_minutes": duration_minutes,
+            "icon": class_data.get("icon", "🎯"),
+            "status": class_data.get("status", StudiesStatus.PARA_FAZER.value),
+            "categorias": class_data.get("categorias"),
+            "prioridade": class_data.get("prioridade", Priority.NORMAL.value),
+            "descricao": class_data.get("descricao"),
+        }
 
     async def create_phase(
         self,
@@ -384,6 +515,7 @@ class StudyNotion(CustomNotion):
         descricao: Optional[str] = None,
         icon: Optional[str] = None,
         allow_time: bool = False,
+        idempotent: bool = False,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """
@@ -399,6 +531,7 @@ class StudyNotion(CustomNotion):
             tempo_total: Total duration
             descricao: Description
             icon: Emoji icon (default: 📑)
+            idempotent: Return an existing matching card instead of creating a duplicate
             **kwargs: Additional properties
 
         Returns:
@@ -454,28 +587,36 @@ class StudyNotion(CustomNotion):
             title=title,
         )
 
-        return await self.service.create_page(
-            database_id=self.database_id,
-            properties=properties,
-            icon=icon_dict,
-        )
+        return await self._create_page(properties, icon_dict, idempotent=idempotent)
 
     async def reschedule_classes(
         self,
         parent_id: str,
         new_start_date: datetime,
         respect_weekends: bool = True,
-    ) -> List[Dict[str, Any]]:
+        dry_run: bool = False,
+        check_conflicts: str = "off",
+    ) -> Dict[str, Any]:
         """
         Reschedule all classes of a section/course
 
+        Every child is fetched (all result pages) and the new schedule is
+        computed locally on a ``StudySlotCalendar``; only classes whose
+        period actually changes are updated, concurrently.
+
         Args:
             parent_id: Section/Course ID
             new_start_date: New start date
-            respect_weekends: Skip Saturday/Sunday
+            respect_weekends: Skip Saturday/Sunday (also for the first class)
+            dry_run: Only compute and return the planned changes
+            check_conflicts: ``off``, ``report`` or ``reject`` overlaps of the
+                new schedule with scheduled cards of every database
 
         Returns:
-            List of updated class pages
+            Dict with counters, planned ``changes`` (id, title, from, to),
+            the ``updated`` class pages (empty on dry run) and, unless
+            ``check_conflicts`` is ``off``, ``conflicts`` (indexes in
+            ``changes`` order)
         """
         # Query all classes (subitems)
         filter_conditions = {
@@ -483,66 +624,230 @@ class StudyNotion(CustomNotion):
             "relation": {"contains": parent_id},
         }
 
-        classes = await self.query_cards(filter_conditions=filter_conditions)
+        report_stage("loading classes")
+        classes = await self.query_all_cards(filter_conditions=filter_conditions)
 
         # Sort by original start date
-        classes.sort(
-            key=lambda c: c.get("properties", {})
-            .get("Período", {})
-            .get("date", {})
-            .get("start", "")
-        )
-
-        updated = []
-        current_date = new_start_date
+        classes.sort(key=lambda c: (self._card_period(c).get("start") or ""))
 
+        durations = []
         for class_card in classes:
-            # Get duration
             props = class_card.get("properties", {})
-            tempo_total = (
-                props.get("Tempo Total", {})
-                .get("rich_text", [{}])[0]
-                .get("text", {})
-                .get("content", "01:00:00")
+            rich_text = props.get("Tempo Total", {}).get("rich_text") or [{}]
+            tempo_total = rich_text[0].get("text", {}).get("content", "01:00:00")
+            durations.append(int(parse_duration(tempo_total)))
+
+        # One study slot per class, consecutive days (business days with respect_weekends)
+        calendar = StudySlotCalendar(new_start_date, skip_weekends=respect_weekends)
+        periods = calendar.assign(durations)
+
+        changes: List[Dict[str, Any]] = []
+        for class_card, (class_start, class_end) in zip(classes, periods, strict=True):
+            new_periodo = create_period(class_start, class_end, include_time=True)
+            current_periodo = self._card_period(class_card)
+
+            if not self._same_period(current_periodo, new_periodo):
+                changes.append(
+                    {
+                        "id": class_card["id"],
+                        "title": self._card_title(class_card),
+                        "from": {
+                            "start": current_periodo.get("start"),
+                            "end": current_periodo.get("end"),
+                        },
+                        "to": new_periodo,
+                    }
+                )
+
+        conflicts = self._check_schedule(
+            [change["to"] for change in changes],
+            check_conflicts,
+            exclude=[class_card["id"] for class_card in classes],
+        )
+
+        updated: List[Dict[str, Any]] = []
+        if not dry_run and changes:
+            report_stage("updating classes")
+            updated = await gather_bounded(
+                self.service.update_page(
+                    page_id=change["id"],
+                    properties={
+                        self.date_field: self.service.build_date_property(
+                            change["to"]["start"], change["to"].get("end")
+                        )
+                    },
+                )
+                for change in changes
             )
-            duration = parse_duration(tempo_total)
 
-            # Calculate new period
+        logger.info(
+            "rescheduled_classes",
+            parent_id=parent_id,
+            total=len(classes),
+            changed=len(changes),
+            dry_run=dry_run,
+            new_start=format_date_gmt3(new_start_date),
+        )
 
-            weekday = current_date.weekday()
-            start_hour, _ = get_study_hours(weekday, date=current_date)
+        result = {
+            "parent_id": parent_id,
+            "dry_run": dry_run,
+            "total": len(classes),
+            "changed": len(changes),
+            "unchanged": len(classes) - len(changes),
+            "changes": changes,
+            "updated": updated,
+        }
+        if conflicts is not None:
+            result["conflicts"] = conflicts
+        return result
 
-            # Set start time
-            class_start = current_date.replace(
-                hour=int(start_hour), minute=int((start_hour % 1) * 60), second=0
-            )
+    async def recompute_rollups(
+        self,
+        root_id: str,
+        refresh: bool = True,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Recompute ``Tempo Total`` of a course/phase/section from its classes
 
-            normalized_start, class_end = enforce_study_hours_limit(class_start, int(duration))
+        The hierarchy is read from the service card store (``refresh`` first
+        reloads the whole database with one paginated query instead of one
+        read per page). Leaves keep their own duration; every parent becomes
+        the sum of its children, in integer seconds. Only parents whose
+        stored total differs are updated, as one concurrent batch.
 
-            new_periodo = create_period(normalized_start, class_end, include_time=True)
+        Args:
+            root_id: Course, phase or section ID
+            refresh: Reload the database into the card store before computing
+            dry_run: Only compute and return the planned changes
 
-            updated_page = await self.service.update_page(
-                page_id=class_card["id"],
-                properties={
-                    "Período": self.service.build_date_property(
-                        new_periodo["start"], new_periodo.get("end")
-                    )
-                },
-            )
+        Returns:
+            Dict with ``total``/``remaining`` of the root (``HH:MM:SS`` and
+            seconds; remaining excludes concluded or discontinued leaves),
+            ``nodes``, ``changes`` (id, title, from, to), ``rollups`` per
+            parent and the ``updated`` pages (empty on dry run)
+        """
+        if refresh:
+            await self.sync_store()
+        if self.service.store.get(root_id) is None:
+            await self.get_card(root_id)
+
+        tree = build_tree(
+            root_id,
+            self.service.store.pages(self.database_id),
+            self.relation_field,
+            seconds_of=self._tempo_total_seconds,
+            is_open=self._counts_as_remaining,
+        )
+        totals, remaining = compute_rollups(tree)
 
-            updated.append(updated_page)
+        changes: List[Dict[str, Any]] = []
+        rollups: Dict[str, Dict[str, int]] = {}
+        for index, is_parent in enumerate(tree.has_children()):
+            if not is_parent:
+                continue
+            page_id = tree.ids[index]
+            rollups[page_id] = {
+                "total_seconds": totals[index],
+                "remaining_seconds": remaining[index],
+            }
+            if totals[index] != tree.own_seconds[index]:
+                page = self.service.store.get(page_id) or {}
+                changes.append(
+                    {
+                        "id": page_id,
+                        "title": self._card_title(page),
+                        "from": self._tempo_total_text(page) or None,
+                        "to": format_seconds(totals[index]),
+                    }
+                )
 
-            # Next class on next business day
-            current_date = get_next_business_day(normalized_start)
+        updated: List[Dict[str, Any]] = []
+        if not dry_run and changes:
+            report_stage("updating totals")
+            updated = await gather_bounded(
+                self.service.update_page(
+                    page_id=change["id"],
+                    properties={
+                        "Tempo Total": self.service.build_rich_text_property(change["to"])
+                    },
+                )
+                for change in changes
+            )
 
         logger.info(
-            "rescheduled_classes",
-            parent_id=parent_id,
-            count=len(updated),
-            new_start=format_date_gmt3(new_start_date),
+            "study_rollups_recomputed",
+            root_id=root_id,
+            nodes=len(tree.ids),
+            changed=len(changes),
+            dry_run=dry_run,
+        )
+
+        return {
+            "root_id": root_id,
+            "dry_run": dry_run,
+            "total": format_seconds(totals[0]),
+            "total_seconds": totals[0],
+            "remaining": format_seconds(remaining[0]),
+            "remaining_seconds": remaining[0],
+            "nodes": len(tree.ids),
+            "changes": changes,
+            "rollups": rollups,
+            "updated": updated,
+        }
+
+    @staticmethod
+    def _tempo_total_text(card: Dict[str, Any]) -> str:
+        return property_text(card.get("properties", {}).get("Tempo Total")).strip()
+
+    def _tempo_total_seconds(self, card: Dict[str, Any]) -> int:
+        text = self._tempo_total_text(card)
+        if not text:
+            return 0
+        try:
+            return duration_to_seconds(text)
+        except ValueError:
+            logger.warning("invalid_tempo_total", page_id=card.get("id"), value=text)
+            return 0
+
+    @staticmethod
+    def _counts_as_remaining(card: Dict[str, Any]) -> bool:
+        status = (card.get("properties", {}).get("Status") or {}).get("status") or {}
+        return status.get("name") not in (
+            StudiesStatus.CONCLUIDO.value,
+            StudiesStatus.DESCONTINUADO.value,
         )
 
-        return updated
+    def _card_period(self, card: Dict[str, Any]) -> Dict[str, Any]:
+        date_property = card.get("properties", {}).get(self.date_field) or {}
+        return date_property.get("date") or {}
+
+    def _card_title(self, card: Dict[str, Any]) -> str:
+        title_items = card.get("properties", {}).get(self.title_field, {}).get("title") or []
+        return "".join(
+            item.get("plain_text") or item.get("text", {}).get("content", "") for item in title_items
+        )
+
+    @staticmethod
+    def _same_period(current: Dict[str, Any], planned: Dict[str, Any]) -> bool:
+        """Compare periods by instant (Notion echoes dates with milliseconds or another offset)"""
+        for key in ("start", "end"):
+            current_value, planned_value = current.get(key), planned.get(key)
+            if current_value is None or planned_value is None:
+                if current_value != planned_value:
+                    return False
+                continue
+            try:
+                current_instant = datetime.fromisoformat(current_value.replace("Z", "+00:00"))
+                planned_instant = datetime.fromisoformat(planned_value.replace("Z", "+00:00"))
+            except (TypeError, ValueError):
+                return False
+            if (current_instant.tzinfo is None) != (planned_instant.tzinfo is None):
+                return False
+            if current_instant != planned_instant:
+                return False
+        return True
 
     async def query_schedule(
         self,
@@ -23,6 +23,8 @@ from utils import (
     WorkStatus,
     WORK_CLIENTS,
     WORK_PROJECTS,
+    ValidationError,
+    gather_bounded,
 )
 from utils.validators import validate_status
 
@@ -59,6 +61,7 @@ class WorkNotion(CustomNotion):
         tempo_total: Optional[str] = None,
         descricao: Optional[str] = None,
         icon: Optional[str] = None,
+        idempotent: bool = False,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """
@@ -74,6 +77,7 @@ class WorkNotion(CustomNotion):
             tempo_total: Total time estimate
             descricao: Description
             icon: Emoji icon (default: 🚀)
+            idempotent: Return an existing matching card instead of creating a duplicate
             **kwargs: Additional properties
 
         Returns:
@@ -139,11 +143,7 @@ class WorkNotion(CustomNotion):
             projeto=projeto,
         )
 
-        return await self.service.create_page(
-            database_id=self.database_id,
-            properties=properties,
-            icon=icon_dict,
-        )
+        return await self._create_page(properties, icon_dict, idempotent=idempotent)
 
     async def create_task(
         self,
@@ -180,6 +180,7 @@ class WorkNotion(CustomNotion):
         tempo_total: Optional[str] = None,
         descricao: Optional[str] = None,
         icon: Optional[str] = None,
+        idempotent: bool = False,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """
@@ -194,6 +195,7 @@ class WorkNotion(CustomNotion):
             tempo_total: Total time estimate
             descricao: Description
             icon: Emoji icon (default: 📋)
+            idempotent: Return an existing matching card instead of creating a duplicate
             **kwargs: Additional properties
 
         Returns:
@@ -250,11 +252,7 @@ class WorkNotion(CustomNotion):
             title=title,
         )
 
-        return await self.service.create_page(
-            database_id=self.database_id,
-            properties=properties,
-            icon=icon_dict,
-        )
+        return await self._create_page(properties, icon_dict, idempotent=idempotent)
 
     async def create_sprint(
         self,
@@ -267,7 +265,26 @@ class WorkNotion(CustomNotion):
         icon: Optional[str] = None,
         tasks: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
-        """Create a sprint card and optional task subitems."""
+        """
+        Create a sprint card and optional task subitems.
+
+        Every task is validated before the sprint is created; invalid
+        payloads raise without touching Notion. Tasks are then created
+        concurrently under the service rate limiter. A task that fails to
+        be created does not abort the others.
+
+        Returns:
+            Dict with ``sprint``, ``tasks`` (input order, ``None`` for failed
+            tasks) and ``errors`` (``index``, ``title``, ``error`` per failure)
+        """
+        task_payloads = [self._prepare_sprint_task(task) for task in tasks or []]
+        invalid = [
+            f"#{index} ({payload.get('title') or 'untitled'}): {payload['error']}"
+            for index, payload in enumerate(task_payloads)
+            if "error" in payload
+        ]
+        if invalid:
+            raise ValueError("Invalid sprint tasks: " + "; ".join(invalid))
 
         sprint = await self.create_card(
             title=title,
@@ -279,40 +296,56 @@ class WorkNotion(CustomNotion):
             icon=icon,
         )
 
-        created_tasks: List[Dict[str, Any]] = []
-        if tasks:
-            parent_id = sprint["id"]
-            for task in tasks:
-                task_title = task.get("title")
-                if not task_title:
-                    raise ValueError("Each task registered in a sprint must include a 'title'")
-
-                task_status = task.get("status", WorkStatus.NAO_INICIADO.value)
-                task_priority = task.get("prioridade", Priority.NORMAL.value)
-                task_periodo = task.get("periodo")
-                task_tempo_total = task.get("tempo_total")
-                task_descricao = task.get("descricao")
-                task_icon = task.get("icon")
-
-                created_task = await self.create_subitem(
-                    parent_id=parent_id,
-                    title=task_title,
-                    status=task_status,
-                    prioridade=task_priority,
-                    periodo=task_periodo,
-                    tempo_total=task_tempo_total,
-                    descricao=task_descricao,
-                    icon=task_icon,
-                )
-                created_tasks.append(created_task)
+        results = await gather_bounded(
+            (self.create_subitem(parent_id=sprint["id"], **payload) for payload in task_payloads),
+            return_exceptions=True,
+        )
+
+        created_tasks: List[Optional[Dict[str, Any]]] = []
+        errors: List[Dict[str, Any]] = []
+        for index, (payload, result) in enumerate(zip(task_payloads, results, strict=True)):
+            if isinstance(result, BaseException):
+                errors.append({"index": index, "title": payload["title"], "error": str(result)})
+                created_tasks.append(None)
+            else:
+                created_tasks.append(result)
 
         logger.info(
             "work_sprint_created",
             title=title,
-            task_count=len(created_tasks),
+            task_count=len(created_tasks) - len(errors),
+            error_count=len(errors),
         )
 
-        return {"sprint": sprint, "tasks": created_tasks}
+        return {"sprint": sprint, "tasks": created_tasks, "errors": errors}
+
+    def _prepare_sprint_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """Build create_subitem kwargs for a sprint task, or ``{"error": ...}``"""
+        task_title = task.get("title")
+        if not task_title:
+            return {"error": "Each task registered in a sprint must include a 'title'"}
+
+        payload = {
+            "title": task_title,
+            "status": task.get("status", WorkStatus.NAO_INICIADO.value),
+            "prioridade": task.get("prioridade", Priority.NORMAL.value),
+            "periodo": task.get("periodo"),
+            "tempo_total": task.get("tempo_total"),
+            "descricao": task.get("descricao"),
+            "icon": task.get("icon"),
+        }
+
+        data = {"title": task_title, "status": payload["status"]}
+        if payload["periodo"]:
+            data["periodo"] = payload["periodo"]
+        try:
+            # Field checks only: the sprint does not exist yet, so the relation
+            # is checked by create_subitem once its ID is known
+            self._validate_and_prepare(data)
+        except (ValidationError, ValueError) as exc:
+            return {"title": task_title, "error": str(exc)}
+
+        return payload
 
     async def update_status(
         self,
@@ -14,6 +14,7 @@ from typing import Any, Dict, List, Optional
 import structlog
 
 from .base import CustomNotion
+from services.card_store import property_text
 from services.notion_service import NotionService
 from utils import (
     DATE_FIELD,
@@ -24,6 +25,7 @@ from utils import (
     YoutuberStatus,
     create_period,
     format_date_gmt3,
+    gather_bounded,
 )
 from utils.validators import validate_status
 
@@ -62,8 +64,18 @@ class YoutuberNotion(CustomNotion):
         publication_hour: int = 12,
         icon: Optional[str] = None,
         episodes: Optional[list] = None,
+        check_conflicts: str = "off",
     ) -> Dict[str, Any]:
-        """Create a full series with automatically scheduled episodes."""
+        """
+        Create a full series with automatically scheduled episodes.
+
+        The schedule is built and validated in memory first; once the series
+        card exists, episodes are created as one concurrent batch under the
+        service rate limiter. ``episodes`` keeps episode-number order.
+        ``check_conflicts`` (``off``, ``report``, ``reject``) checks the
+        recording slots against scheduled cards of every database; unless
+        ``off``, the result carries ``conflicts`` (indexes in episode order).
+        """
 
         if total_episodes <= 0:
             raise ValueError("A series must contain at least one episode")
@@ -84,6 +96,26 @@ class YoutuberNotion(CustomNotion):
         )
         periodo = create_period(normalized_first, last_recording, include_time=True)
 
+        episode_requests = []
+        for episode_number, payload in enumerate(episodes_payload, start=1):
+            episode_requests.append(
+                {
+                    "episode_number": episode_number,
+                    "title": payload.get("title") or f"Episode {episode_number:02d}",
+                    "recording_date": payload["recording_date"],
+                    "publication_date": payload["publication_date"],
+                    "resumo_episodio": (
+                        payload.get("resumo_episodio") if episode_number > 1 else sinopse
+                    ),
+                    "status": payload.get("status") or YoutuberStatus.PARA_GRAVAR.value,
+                    "icon": payload.get("icon", "📺"),
+                }
+            )
+        self._validate_episode_requests(episode_requests)
+        conflicts = self._check_schedule(
+            self._recording_periods(episode_requests), check_conflicts
+        )
+
         series_card = await self.create_card(
             title=title,
             periodo=periodo,
@@ -91,22 +123,10 @@ class YoutuberNotion(CustomNotion):
             icon=icon,
         )
 
-        created_episodes = []
-        for episode_number, payload in enumerate(episodes_payload, start=1):
-            resumo = payload.get("resumo_episodio") if episode_number > 1 else sinopse
-            episode_title = payload.get("title") or f"Episode {episode_number:02d}"
-
-            created = await self.create_episode(
-                parent_id=series_card["id"],
-                episode_number=episode_number,
-                title=episode_title,
-                recording_date=payload["recording_date"],
-                publication_date=payload["publication_date"],
-                resumo_episodio=resumo,
-                status=payload.get("status") or YoutuberStatus.PARA_GRAVAR.value,
-                icon=payload.get("icon", "📺"),
-            )
-            created_episodes.append(created)
+        created_episodes = await gather_bounded(
+            self.create_episode(parent_id=series_card["id"], **request)
+            for request in episode_requests
+        )
 
         logger.info(
             "series_created",
@@ -114,7 +134,10 @@ class YoutuberNotion(CustomNotion):
             episodes=len(created_episodes),
         )
 
-        return {"series": series_card, "episodes": created_episodes}
+        result = {"series": series_card, "episodes": created_episodes}
+        if conflicts is not None:
+            result["conflicts"] = conflicts
+        return result
 
     async def create_card(
         self,
@@ -123,6 +146,7 @@ class YoutuberNotion(CustomNotion):
         periodo: Optional[Dict[str, Any]] = None,
         descricao: Optional[str] = None,
         icon: Optional[str] = None,
+        idempotent: bool = False,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """
@@ -134,6 +158,7 @@ class YoutuberNotion(CustomNotion):
             periodo: Recording period (first to last episode)
             descricao: Series description
             icon: Emoji icon (default: 🎬)
+            idempotent: Return an existing matching card instead of creating a duplicate
             **kwargs: Additional properties
 
         Returns:
@@ -182,11 +207,7 @@ class YoutuberNotion(CustomNotion):
 
         logger.info("creating_series", title=title)
 
-        return await self.service.create_page(
-            database_id=self.database_id,
-            properties=properties,
-            icon=icon_dict,
-        )
+        return await self._create_page(properties, icon_dict, idempotent=idempotent)
 
     async def create_episode(
         self,
@@ -198,6 +219,7 @@ class YoutuberNotion(CustomNotion):
         resumo_episodio: Optional[str] = None,
         status: str = YoutuberStatus.PARA_GRAVAR.value,
         icon: str = "📺",
+        idempotent: bool = False,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """
@@ -212,6 +234,7 @@ class YoutuberNotion(CustomNotion):
             resumo_episodio: Episode description (REQUIRED for episode 1 = series synopsis)
             status: Status (default: "Para Gravar")
             icon: Emoji icon (default: 📺)
+            idempotent: Return an existing matching card instead of creating a duplicate
             **kwargs: Additional properties
 
         Returns:
@@ -265,11 +288,7 @@ class YoutuberNotion(CustomNotion):
             publication=data_lancamento,
         )
 
-        return await self.service.create_page(
-            database_id=self.database_id,
-            properties=properties,
-            icon=icon_dict,
-        )
+        return await self._create_page(properties, icon_dict, idempotent=idempotent)
 
     async def update_episode_status(
         self,
@@ -321,14 +340,24 @@ class YoutuberNotion(CustomNotion):
         recording_interval_days: int = 1,
         publication_hour: int = 12,
         base_title: Optional[str] = None,
+        check_conflicts: str = "off",
+        sinopse: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Generate a block of episodes for an existing series."""
+        """
+        Generate a block of episodes for an existing series.
+
+        Every episode is validated before the first request; episodes are
+        then created as one concurrent batch and ``episodes`` keeps
+        episode-number order. Episode 1 gets ``sinopse``, or the series
+        card description when omitted. ``check_conflicts`` works as in
+        ``create_series``.
+        """
         if total_episodes <= 0:
             raise ValueError("total_episodes deve ser maior que zero")
 
         normalized_start = self._normalize_recording_start(start_recording)
         titles_base = base_title or "Episode"
-        created: List[Dict[str, Any]] = []
+        episode_requests: List[Dict[str, Any]] = []
 
         for index in range(total_episodes):
             episode_number = index + 1
@@ -337,17 +366,30 @@ class YoutuberNotion(CustomNotion):
             publication_date = (recording_start + timedelta(days=1)).replace(
                 hour=publication_hour, minute=0, second=0, microsecond=0
             )
-            title = f"{titles_base} {episode_number:02d}"
-            created_episode = await self.create_episode(
-                parent_id=series_id,
-                episode_number=episode_number,
-                title=title,
-                recording_date=recording_start,
-                publication_date=publication_date,
+            episode_requests.append(
+                {
+                    "episode_number": episode_number,
+                    "title": f"{titles_base} {episode_number:02d}",
+                    "recording_date": recording_start,
+                    "publication_date": publication_date,
+                }
             )
-            created.append(created_episode)
+        if sinopse is None:
+            sinopse = await self._series_synopsis(series_id)
+        episode_requests[0]["resumo_episodio"] = sinopse
+        self._validate_episode_requests(episode_requests)
+        conflicts = self._check_schedule(
+            self._recording_periods(episode_requests), check_conflicts
+        )
+
+        created = await gather_bounded(
+            self.create_episode(parent_id=series_id, **request) for request in episode_requests
+        )
 
-        return {"episodes": created, "count": len(created)}
+        result = {"episodes": created, "count": len(created)}
+        if conflicts is not None:
+            result["conflicts"] = conflicts
+        return result
 
     async def query_schedule(
         self,
@@ -466,6 +508,17 @@ class YoutuberNotion(CustomNotion):
 
         raise TypeError("Recording/publication dates must be datetime objects or ISO 8601 strings.")
 
+    @staticmethod
+    def _recording_periods(episode_requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Recording periods (start to 23:50) of validated episode requests"""
+        return [
+            create_period(
+                request["recording_date"],
+                request["recording_date"].replace(hour=23, minute=50, second=0, microsecond=0),
+            )
+            for request in episode_requests
+        ]
+
     def _normalize_recording_start(self, recording_start: datetime) -> datetime:
         expected_hour = int(self.RECORDING_START)
         expected_minute = int((self.RECORDING_START % 1) * 60)
@@ -486,6 +539,24 @@ class YoutuberNotion(CustomNotion):
             hour=publication_hour, minute=0, second=0, microsecond=0
         )
 
+    async def _series_synopsis(self, series_id: str) -> str:
+        """Synopsis stored in the description of a series card ("" when missing)"""
+        if not self.description_field:
+            return ""
+        series = await self.service.get_page(series_id)
+        return property_text((series.get("properties") or {}).get(self.description_field))
+
+    def _validate_episode_requests(self, episode_requests: List[Dict[str, Any]]) -> None:
+        """Apply create_episode's checks to a whole batch before any request"""
+        for request in episode_requests:
+            if request["episode_number"] == 1 and not request.get("resumo_episodio"):
+                raise ValueError("Episode 1 must include a synopsis (resumo_episodio)")
+            if request.get("status"):
+                validate_status(request["status"], self.database_type)
+            recording_start = self._normalize_recording_start(request["recording_date"])
+            recording_end = recording_start.replace(hour=23, minute=50, second=0, microsecond=0)
+            self._validate_publication_after_recording(recording_end, request["publication_date"])
+
     @staticmethod
     def _validate_publication_after_recording(recording_end: datetime, publication_date: datetime) -> None:
         if publication_date <= recording_end:
@@ -8,8 +8,19 @@ while the source tree lives directly under ``src/``.
 from __future__ import annotations
 
 import importlib
+import importlib.abc
+import importlib.util
 import sys
 from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:  # Resolved lazily at runtime through ``__getattr__``
+    from custom.personal_notion import PersonalNotion
+    from custom.study_notion import StudyNotion
+    from custom.work_notion import WorkNotion
+    from custom.youtuber_notion import YoutuberNotion
+    from services.notion_service import NotionService
 
 __version__ = "0.1.0"
 __author__ = "Lucas Biason"
@@ -20,12 +31,6 @@ __path__ = [str(Path(__file__).parent)]
 if __spec__ is not None:  # pragma: no coverage - defensive guard
     __spec__.submodule_search_locations = __path__
 
-from custom.personal_notion import PersonalNotion
-from custom.study_notion import StudyNotion
-from custom.work_notion import WorkNotion
-from custom.youtuber_notion import YoutuberNotion
-from services.notion_service import NotionService
-
 __all__ = [
     "NotionService",
     "WorkNotion",
@@ -35,6 +40,56 @@ __all__ = [
 ]
 
 _SUBMODULES = ("custom", "exceptions", "runtime", "services", "tools", "utils", "server")
-for _name in _SUBMODULES:
-    _module = importlib.import_module(_name)
-    sys.modules[f"{__name__}.{_name}"] = _module
+
+# Public names resolved on first attribute access (PEP 562)
+_LAZY_EXPORTS = {
+    "NotionService": "services.notion_service",
+    "WorkNotion": "custom.work_notion",
+    "StudyNotion": "custom.study_notion",
+    "YoutuberNotion": "custom.youtuber_notion",
+    "PersonalNotion": "custom.personal_notion",
+}
+
+
+class _SubmoduleAliasFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Alias ``notion_mcp.<name>`` to the top-level module ``<name>`` on demand.
+
+    Submodules are imported only when first requested instead of eagerly at
+    package import, and both names always share the same module object.
+    """
+
+    _prefix = f"{__name__}."
+
+    def __init__(self) -> None:
+        self._original_specs: Dict[str, Any] = {}
+
+    def find_spec(self, fullname: str, path: Any = None, target: Any = None) -> Any:
+        if not fullname.startswith(self._prefix):
+            return None
+        real_name = fullname[len(self._prefix):]
+        if real_name.split(".", 1)[0] not in _SUBMODULES:
+            return None
+        return importlib.util.spec_from_loader(fullname, self)
+
+    def create_module(self, spec: Any) -> ModuleType:
+        module = importlib.import_module(spec.name[len(self._prefix):])
+        self._original_specs[spec.name] = module.__spec__
+        return module
+
+    def exec_module(self, module: ModuleType) -> None:
+        # The import machinery overwrote ``__spec__`` with the alias spec
+        module.__spec__ = self._original_specs.pop(f"{self._prefix}{module.__name__}", module.__spec__)
+
+
+if not any(isinstance(finder, _SubmoduleAliasFinder) for finder in sys.meta_path):
+    sys.meta_path.insert(0, _SubmoduleAliasFinder())
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,13 @@
 """Runtime helpers for executing the MCP server."""
 
 from .app import create_fastmcp_app
-from .config import configure_logging, load_environment
+from .config import configure_logging, load_environment, load_transport_config
+from .transport import serve
 
 __all__ = [
     "configure_logging",
     "load_environment",
     "create_fastmcp_app",
+    "load_transport_config",
+    "serve",
 ]
@@ -2,27 +2,30 @@
 
 from __future__ import annotations
 
-import json
-import re
+import asyncio
 from contextlib import asynccontextmanager
 from functools import partial
-from typing import Any, Dict, Union
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Mapping, Sequence
 
 import structlog
 from mcp.server.fastmcp import FastMCP
-
-from custom import PersonalNotion, StudyNotion, WorkNotion, YoutuberNotion
-from services.notion_service import NotionService
-from tools import (
-    BaseNotionTools,
-    PersonalNotionTools,
-    StudyNotionTools,
-    WorkNotionTools,
-    YoutuberNotionTools,
-)
-from utils import DatabaseType
-
-from .config import NotionConfig, load_config
+from mcp.server.fastmcp.tools.base import Tool
+
+from services.service_pool import NotionServicePool
+from utils import DATE_FIELD, RELATION_FIELD, TITLE_FIELD, DatabaseType
+from utils.constants import METRICS_WRITE_INTERVAL_SECONDS
+from utils.log_policy import TOOL_CALL_LOG_POLICY
+from utils.metrics import METRICS
+from utils.timing import PhaseTimer
+from utils.tracing import TRACER, JsonlSpanExporter
+
+from .batch import BATCH_TOOL_DEFINITION, BatchExecutor
+from .config import NotionConfig, TransportConfig, load_config
+from .dispatch import build_tool
+from .jobs import BACKGROUND_TOOLS, JobManager, JobTools, with_background
+from .registry import add_prebuilt_tool, tools_by_name
+from .resources import DatabaseResources, register_metrics_resource
+from .results import ResultCache, ResultTools
 
 logger = structlog.get_logger(__name__)
 
@@ -35,75 +38,262 @@ INSTRUCTIONS = (
 )
 
 
-def create_fastmcp_app() -> FastMCP:
-    """Build a FastMCP instance fully wired to the Notion Automation Suite."""
-    config = load_config()
-    service = NotionService(config.token)
+class DeferredToolsFastMCP(FastMCP):
+    """
+    FastMCP that registers its tools on the first tools request.
+
+    Importing the tools package and building every tool set is deferred so
+    ``initialize`` is answered right away; the registrar runs once, on the
+    first ``tools/list`` or ``tools/call``.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        tool_registrar: Callable[["DeferredToolsFastMCP"], None],
+        runtime: "SharedRuntime | None" = None,
+        **kwargs: Any,
+    ):
+        self._tool_registrar: Callable[["DeferredToolsFastMCP"], None] | None = tool_registrar
+        self.runtime = runtime
+        super().__init__(*args, **kwargs)
+
+    def ensure_tools(self) -> None:
+        """Run the pending tool registrar, if any."""
+        registrar = self._tool_registrar
+        if registrar is None:
+            return
+        self._tool_registrar = None
+        registrar(self)
+
+    def add_prebuilt_tool(self, tool: Tool) -> None:
+        """Register an already built ``Tool`` (skips signature introspection)."""
+        if add_prebuilt_tool(self, tool):
+            logger.warning("duplicate_tool_registration", tool=tool.name)
+
+    async def list_tools(self) -> Any:
+        self.ensure_tools()
+        return await super().list_tools()
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
+        self.ensure_tools()
+        return await super().call_tool(name, arguments)
+
+
+class SharedRuntime:
+    """
+    Process-wide resources shared by every MCP session.
+
+    FastMCP enters the lifespan once per session: once in total over stdio,
+    but once per client connection over HTTP. Sessions therefore only hold a
+    reference: the card store sync and the resource poller start with the
+    first holder, and jobs and the services (with their HTTP pools) are closed when the last one
+    leaves. The HTTP runner holds a reference for the life of the process,
+    so the warm services, limiters and caches are shared by every client.
+    """
 
-    work_tools = _build_work_tools(service, config)
-    study_tools = _build_study_tools(service, config)
-    personal_tools = _build_personal_tools(service, config)
-    youtuber_tools = _build_youtuber_tools(service, config)
-    base_tools = BaseNotionTools(service)
+    def __init__(
+        self,
+        config: NotionConfig,
+        pool: NotionServicePool,
+        jobs: JobManager,
+        resources: DatabaseResources | None = None,
+    ):
+        self.config = config
+        self.pool = pool
+        self.jobs = jobs
+        self.resources = resources
+        self._holders = 0
+        self._sync_task: asyncio.Task[None] | None = None
+        self._poll_task: asyncio.Task[None] | None = None
+        self._metrics_task: asyncio.Task[None] | None = None
 
     @asynccontextmanager
-    async def _lifespan(_: FastMCP):
+    async def hold(self) -> AsyncIterator[None]:
+        """Keep the shared resources open while the context is active."""
+        self._holders += 1
+        if self._holders == 1:
+            self._start()
         try:
             yield
         finally:
-            await service.close()
-
-    app = FastMCP(
-        name="Notion Automation Suite",
-        instructions=INSTRUCTIONS,
-        website_url="https://www.notion.so",
-        lifespan=_lifespan,
-    )
-
-    _register_tool_set(app, base_tools)
-    _register_tool_set(app, work_tools)
-    _register_tool_set(app, study_tools)
-    _register_tool_set(app, personal_tools)
-    _register_tool_set(app, youtuber_tools)
-    _register_database_resources(app, service, config.database_ids)
-
-    logger.info("fastmcp_app_ready")
+            self._holders -= 1
+            if self._holders == 0:
+                await self._close()
+
+    def _start(self) -> None:
+        if self.config.trace_file:
+            TRACER.configure(JsonlSpanExporter(self.config.trace_file))
+        if self.config.sync_on_start:
+            self._sync_task = asyncio.create_task(
+                _sync_card_store(self.pool, self.config.database_ids)
+            )
+        if self.resources is not None:
+            self._poll_task = self.resources.start_polling(self.config.resource_poll_seconds)
+        if self.config.metrics_file:
+            self._metrics_task = asyncio.create_task(_write_metrics(self.config.metrics_file))
+
+    async def _close(self) -> None:
+        for task in (self._sync_task, self._poll_task, self._metrics_task):
+            if task is not None and not task.done():
+                task.cancel()
+        self._sync_task = self._poll_task = self._metrics_task = None
+        if self.config.metrics_file:
+            METRICS.write_prometheus(self.config.metrics_file)
+        await self.jobs.shutdown()
+        logger.info("tool_call_log_stats", tools=TOOL_CALL_LOG_POLICY.stats())
+        await self.pool.close()
+        TRACER.configure(None)
+
+
+class LazyToolSet:
+    """
+    Tool provider that builds its custom Notion adapter on first call.
+
+    Tool metadata comes from the tools class alone (``get_tools`` never
+    touches the adapter), so listing tools does not construct anything.
+    """
+
+    def __init__(self, tools_factory: Callable[[Any], Any], adapter_factory: Callable[[], Any]):
+        self._tools_factory = tools_factory
+        self._adapter_factory = adapter_factory
+        self._provider: Any | None = None
+
+    @property
+    def provider(self) -> Any:
+        if self._provider is None:
+            self._provider = self._tools_factory(self._adapter_factory())
+        return self._provider
+
+    def get_tools(self) -> List[Dict[str, Any]]:
+        return self._tools_factory(None).get_tools()
+
+    async def handle_tool_call(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        return await self.provider.handle_tool_call(tool_name, arguments)
+
+
+def create_fastmcp_app(transport: TransportConfig | None = None) -> DeferredToolsFastMCP:
+    """
+    Build a FastMCP instance fully wired to the Notion Automation Suite.
+
+    Args:
+        transport: Transport settings (host and port of the HTTP transports)
+    """
+    timer = PhaseTimer()
+    transport = transport or TransportConfig()
+
+    with timer.phase("load_config"):
+        config = load_config()
+        pool = NotionServicePool(config.token, config.tokens_by_database_id())
+        _register_store_databases(pool, config.database_ids)
+        jobs = JobManager()
+        resources = DatabaseResources(pool, config.database_ids)
+        results = ResultCache(config.result_budget_bytes)
+        runtime = SharedRuntime(config, pool, jobs, resources)
+
+    @asynccontextmanager
+    async def _lifespan(_: FastMCP):
+        async with runtime.hold():
+            yield
+
+    def _register_tools(target: DeferredToolsFastMCP) -> None:
+        registration = PhaseTimer()
+        for name, provider in _build_tool_sets(pool, config):
+            with registration.phase(name):
+                _register_tool_set(target, provider, jobs, results)
+        with registration.phase("batch"):
+            _register_batch_tool(target, jobs, results)
+        with registration.phase("jobs"):
+            _register_tool_set(target, JobTools(jobs), jobs, results)
+            # Continuation pages are already budgeted
+            _register_tool_set(target, ResultTools(results), jobs)
+        logger.info("fastmcp_tools_registered", timings_ms=registration.as_dict())
+
+    with timer.phase("create_app"):
+        app = DeferredToolsFastMCP(
+            name="Notion Automation Suite",
+            instructions=INSTRUCTIONS,
+            website_url="https://www.notion.so",
+            lifespan=_lifespan,
+            tool_registrar=_register_tools,
+            runtime=runtime,
+            host=transport.host,
+            port=transport.port,
+        )
+
+    with timer.phase("register_resources"):
+        resources.register(app)
+        register_metrics_resource(app)
+
+    logger.info("fastmcp_app_ready", timings_ms=timer.as_dict())
     return app
 
 
-def _build_work_tools(service: NotionService, config: NotionConfig) -> WorkNotionTools | None:
+def _build_tool_sets(
+    pool: NotionServicePool,
+    config: NotionConfig,
+) -> Sequence[tuple[str, Any]]:
+    from tools import BaseNotionTools
+
+    return [
+        ("base", BaseNotionTools(pool.default, pool=pool)),
+        ("work", _build_work_tools(pool, config)),
+        ("study", _build_study_tools(pool, config)),
+        ("personal", _build_personal_tools(pool, config)),
+        ("youtuber", _build_youtuber_tools(pool, config)),
+    ]
+
+
+def _build_work_tools(pool: NotionServicePool, config: NotionConfig) -> LazyToolSet | None:
     work_id = config.database_ids.get(DatabaseType.WORK)
     if not work_id:
         return None
-    work_notion = WorkNotion(service, work_id)
-    return WorkNotionTools(work_notion)
+    from custom import WorkNotion
+    from tools import WorkNotionTools
 
+    service = pool.for_database(work_id)
+    return LazyToolSet(WorkNotionTools, lambda: WorkNotion(service, work_id))
 
-def _build_study_tools(service: NotionService, config: NotionConfig) -> StudyNotionTools | None:
+
+def _build_study_tools(pool: NotionServicePool, config: NotionConfig) -> LazyToolSet | None:
     study_id = config.database_ids.get(DatabaseType.STUDIES)
     if not study_id:
         return None
-    study_notion = StudyNotion(service, study_id)
-    return StudyNotionTools(study_notion)
+    from custom import StudyNotion
+    from tools import StudyNotionTools
+
+    service = pool.for_database(study_id)
+    return LazyToolSet(StudyNotionTools, lambda: StudyNotion(service, study_id))
 
 
-def _build_personal_tools(service: NotionService, config: NotionConfig) -> PersonalNotionTools | None:
+def _build_personal_tools(pool: NotionServicePool, config: NotionConfig) -> LazyToolSet | None:
     personal_id = config.database_ids.get(DatabaseType.PERSONAL)
     if not personal_id:
         return None
-    personal_notion = PersonalNotion(service, personal_id)
-    return PersonalNotionTools(personal_notion)
+    from custom import PersonalNotion
+    from tools import PersonalNotionTools
+
+    service = pool.for_database(personal_id)
+    return LazyToolSet(PersonalNotionTools, lambda: PersonalNotion(service, personal_id))
 
 
-def _build_youtuber_tools(service: NotionService, config: NotionConfig) -> YoutuberNotionTools | None:
+def _build_youtuber_tools(pool: NotionServicePool, config: NotionConfig) -> LazyToolSet | None:
     youtuber_id = config.database_ids.get(DatabaseType.YOUTUBER)
     if not youtuber_id:
         return None
-    youtuber_notion = YoutuberNotion(service, youtuber_id)
-    return YoutuberNotionTools(youtuber_notion)
+    from custom import YoutuberNotion
+    from tools import YoutuberNotionTools
 
+    service = pool.for_database(youtuber_id)
+    return LazyToolSet(YoutuberNotionTools, lambda: YoutuberNotion(service, youtuber_id))
 
-def _register_tool_set(app: FastMCP, provider: Any | None) -> None:
+
+def _register_tool_set(
+    app: DeferredToolsFastMCP,
+    provider: Any | None,
+    jobs: JobManager,
+    results: ResultCache | None = None,
+) -> None:
     if provider is None:
         return
 
@@ -113,211 +303,80 @@ def _register_tool_set(app: FastMCP, provider: Any | None) -> None:
             continue
 
         handler = partial(provider.handle_tool_call, name)
-        func = _build_tool_callable(name, definition.get("inputSchema", {}), handler)
-        func.__doc__ = definition.get("description", "")
+        if name in BACKGROUND_TOOLS:
+            definition, handler = with_background(definition, handler, jobs)
+        app.add_prebuilt_tool(build_tool(definition, handler, results))
 
-        app.add_tool(
-            func,
-            name=name,
-            description=definition.get("description"),
-        )
-
-
-def _parse_complex_arg(value: Any, expected_type: str) -> Any:
-    """
-    Parse complex arguments that may arrive as malformed strings.
 
-    Handles cases where dict/list arguments are incorrectly serialized
-    as strings by attempting JSON parsing and fixing common malformed patterns.
-    """
-    # If already correct type, return as-is
-    if isinstance(value, dict):
-        return value
-    if isinstance(value, list):
-        return value
-
-    # Only process if expected type is complex
-    if expected_type not in ("dict[str, Any]", "list[Any]", "Any"):
-        return value
-
-    # If not a string, return as-is
-    if not isinstance(value, str):
-        return value
-
-    # Try to parse as JSON
-    cleaned = value.strip()
-
-    # Skip empty strings
-    if not cleaned:
-        return None
-
-    # Try direct JSON parsing first
-    if cleaned.startswith("{") or cleaned.startswith("["):
-        try:
-            parsed = json.loads(cleaned)
-            if isinstance(parsed, (dict, list)):
-                return parsed
-        except (json.JSONDecodeError, ValueError):
-            pass
-
-    # Try to fix common malformed patterns
-    # Pattern 1: "{}'start': '20null" -> {"start": "..."}
-    # Pattern 2: "{'key': 'value'}" -> {"key": "value"}
-    # Pattern 3: "{}'Data':{}'date':{}'start': 'nullnullnull" -> {"Data": {"date": {"start": "..."}}}
-    if "'" in cleaned and ":" in cleaned:
-        try:
-            # Try to convert Python dict string to JSON
-            # Replace single quotes with double quotes (basic fix)
-            fixed = cleaned.replace("'", '"')
-            # Fix None/null values
-            fixed = fixed.replace('None', 'null')
-            # Fix malformed patterns like {}'key': -> {"key":
-            fixed = re.sub(r'\{\}\'', '{"', fixed)
-            fixed = re.sub(r'\'\s*:', '":', fixed)
-            # Try to fix nested patterns
-            fixed = re.sub(r'\{\}\"', '{"', fixed)
-
-            parsed = json.loads(fixed)
-            if isinstance(parsed, (dict, list)):
-                return parsed
-        except (json.JSONDecodeError, ValueError, Exception):
-            # If all parsing attempts fail, log and return None
-            logger.warning(
-                "malformed_dict_argument_unparseable",
-                value=value[:200],  # Log first 200 chars
-                expected_type=expected_type
+def _register_store_databases(
+    pool: NotionServicePool,
+    database_ids: Dict[DatabaseType, str | None],
+) -> None:
+    """Index every configured database in the card store, even before its adapter exists."""
+    for db_type, database_id in database_ids.items():
+        if database_id:
+            pool.store.register_database(
+                database_id,
+                title_field=TITLE_FIELD[db_type],
+                relation_field=RELATION_FIELD[db_type],
+                date_field=DATE_FIELD.get(db_type),
             )
-            return None
-
-    # If we get here, it's not a parseable complex type
-    return None
-
-
-def _build_tool_callable(
-    tool_name: str,
-    schema: Dict[str, Any],
-    handler: Any,
-) -> Any:
-    properties = schema.get("properties", {})
-    required_fields = set(schema.get("required", []))
-    func_name = f"{tool_name}_impl".replace("-", "_")
-
-    required_params: list[str] = []
-    optional_params: list[str] = []
-    field_types: Dict[str, str] = {}
-    for field, spec in properties.items():
-        annotation = _schema_type_to_annotation(spec)
-        field_types[field] = annotation
-        if field in required_fields:
-            required_params.append(f"{field}: {annotation}")
-        else:
-            optional_params.append(f"{field}: {annotation} | None = None")
-
-    signature_parts = required_params + optional_params
-    signature = ", ".join(signature_parts)
-    header = f"async def {func_name}({signature}) -> Any:" if signature else f"async def {func_name}() -> Any:"
-
-    body_lines = [header, "    arguments: dict[str, Any] = {}"]
-    for field, spec in properties.items():
-        field_type = spec.get("type")
-        if isinstance(field_type, list):
-            field_type = next((item for item in field_type if item != "null"), field_type[0])
-
-        # Check if this is a complex type that needs parsing
-        is_complex = field_type in ("object", "array")
-        expected_type = "dict[str, Any]" if field_type == "object" else "list[Any]" if field_type == "array" else "Any"
-
-        if is_complex:
-            # Parse complex arguments that may be malformed strings
-            if field in required_fields:
-                body_lines.append(f"    # Parse {field} (complex type) if needed")
-                body_lines.append(f"    {field}_parsed = _parse_complex_arg({field}, '{expected_type}')")
-                body_lines.append(f"    if {field}_parsed is None and {field} is not None:")
-                body_lines.append(f"        # If parsing failed, try to use original value")
-                body_lines.append(f"        {field}_parsed = {field}")
-                body_lines.append(f"    arguments['{field}'] = {field}_parsed")
-            else:
-                body_lines.append(f"    if {field} is not None:")
-                body_lines.append(f"        # Parse {field} (complex type) if needed")
-                body_lines.append(f"        {field}_parsed = _parse_complex_arg({field}, '{expected_type}')")
-                body_lines.append(f"        if {field}_parsed is None:")
-                body_lines.append(f"            # If parsing failed, try to use original value")
-                body_lines.append(f"            {field}_parsed = {field}")
-                body_lines.append(f"        arguments['{field}'] = {field}_parsed")
-        else:
-            if field in required_fields:
-                body_lines.append(f"    arguments['{field}'] = {field}")
-            else:
-                body_lines.append(f"    if {field} is not None:")
-                body_lines.append(f"        arguments['{field}'] = {field}")
-    body_lines.append("    return await handler(arguments)")
-
-    namespace: Dict[str, Any] = {
-        "Any": Any,
-        "Union": Union,
-        "handler": handler,
-        "_parse_complex_arg": _parse_complex_arg,
-        "json": json,
-        "logger": logger,
-    }
-    exec("\n".join(body_lines), namespace)
-    func = namespace[func_name]
-    return func
-
-
-def _schema_type_to_annotation(schema: Dict[str, Any]) -> str:
-    """
-    Convert JSON schema type to Python type annotation.
 
-    For complex types (object, array), we use Union[str, dict/list] to allow
-    malformed strings to pass Pydantic validation, then parse them manually.
-    """
-    type_value = schema.get("type")
-    if isinstance(type_value, list):
-        type_value = next((item for item in type_value if item != "null"), type_value[0])
-
-    if type_value == "string":
-        return "str"
-    if type_value == "integer":
-        return "int"
-    if type_value == "number":
-        return "float"
-    if type_value == "boolean":
-        return "bool"
-    if type_value == "array":
-        # Use Union to allow both string and list to pass validation
-        return "Union[str, list[Any], Any]"
-    if type_value == "object":
-        # Use Union to allow both string and dict to pass validation
-        return "Union[str, dict[str, Any], Any]"
-
-    return "Any"
-
-
-def _register_database_resources(
-    app: FastMCP,
-    service: NotionService,
+
+async def _sync_card_store(
+    pool: NotionServicePool,
     database_ids: Dict[DatabaseType, str | None],
 ) -> None:
+    """Warm the card store with every page of the configured databases."""
+    timer = PhaseTimer()
     for db_type, database_id in database_ids.items():
         if not database_id:
             continue
+        try:
+            with timer.phase(db_type.value):
+                pages = await pool.for_database(database_id).query_database_all(database_id)
+                pool.store.prune(database_id, (page["id"] for page in pages))
+        except Exception as exc:  # noqa: BLE001 - best effort, never breaks startup
+            logger.warning("card_store_sync_failed", database_type=db_type.value, error=str(exc))
+    logger.info("card_store_synced", pages=len(pool.store), timings_ms=timer.as_dict())
+
+
+async def _write_metrics(path: str, interval: float = METRICS_WRITE_INTERVAL_SECONDS) -> None:
+    """Rewrite the Prometheus textfile every ``interval`` seconds."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            METRICS.write_prometheus(path)
+        except OSError as exc:
+            logger.warning("metrics_write_failed", path=path, error=str(exc))
 
-        uri = f"notion://database/{db_type.value}"
-        title = f"{db_type.value.title()} Database"
-        description = f"Esquema completo da base {db_type.value}."
-
-        def _register_resource(db_id: str) -> None:
-            @app.resource(
-                uri,
-                name=f"{db_type.value}-database",
-                title=title,
-                description=description,
-                mime_type="application/json",
-            )
-            async def _read_database() -> Dict[str, Any]:
-                return await service.get_database(db_id)
 
-        _register_resource(database_id)
+class _ToolDispatchers(Mapping[str, Any]):
+    """Dispatchers of registered tools, looked up when a batch runs
+
+    Tools registered after ``notion_batch`` (jobs, result continuation) are
+    therefore callable from a batch too.
+    """
+
+    def __init__(self, tools: Mapping[str, Tool]):
+        self._tools = tools
 
+    def __getitem__(self, name: str) -> Any:
+        return self._tools[name].fn
 
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tools)
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+
+def _register_batch_tool(
+    app: DeferredToolsFastMCP,
+    jobs: JobManager,
+    results: ResultCache | None = None,
+) -> None:
+    """Register ``notion_batch`` over the dispatchers of the tools registered on ``app``."""
+    executor = BatchExecutor(_ToolDispatchers(tools_by_name(app)))
+    definition, handler = with_background(BATCH_TOOL_DEFINITION, executor.handle, jobs)
+    app.add_prebuilt_tool(build_tool(definition, handler, results))
@@ -0,0 +1,397 @@
+"""Per-tool argument decoders compiled from JSON schemas.
+
+Agents sometimes send objects and arrays serialized as strings, often as
+Python literals (single quotes, ``None``) instead of JSON. Each tool gets an
+:class:`ArgumentDecoder` compiled once from its ``inputSchema``:
+
+- Values that already have the expected type are returned untouched
+- Valid JSON strings are decoded by ``json.loads`` in one C-level pass
+- Anything else goes through :func:`parse_loose_json`: Python-literal text
+  with uniform quoting is rewritten to JSON outside string contents and
+  decoded once; other shapes go through a single-pass tolerant parser
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+FieldDecoder = Callable[[str, Any], Any]
+
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "on"})
+_FALSE_STRINGS = frozenset({"false", "0", "no", "off"})
+
+_NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?")
+_BARE_WORD = re.compile(r"[A-Za-z_][A-Za-z0-9_\-]*")
+_WHITESPACE = frozenset(" \t\r\n")
+_LITERALS = {
+    "true": True,
+    "True": True,
+    "false": False,
+    "False": False,
+    "null": None,
+    "None": None,
+}
+_JSON_LITERALS = {"None": "null", "True": "true", "False": "false"}
+
+_SEGMENT_MARK = "\x00"
+_EMPTY_OBJECT_BEFORE_STRING = re.compile(r"\{\}(?=\x00)")
+_ESCAPES = {
+    '"': '"',
+    "'": "'",
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+
+class ArgumentDecoder:
+    """
+    Decode raw MCP arguments for one tool
+
+    The schema is compiled into ``(field, decoder, required)`` entries when
+    the tool is registered; decoding a call only walks that tuple. Unknown
+    arguments are dropped and ``None`` values for optional fields omitted.
+
+    Args:
+        tool_name: Tool name (used in error messages)
+        schema: Tool ``inputSchema``
+    """
+
+    def __init__(self, tool_name: str, schema: Dict[str, Any]):
+        self.tool_name = tool_name
+        required_fields = set(schema.get("required", []))
+        fields: List[Tuple[str, Optional[FieldDecoder], bool]] = []
+        for field, spec in schema.get("properties", {}).items():
+            fields.append((field, compile_field_decoder(spec), field in required_fields))
+        self._fields = tuple(fields)
+
+    def __call__(self, raw_arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build handler arguments from raw MCP arguments
+
+        Raises:
+            ValueError: If a required argument is missing or has the wrong type
+        """
+        arguments: Dict[str, Any] = {}
+        for field, decoder, required in self._fields:
+            value = raw_arguments.get(field)
+            if value is None:
+                if required:
+                    raise ValueError(f"Missing required argument '{field}' for {self.tool_name}")
+                continue
+            arguments[field] = value if decoder is None else decoder(field, value)
+        return arguments
+
+
+def compile_field_decoder(spec: Dict[str, Any]) -> Optional[FieldDecoder]:
+    """
+    Pick the decoder for a property schema
+
+    Args:
+        spec: Property schema (e.g., ``{"type": "integer"}``)
+
+    Returns:
+        Decoder callable, or ``None`` when values pass through unchanged
+    """
+    type_value = spec.get("type")
+    if isinstance(type_value, list):
+        type_value = next((item for item in type_value if item != "null"), type_value[0])
+
+    return _FIELD_DECODERS.get(type_value)
+
+
+def _decode_integer(field: str, value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            raise ValueError(f"Argument '{field}' must be an integer") from None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _decode_number(field: str, value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            raise ValueError(f"Argument '{field}' must be a number") from None
+    return value
+
+
+def _decode_boolean(field: str, value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    lowered = value.strip().lower()
+    if lowered in _TRUE_STRINGS:
+        return True
+    if lowered in _FALSE_STRINGS:
+        return False
+    raise ValueError(f"Argument '{field}' must be a boolean")
+
+
+def _decode_container(field: str, value: Any) -> Any:
+    # Zero-cost path: already decoded by the MCP transport
+    value_type = type(value)
+    if value_type is dict or value_type is list or not isinstance(value, str):
+        return value
+
+    text = value.strip()
+    if not text:
+        return value
+
+    if text[0] in "{[":
+        try:
+            parsed = json.loads(text)
+        except ValueError:
+            pass
+        else:
+            if isinstance(parsed, (dict, list)):
+                return parsed
+
+    try:
+        parsed = parse_loose_json(text)
+    except ValueError:
+        parsed = None
+
+    if isinstance(parsed, (dict, list)):
+        return parsed
+
+    logger.warning(
+        "malformed_dict_argument_unparseable",
+        field=field,
+        value=value[:200],  # Log first 200 chars
+    )
+    # Keep the original value; the handler reports a meaningful error
+    return value
+
+
+_FIELD_DECODERS: Dict[Any, FieldDecoder] = {
+    "integer": _decode_integer,
+    "number": _decode_number,
+    "boolean": _decode_boolean,
+    "object": _decode_container,
+    "array": _decode_container,
+}
+
+
+def parse_loose_json(text: str) -> Any:
+    """
+    Parse JSON-like text in a single pass
+
+    Accepts strict JSON plus the variants agents commonly produce:
+    single-quoted strings, Python literals (``None``/``True``/``False``),
+    bare object keys, trailing commas and the ``{}'key'`` artifact seen in
+    double-serialized payloads.
+
+    Args:
+        text: Serialized value
+
+    Returns:
+        Decoded Python value
+
+    Raises:
+        ValueError: If the text cannot be parsed
+
+    Examples:
+        >>> parse_loose_json("{'start': '2025-01-06', 'end': None}")
+        {'start': '2025-01-06', 'end': None}
+    """
+    translated = _translate_uniform_quotes(text)
+    if translated is not None:
+        try:
+            return json.loads(translated)
+        except ValueError:
+            pass
+
+    parser = _LooseParser(text)
+    value = parser.parse_value()
+    parser.skip_whitespace()
+    if parser.pos != len(text):
+        raise parser.error("unexpected trailing data")
+    return value
+
+
+def _translate_uniform_quotes(text: str) -> Optional[str]:
+    """
+    Rewrite Python-literal text into JSON using only C-level string operations
+
+    Applies when every string uses the same quote character and there are no
+    escapes. Splitting on that quote yields outside/inside segments
+    alternately, so literals and the ``{}'key'`` artifact are fixed on the
+    outside segments only and string contents stay intact. Outside segments
+    hold no identifiers other than literals (bare keys make ``json.loads``
+    fail and fall back to the full parser), so plain ``str.replace`` is
+    enough. Trailing commas are also left to the full parser.
+
+    Returns:
+        JSON text, or ``None`` when the fast path does not apply
+    """
+    if "\\" in text or _SEGMENT_MARK in text:
+        return None
+
+    has_single = "'" in text
+    if has_single and '"' in text:
+        return None
+
+    needs_rewrite = "{}" in text or any(literal in text for literal in _JSON_LITERALS)
+    if not needs_rewrite:
+        # Double-quoted text without literals already failed json.loads
+        return text.replace("'", '"') if has_single else None
+
+    parts = text.split("'" if has_single else '"')
+    if len(parts) % 2 == 0:
+        return None
+
+    # Each mark stands for one string boundary between outside segments
+    outside = _SEGMENT_MARK.join(parts[0::2])
+    outside = _EMPTY_OBJECT_BEFORE_STRING.sub("{", outside)
+    for literal, replacement in _JSON_LITERALS.items():
+        outside = outside.replace(literal, replacement)
+    parts[0::2] = outside.split(_SEGMENT_MARK)
+    return '"'.join(parts)
+
+
+class _LooseParser:
+    """Recursive-descent parser over a string, advancing a single cursor."""
+
+    __slots__ = ("text", "pos")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+
+    def error(self, message: str) -> ValueError:
+        return ValueError(f"{message} at position {self.pos}")
+
+    def skip_whitespace(self) -> None:
+        text = self.text
+        pos = self.pos
+        while pos < len(text) and text[pos] in _WHITESPACE:
+            pos += 1
+        self.pos = pos
+
+    def parse_value(self) -> Any:
+        self.skip_whitespace()
+        if self.pos >= len(self.text):
+            raise self.error("unexpected end of input")
+
+        char = self.text[self.pos]
+        if char == "{":
+            return self.parse_object()
+        if char == "[":
+            return self.parse_array()
+        if char in "\"'":
+            return self.parse_string()
+
+        match = _NUMBER.match(self.text, self.pos)
+        if match:
+            self.pos = match.end()
+            number = match.group()
+            if "." in number or "e" in number or "E" in number:
+                return float(number)
+            return int(number)
+
+        match = _BARE_WORD.match(self.text, self.pos)
+        if match and match.group() in _LITERALS:
+            self.pos = match.end()
+            return _LITERALS[match.group()]
+
+        raise self.error(f"unexpected character {char!r}")
+
+    def parse_object(self) -> Dict[str, Any]:
+        text = self.text
+        self.pos += 1
+        # ``{}'key': ...`` artifact produced by broken double serialization
+        if self.pos + 1 < len(text) and text[self.pos] == "}" and text[self.pos + 1] in "\"'":
+            self.pos += 1
+
+        result: Dict[str, Any] = {}
+        while True:
+            self.skip_whitespace()
+            if self.pos >= len(text):
+                raise self.error("unterminated object")
+            if text[self.pos] == "}":
+                self.pos += 1
+                return result
+
+            key = self.parse_key()
+            self.skip_whitespace()
+            if self.pos >= len(text) or text[self.pos] != ":":
+                raise self.error("expected ':'")
+            self.pos += 1
+            result[key] = self.parse_value()
+
+            self.skip_whitespace()
+            if self.pos < len(text) and text[self.pos] == ",":
+                self.pos += 1
+            elif self.pos < len(text) and text[self.pos] != "}":
+                raise self.error("expected ',' or '}'")
+
+    def parse_key(self) -> str:
+        if self.text[self.pos] in "\"'":
+            return self.parse_string()
+        match = _BARE_WORD.match(self.text, self.pos)
+        if not match:
+            raise self.error("expected object key")
+        self.pos = match.end()
+        return match.group()
+
+    def parse_array(self) -> List[Any]:
+        text = self.text
+        self.pos += 1
+        result: List[Any] = []
+        while True:
+            self.skip_whitespace()
+            if self.pos >= len(text):
+                raise self.error("unterminated array")
+            if text[self.pos] == "]":
+                self.pos += 1
+                return result
+
+            result.append(self.parse_value())
+
+            self.skip_whitespace()
+            if self.pos < len(text) and text[self.pos] == ",":
+                self.pos += 1
+            elif self.pos < len(text) and text[self.pos] != "]":
+                raise self.error("expected ',' or ']'")
+
+    def parse_string(self) -> str:
+        text = self.text
+        quote = text[self.pos]
+        self.pos += 1
+        chunks: List[str] = []
+        while True:
+            quote_at = text.find(quote, self.pos)
+            if quote_at < 0:
+                raise self.error("unterminated string")
+
+            escape_at = text.find("\\", self.pos, quote_at)
+            if escape_at < 0:
+                chunks.append(text[self.pos:quote_at])
+                self.pos = quote_at + 1
+                return "".join(chunks)
+
+            chunks.append(text[self.pos:escape_at])
+            escape = text[escape_at + 1]
+            if escape == "u":
+                code = text[escape_at + 2 : escape_at + 6]
+                if len(code) != 4:
+                    raise self.error("invalid unicode escape")
+                chunks.append(chr(int(code, 16)))
+                self.pos = escape_at + 6
+            else:
+                chunks.append(_ESCAPES.get(escape, escape))
+                self.pos = escape_at + 2
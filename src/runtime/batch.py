@@ -0,0 +1,281 @@
+"""Server-side batches of tool calls (``notion_batch``).
+
+A batch runs many tool calls in one MCP round trip. Calls go through the
+same schema dispatchers as individual ``tools/call`` requests, run
+concurrently under a bound, and may depend on earlier calls: a call waits
+for its ``depends_on`` entries, and ``{"$ref": "<id>.<path>"}`` values in its
+arguments are replaced by fields of their results (which implies the
+dependency).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Set
+
+import structlog
+
+from utils.constants import BATCH_MAX_CALLS, BULK_CONCURRENCY
+from utils.progress import report_done, report_total
+from utils.timing import PhaseTimer
+
+logger = structlog.get_logger(__name__)
+
+BATCH_TOOL_NAME = "notion_batch"
+
+BATCH_TOOL_DEFINITION: Dict[str, Any] = {
+    "name": BATCH_TOOL_NAME,
+    "description": (
+        "Run several tool calls in one request. Calls run concurrently unless they "
+        "depend on each other; results come back in input order."
+    ),
+    "inputSchema": {
+        "type": "object",
+        "properties": {
+            "calls": {
+                "type": "array",
+                "maxItems": BATCH_MAX_CALLS,
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "tool": {"type": "string", "description": "Tool name"},
+                        "arguments": {"type": "object", "description": "Tool arguments"},
+                        "id": {
+                            "type": "string",
+                            "description": "Name other calls use in depends_on and $ref",
+                        },
+                        "depends_on": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Call ids that must succeed before this one runs",
+                        },
+                    },
+                    "required": ["tool"],
+                },
+                "description": (
+                    'Tool calls. Argument values like {"$ref": "project.id"} take a field '
+                    "from the result of the call with id 'project'."
+                ),
+            },
+            "max_concurrency": {
+                "type": "integer",
+                "minimum": 1,
+                "default": BULK_CONCURRENCY,
+                "description": "Calls running at once",
+            },
+            "stop_on_error": {
+                "type": "boolean",
+                "default": False,
+                "description": "Skip calls not started yet once one fails",
+            },
+        },
+        "required": ["calls"],
+    },
+}
+
+Dispatcher = Callable[..., Awaitable[Any]]
+
+
+class BatchExecutor:
+    """
+    Execute ``notion_batch`` requests against registered tool dispatchers
+
+    Args:
+        dispatchers: Tool name -> dispatcher called with the raw arguments
+            (validation and decoding happen inside, as for ``tools/call``)
+    """
+
+    def __init__(self, dispatchers: Mapping[str, Dispatcher]):
+        self._dispatchers = dispatchers
+
+    async def handle(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Tool handler entry point (prepared ``notion_batch`` arguments)"""
+        return await self.run(
+            arguments["calls"],
+            max_concurrency=arguments.get("max_concurrency", BULK_CONCURRENCY),
+            stop_on_error=arguments.get("stop_on_error", False),
+        )
+
+    async def run(
+        self,
+        calls: List[Dict[str, Any]],
+        max_concurrency: int = BULK_CONCURRENCY,
+        stop_on_error: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Run a batch of tool calls
+
+        The whole batch is validated (tools, ids, dependencies, cycles)
+        before any call starts.
+
+        Args:
+            calls: ``{"tool", "arguments", "id", "depends_on"}`` entries
+            max_concurrency: Calls running at once
+            stop_on_error: Skip calls not started yet once one fails
+
+        Returns:
+            Dict with ``results`` (input order; each with ``index``, ``tool``,
+            ``status`` of ``ok``/``error``/``skipped`` and ``result`` or
+            ``error``) and ``succeeded``/``failed``/``skipped`` counters
+
+        Raises:
+            ValueError: If the batch is malformed
+        """
+        dependencies = self._validate(calls)
+        index_of = {call["id"]: index for index, call in enumerate(calls) if call.get("id")}
+
+        loop = asyncio.get_running_loop()
+        done: List[asyncio.Future] = [loop.create_future() for _ in calls]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(calls)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        failed = asyncio.Event()
+        timer = PhaseTimer()
+
+        async def execute(index: int) -> None:
+            call = calls[index]
+            entry: Dict[str, Any] = {"index": index, "tool": call["tool"]}
+            if call.get("id"):
+                entry["id"] = call["id"]
+            try:
+                for dependency in dependencies[index]:
+                    if not await done[index_of[dependency]]:
+                        raise _SkippedError(f"dependency '{dependency}' did not succeed")
+                if stop_on_error and failed.is_set():
+                    raise _SkippedError("an earlier call failed")
+
+                async with semaphore:
+                    if stop_on_error and failed.is_set():
+                        raise _SkippedError("an earlier call failed")
+                    arguments = _resolve_refs(call.get("arguments") or {}, results, index_of)
+                    entry["result"] = await self._dispatchers[call["tool"]](**arguments)
+                entry["status"] = "ok"
+            except _SkippedError as exc:
+                entry.update(status="skipped", error=str(exc))
+            except Exception as exc:  # noqa: BLE001 - reported per call
+                entry.update(status="error", error=f"{type(exc).__name__}: {exc}")
+                failed.set()
+            results[index] = entry
+            done[index].set_result(entry["status"] == "ok")
+            report_done(entry if entry["status"] == "ok" else None)
+
+        report_total(len(calls))
+        with timer.phase("batch"):
+            await asyncio.gather(*(execute(index) for index in range(len(calls))))
+
+        counts = dict.fromkeys(("ok", "error", "skipped"), 0)
+        for entry in results:
+            counts[entry["status"]] += 1
+
+        logger.info(
+            "notion_batch_completed",
+            calls=len(calls),
+            succeeded=counts["ok"],
+            failed=counts["error"],
+            skipped=counts["skipped"],
+            timings_ms=timer.as_dict(),
+        )
+
+        return {
+            "results": results,
+            "succeeded": counts["ok"],
+            "failed": counts["error"],
+            "skipped": counts["skipped"],
+        }
+
+    def _validate(self, calls: List[Dict[str, Any]]) -> List[Set[str]]:
+        """Check the batch and return the dependency ids of each call"""
+        if not calls:
+            raise ValueError("notion_batch requires at least one call")
+        if len(calls) > BATCH_MAX_CALLS:
+            raise ValueError(f"notion_batch accepts at most {BATCH_MAX_CALLS} calls")
+
+        ids: Dict[str, int] = {}
+        for index, call in enumerate(calls):
+            tool = call.get("tool")
+            if tool == BATCH_TOOL_NAME:
+                raise ValueError(f"Call #{index}: notion_batch cannot be nested")
+            if tool not in self._dispatchers:
+                raise ValueError(f"Call #{index}: unknown tool '{tool}'")
+            call_id = call.get("id")
+            if call_id:
+                if call_id in ids:
+                    raise ValueError(f"Call #{index}: duplicate id '{call_id}'")
+                ids[call_id] = index
+
+        dependencies: List[Set[str]] = []
+        for index, call in enumerate(calls):
+            needed = set(call.get("depends_on") or [])
+            needed.update(_collect_refs(call.get("arguments") or {}))
+            for dependency in needed:
+                if dependency not in ids:
+                    raise ValueError(f"Call #{index}: unknown dependency '{dependency}'")
+                if ids[dependency] == index:
+                    raise ValueError(f"Call #{index}: a call cannot depend on itself")
+            dependencies.append(needed)
+
+        _assert_acyclic(dependencies, ids)
+        return dependencies
+
+
+class _SkippedError(Exception):
+    """A call that was not executed"""
+
+
+def _assert_acyclic(dependencies: List[Set[str]], ids: Dict[str, int]) -> None:
+    state = [0] * len(dependencies)  # 0 unvisited, 1 on the stack, 2 done
+
+    def visit(index: int) -> None:
+        state[index] = 1
+        for dependency in dependencies[index]:
+            target = ids[dependency]
+            if state[target] == 1:
+                raise ValueError(f"Dependency cycle through '{dependency}'")
+            if state[target] == 0:
+                visit(target)
+        state[index] = 2
+
+    for index in range(len(dependencies)):
+        if state[index] == 0:
+            visit(index)
+
+
+def _ref_target(value: Any) -> Optional[str]:
+    if isinstance(value, dict) and len(value) == 1 and isinstance(value.get("$ref"), str):
+        return value["$ref"]
+    return None
+
+
+def _collect_refs(value: Any) -> Set[str]:
+    target = _ref_target(value)
+    if target is not None:
+        return {target.split(".", 1)[0]}
+    found: Set[str] = set()
+    if isinstance(value, dict):
+        for item in value.values():
+            found |= _collect_refs(item)
+    elif isinstance(value, list):
+        for item in value:
+            found |= _collect_refs(item)
+    return found
+
+
+def _resolve_refs(
+    value: Any,
+    results: List[Optional[Dict[str, Any]]],
+    index_of: Dict[str, int],
+) -> Any:
+    target = _ref_target(value)
+    if target is not None:
+        call_id, _, path = target.partition(".")
+        current = results[index_of[call_id]]["result"]
+        for part in path.split(".") if path else []:
+            try:
+                current = current[int(part)] if isinstance(current, list) else current[part]
+            except (KeyError, IndexError, TypeError, ValueError) as exc:
+                raise ValueError(f"Reference '{target}' not found in the result") from exc
+        return current
+    if isinstance(value, dict):
+        return {key: _resolve_refs(item, results, index_of) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_resolve_refs(item, results, index_of) for item in value]
+    return value
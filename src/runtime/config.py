@@ -2,22 +2,40 @@
 
 from __future__ import annotations
 
+import argparse
+import logging
 import os
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional, TextIO
+from typing import Dict, Optional, Sequence, TextIO
 
 import structlog
 from dotenv import load_dotenv
 
 from utils import DatabaseType
+from utils.constants import (
+    METRICS_FILE_VARIABLE,
+    RESOURCE_POLL_INTERVAL_SECONDS,
+    RESULT_BUDGET_BYTES,
+    TRACE_FILE_VARIABLE,
+)
 
 logger = structlog.get_logger(__name__)
 
 DEFAULT_ENV_PATH = "config/.env"
 ENV_PATH_VARIABLE = "NOTION_ENV_FILE"
 LOG_FILE_VARIABLE = "LOG_FILE_PATH"
+LOG_LEVEL_VARIABLE = "LOG_LEVEL"
+SYNC_ON_START_VARIABLE = "NOTION_SYNC_ON_START"
+RESOURCE_POLL_VARIABLE = "NOTION_RESOURCE_POLL_SECONDS"
+RESULT_BUDGET_VARIABLE = "NOTION_RESULT_BUDGET_BYTES"
+TRANSPORT_VARIABLE = "MCP_TRANSPORT"
+HOST_VARIABLE = "MCP_HOST"
+PORT_VARIABLE = "MCP_PORT"
+TRANSPORTS = ("stdio", "streamable-http", "sse")
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
 _DEFAULT_LOG_PATH = Path("logs/mcp.log")
 
 _LOG_FILE_HANDLE: Optional[TextIO] = None
@@ -29,14 +47,35 @@ class NotionConfig:
 
     token: str
     database_ids: Dict[DatabaseType, str]
+    sync_on_start: bool = False
+    # Seconds between schema checks of the database resources (0 disables)
+    resource_poll_seconds: float = RESOURCE_POLL_INTERVAL_SECONDS
+    # Largest tool result returned in one piece (0 disables the budget)
+    result_budget_bytes: int = RESULT_BUDGET_BYTES
+    # Prometheus textfile rewritten periodically (None disables)
+    metrics_file: Optional[str] = None
+    # JSONL file receiving tracing spans (None disables tracing)
+    trace_file: Optional[str] = None
+    # Databases owned by another integration than ``token`` (one rate limit each)
+    database_tokens: Dict[DatabaseType, str] = field(default_factory=dict)
+
+    def tokens_by_database_id(self) -> Dict[str, str]:
+        """Database ID -> token, for the databases with their own token."""
+        return {
+            self.database_ids[db_type]: token
+            for db_type, token in self.database_tokens.items()
+            if self.database_ids.get(db_type)
+        }
 
 
 def load_config() -> NotionConfig:
-    """Load Notion credentials and database ids from environment variables."""
+    """Load Notion credentials and database ids from environment variables.
 
-    token = os.getenv("NOTION_API_TOKEN")
-    if not token:
-        raise ValueError("NOTION_API_TOKEN environment variable is required")
+    ``NOTION_API_TOKEN`` is the default integration token. A database owned
+    by another integration (another workspace, or just another rate limit)
+    takes its own token from ``NOTION_<TYPE>_API_TOKEN``, e.g.
+    ``NOTION_STUDIES_API_TOKEN``.
+    """
 
     database_ids = {
         DatabaseType.WORK: os.getenv("NOTION_WORK_DATABASE_ID", ""),
@@ -44,6 +83,23 @@ def load_config() -> NotionConfig:
         DatabaseType.PERSONAL: os.getenv("NOTION_PERSONAL_DATABASE_ID", ""),
         DatabaseType.YOUTUBER: os.getenv("NOTION_YOUTUBER_DATABASE_ID", ""),
     }
+    database_tokens = {
+        db_type: token
+        for db_type in database_ids
+        if (token := os.getenv(f"NOTION_{db_type.name}_API_TOKEN", "").strip())
+    }
+
+    token = os.getenv("NOTION_API_TOKEN")
+    if not token:
+        uncovered = [
+            db_type.value
+            for db_type, db_id in database_ids.items()
+            if db_id and db_type not in database_tokens
+        ]
+        if uncovered or not database_tokens:
+            raise ValueError("NOTION_API_TOKEN environment variable is required")
+        # Every configured database has its own token: the first is the default
+        token = next(iter(database_tokens.values()))
 
     for db_type, db_id in database_ids.items():
         if not db_id:
@@ -53,7 +109,79 @@ def load_config() -> NotionConfig:
                 message=f"No database ID configured for {db_type.value}",
             )
 
-    return NotionConfig(token=token, database_ids=database_ids)
+    sync_on_start = os.getenv(SYNC_ON_START_VARIABLE, "").strip().lower() in {"1", "true", "yes"}
+
+    poll_value = os.getenv(RESOURCE_POLL_VARIABLE, str(RESOURCE_POLL_INTERVAL_SECONDS))
+    try:
+        resource_poll_seconds = max(0.0, float(poll_value))
+    except ValueError as exc:
+        raise ValueError(f"{RESOURCE_POLL_VARIABLE} must be a number, got {poll_value!r}") from exc
+
+    budget_value = os.getenv(RESULT_BUDGET_VARIABLE, str(RESULT_BUDGET_BYTES))
+    try:
+        result_budget_bytes = max(0, int(budget_value))
+    except ValueError as exc:
+        raise ValueError(
+            f"{RESULT_BUDGET_VARIABLE} must be an integer, got {budget_value!r}"
+        ) from exc
+
+    return NotionConfig(
+        token=token,
+        database_ids=database_ids,
+        sync_on_start=sync_on_start,
+        resource_poll_seconds=resource_poll_seconds,
+        result_budget_bytes=result_budget_bytes,
+        metrics_file=os.getenv(METRICS_FILE_VARIABLE, "").strip() or None,
+        trace_file=os.getenv(TRACE_FILE_VARIABLE, "").strip() or None,
+        database_tokens=database_tokens,
+    )
+
+
+@dataclass(slots=True)
+class TransportConfig:
+    """How the server talks to clients."""
+
+    transport: str = "stdio"
+    host: str = DEFAULT_HOST
+    port: int = DEFAULT_PORT
+
+    @property
+    def shared(self) -> bool:
+        """Whether one process serves several clients (HTTP transports)."""
+        return self.transport != "stdio"
+
+
+def load_transport_config(argv: Optional[Sequence[str]] = None) -> TransportConfig:
+    """Select the transport from CLI flags, falling back to environment variables.
+
+    ``--transport`` / ``MCP_TRANSPORT`` is one of ``stdio`` (default),
+    ``streamable-http`` or ``sse``; ``--host`` / ``MCP_HOST`` and
+    ``--port`` / ``MCP_PORT`` apply to the HTTP transports.
+
+    Raises:
+        ValueError: If the transport or port is invalid
+    """
+
+    transport = os.getenv(TRANSPORT_VARIABLE, "stdio").strip().lower() or "stdio"
+    port_value = os.getenv(PORT_VARIABLE, str(DEFAULT_PORT))
+    try:
+        default_port = int(port_value)
+    except ValueError as exc:
+        raise ValueError(f"{PORT_VARIABLE} must be an integer, got {port_value!r}") from exc
+
+    parser = argparse.ArgumentParser(prog="notion-mcp-server")
+    parser.add_argument("--transport", choices=TRANSPORTS, default=None)
+    parser.add_argument("--host", default=os.getenv(HOST_VARIABLE, DEFAULT_HOST))
+    parser.add_argument("--port", type=int, default=default_port)
+    args = parser.parse_args(argv)
+
+    transport = args.transport or transport
+    if transport not in TRANSPORTS:
+        raise ValueError(f"{TRANSPORT_VARIABLE} must be one of {', '.join(TRANSPORTS)}")
+    if not 0 < args.port < 65536:
+        raise ValueError(f"Invalid port: {args.port}")
+
+    return TransportConfig(transport=transport, host=args.host, port=args.port)
 
 
 def load_environment() -> None:
@@ -80,10 +208,19 @@ def load_environment() -> None:
 
 
 def configure_logging() -> None:
-    """Configure structured logging for the MCP server."""
+    """Configure structured logging for the MCP server.
+
+    Records below ``LOG_LEVEL`` (default ``INFO``) are dropped before any
+    processor runs, so deferred payloads are never serialized for them.
+    """
 
     global _LOG_FILE_HANDLE
 
+    level_name = os.getenv(LOG_LEVEL_VARIABLE, "INFO").upper()
+    level = logging.getLevelName(level_name)
+    if not isinstance(level, int):
+        level = logging.INFO
+
     log_path = Path(os.getenv(LOG_FILE_VARIABLE, _DEFAULT_LOG_PATH))
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -97,5 +234,6 @@ def configure_logging() -> None:
             structlog.processors.JSONRenderer(),
         ],
         context_class=dict,
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         logger_factory=structlog.PrintLoggerFactory(file=_LOG_FILE_HANDLE),
     )
@@ -0,0 +1,159 @@
+"""Schema-driven dispatch of MCP tool calls.
+
+Each tool definition already carries a JSON ``inputSchema``. Instead of
+generating a typed Python function per tool (and letting FastMCP derive a
+pydantic model and a JSON schema back from it), a single generic dispatcher
+validates the arguments against a plan compiled once from the schema and
+forwards them to the provider's ``handle_tool_call``.
+
+Each call runs with a ``ProgressTracker`` bound, so bulk helpers and custom
+operations can report items done and the current stage; when the client
+asked for progress, updates are sent as MCP progress notifications. Results
+of top-level calls are fitted to the size budget of a ``ResultCache``.
+Every call opens a tracing span (see ``utils/tracing.py``) that the
+custom layer and ``NotionService`` nest under.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import structlog
+from mcp.server.fastmcp.tools.base import Tool
+from mcp.server.fastmcp.utilities.func_metadata import ArgModelBase, FuncMetadata
+from pydantic import ConfigDict
+
+from utils.metrics import METRICS
+from utils.progress import ProgressTracker, bind_tracker, current_tracker, reset_tracker
+from utils.tracing import KIND_INTERNAL, KIND_SERVER, TRACER
+
+from .arguments import ArgumentDecoder
+from .notifications import ProgressNotifier, has_progress_token
+from .results import ResultCache
+
+logger = structlog.get_logger(__name__)
+
+# Keyword under which FastMCP passes the request ``Context`` to the dispatcher
+CONTEXT_KWARG = "_mcp_context"
+
+ToolHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+class PassthroughArguments(ArgModelBase):
+    """Argument model that hands raw arguments to the dispatcher untouched."""
+
+    model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
+
+    def model_dump_one_level(self) -> Dict[str, Any]:
+        return dict(self.__pydantic_extra__ or {})
+
+
+_PASSTHROUGH_METADATA = FuncMetadata(arg_model=PassthroughArguments)
+
+
+class SchemaToolDispatcher:
+    """
+    Validate and forward tool arguments according to a JSON schema.
+
+    Decoding is delegated to an :class:`~runtime.arguments.ArgumentDecoder`
+    compiled once from the schema, so each call only walks the precompiled
+    field decoders. Nested calls (e.g., inside ``notion_batch``) return
+    full results; only the top-level result goes through ``results``.
+    """
+
+    def __init__(
+        self,
+        tool_name: str,
+        schema: Dict[str, Any],
+        handler: ToolHandler,
+        results: Optional[ResultCache] = None,
+    ):
+        self.tool_name = tool_name
+        self.handler = handler
+        self.results = results
+        self.__name__ = f"{tool_name}_impl".replace("-", "_")
+        self._decode = ArgumentDecoder(tool_name, schema)
+
+    async def __call__(self, **raw_arguments: Any) -> Any:
+        context = raw_arguments.pop(CONTEXT_KWARG, None)
+        nested = current_tracker() is not None  # E.g., a call inside notion_batch
+        with METRICS.tool_call(self.tool_name), TRACER.span(
+            f"tools/call {self.tool_name}",
+            KIND_INTERNAL if nested else KIND_SERVER,
+            **{"mcp.tool.name": self.tool_name},
+        ):
+            with TRACER.span("validate_arguments"):
+                arguments = self.prepare(raw_arguments)
+            if nested:
+                return await self.handler(arguments)
+            return await self._run(arguments, context)
+
+    async def _run(self, arguments: Dict[str, Any], context: Any) -> Any:
+        """Top-level call: progress tracking and notifications, then the result budget"""
+        notifier = ProgressNotifier(context) if has_progress_token(context) else None
+        tracker = ProgressTracker(partial_limit=0, on_change=notifier)
+        token = bind_tracker(tracker)
+        try:
+            result = await self.handler(arguments)
+        finally:
+            reset_tracker(token)
+            stage_timings = tracker.finish()
+            if notifier is not None:
+                await notifier.close()
+            if stage_timings:
+                logger.info(
+                    "tool_stages_completed",
+                    tool=self.tool_name,
+                    stage_timings_ms=stage_timings,
+                    **tracker.snapshot(),
+                )
+        if self.results is None:
+            return result
+        with TRACER.span("fit_result"):
+            return self.results.fit(self.tool_name, result)
+
+    def prepare(self, raw_arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the handler arguments from raw MCP arguments
+
+        Raises:
+            ValueError: If a required argument is missing or has the wrong type
+        """
+        return self._decode(raw_arguments)
+
+
+def build_tool(
+    definition: Dict[str, Any],
+    handler: ToolHandler,
+    results: Optional[ResultCache] = None,
+) -> Tool:
+    """
+    Create a FastMCP ``Tool`` straight from a tool definition
+
+    The definition's ``inputSchema`` is advertised as-is, so clients see the
+    enums, descriptions and nested item schemas declared in ``tools/*``.
+
+    Args:
+        definition: Tool metadata (``name``, ``description``, ``inputSchema``)
+        handler: Coroutine receiving the prepared arguments dict
+        results: Size budget for the tool's results (none: returned in full)
+
+    Returns:
+        Tool ready to be added to a FastMCP tool manager
+    """
+    name = definition["name"]
+    schema = definition.get("inputSchema") or {"type": "object", "properties": {}}
+    description = definition.get("description", "")
+
+    dispatcher = SchemaToolDispatcher(name, schema, handler, results)
+    dispatcher.__doc__ = description
+
+    return Tool(
+        fn=dispatcher,
+        name=name,
+        description=description,
+        parameters=schema,
+        fn_metadata=_PASSTHROUGH_METADATA,
+        is_async=True,
+        context_kwarg=CONTEXT_KWARG,
+    )
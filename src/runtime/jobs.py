@@ -0,0 +1,262 @@
+"""Background jobs for long-running tool calls.
+
+Bulk tools accept ``background: true``: the call is started as an asyncio
+task and a job ID is returned at once, so the MCP request does not stay
+open for the whole import. ``job_status``, ``job_result`` and
+``job_cancel`` expose progress counts, partial results and errors. Progress
+comes from the ``ProgressTracker`` bound to the job's context, which
+``gather_bounded`` and ``notion_batch`` report into.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import structlog
+
+from utils.constants import JOB_HISTORY_LIMIT
+from utils.progress import ProgressTracker, bind_tracker, reset_tracker
+
+logger = structlog.get_logger(__name__)
+
+# Tools that accept ``background`` (long bulk operations)
+BACKGROUND_TOOLS = frozenset(
+    {
+        "notion_batch",
+        "personal_use_template",
+        "study_create_course_complete",
+        "study_recompute_rollups",
+        "study_reschedule_section",
+        "work_create_sprint",
+        "youtuber_create_series",
+        "youtuber_schedule_recordings",
+    }
+)
+
+BACKGROUND_PROPERTY: Dict[str, Any] = {
+    "type": "boolean",
+    "default": False,
+    "description": (
+        "Run as a background job and return a job_id at once; follow it with "
+        "job_status / job_result."
+    ),
+}
+
+
+@dataclass
+class Job:
+    """A tool call running (or finished) in the background"""
+
+    job_id: str
+    tool: str
+    progress: ProgressTracker = field(default_factory=ProgressTracker)
+    status: str = "running"
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+    task: Optional["asyncio.Task[Any]"] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status != "running"
+
+    def describe(self) -> Dict[str, Any]:
+        """Status payload (no result)"""
+        end = self.finished_at or time.time()
+        payload: Dict[str, Any] = {
+            "job_id": self.job_id,
+            "tool": self.tool,
+            "status": self.status,
+            "progress": self.progress.snapshot(),
+            "elapsed_ms": round((end - self.created_at) * 1000, 1),
+        }
+        if self.error is not None:
+            payload["error"] = self.error
+        return payload
+
+
+class JobManager:
+    """
+    Start, track and cancel background jobs
+
+    Args:
+        history_limit: Finished jobs kept (oldest are forgotten first)
+    """
+
+    def __init__(self, history_limit: int = JOB_HISTORY_LIMIT):
+        self.history_limit = history_limit
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+
+    def start(self, tool: str, run: Callable[[], Awaitable[Any]]) -> Job:
+        """
+        Run ``run()`` as a background task with its own progress tracker
+
+        Args:
+            tool: Tool name (for status and logs)
+            run: Zero-argument coroutine factory performing the call
+
+        Returns:
+            The running job
+        """
+        job = Job(job_id=uuid.uuid4().hex[:12], tool=tool)
+
+        async def execute() -> None:
+            token = bind_tracker(job.progress)
+            try:
+                job.result = await run()
+                job.status = "succeeded"
+            except asyncio.CancelledError:
+                job.status = "cancelled"
+            except Exception as exc:  # noqa: BLE001 - surfaced through job_status
+                job.status = "failed"
+                job.error = f"{type(exc).__name__}: {exc}"
+            finally:
+                reset_tracker(token)
+                job.finished_at = time.time()
+                logger.info("background_job_finished", **job.describe())
+
+        self._jobs[job.job_id] = job
+        job.task = asyncio.create_task(execute(), name=f"job-{job.job_id}")
+        self._prune()
+        logger.info("background_job_started", job_id=job.job_id, tool=tool)
+        return job
+
+    def get(self, job_id: str) -> Job:
+        """
+        Job by ID
+
+        Raises:
+            ValueError: If the job is unknown (or was pruned)
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise ValueError(f"Unknown job: {job_id}")
+        return job
+
+    def list(self) -> List[Job]:
+        """Known jobs, most recent first"""
+        return list(reversed(self._jobs.values()))
+
+    async def cancel(self, job_id: str) -> Job:
+        """Cancel a running job and wait for it to stop"""
+        job = self.get(job_id)
+        if job.task is not None and not job.task.done():
+            job.task.cancel()
+            await asyncio.gather(job.task, return_exceptions=True)
+        return job
+
+    async def shutdown(self) -> None:
+        """Cancel every running job"""
+        running = [job.task for job in self._jobs.values() if job.task and not job.task.done()]
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(finished) - self.history_limit)]:
+            del self._jobs[job_id]
+
+
+def with_background(
+    definition: Dict[str, Any],
+    handler: Callable[[Dict[str, Any]], Awaitable[Any]],
+    jobs: JobManager,
+) -> tuple[Dict[str, Any], Callable[[Dict[str, Any]], Awaitable[Any]]]:
+    """
+    Add the ``background`` flag to a tool definition and its handler
+
+    Args:
+        definition: Tool metadata
+        handler: Handler receiving the prepared arguments
+        jobs: Manager running background calls
+
+    Returns:
+        ``(definition, handler)`` to register instead of the originals
+    """
+    name = definition["name"]
+    schema = definition.get("inputSchema") or {"type": "object", "properties": {}}
+    extended = {
+        **definition,
+        "inputSchema": {
+            **schema,
+            "properties": {**schema.get("properties", {}), "background": BACKGROUND_PROPERTY},
+        },
+    }
+
+    async def dispatch(arguments: Dict[str, Any]) -> Any:
+        if not arguments.pop("background", False):
+            return await handler(arguments)
+        job = jobs.start(name, lambda: handler(arguments))
+        return job.describe()
+
+    return extended, dispatch
+
+
+class JobTools:
+    """``job_status`` / ``job_result`` / ``job_cancel`` tools over a ``JobManager``"""
+
+    def __init__(self, jobs: JobManager):
+        self.jobs = jobs
+
+    def get_tools(self) -> List[Dict[str, Any]]:
+        job_id = {"type": "string", "description": "ID returned by a background call"}
+        return [
+            {
+                "name": "job_status",
+                "description": (
+                    "Progress of a background job (or of every recent job without job_id)."
+                ),
+                "inputSchema": {"type": "object", "properties": {"job_id": job_id}},
+            },
+            {
+                "name": "job_result",
+                "description": (
+                    "Result of a finished background job; partial results while it runs."
+                ),
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {"job_id": job_id},
+                    "required": ["job_id"],
+                },
+            },
+            {
+                "name": "job_cancel",
+                "description": "Cancel a running background job (created cards are kept).",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {"job_id": job_id},
+                    "required": ["job_id"],
+                },
+            },
+        ]
+
+    async def handle_tool_call(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        if tool_name == "job_status":
+            if arguments.get("job_id"):
+                return self.jobs.get(arguments["job_id"]).describe()
+            return {"jobs": [job.describe() for job in self.jobs.list()]}
+
+        if tool_name == "job_result":
+            job = self.jobs.get(arguments["job_id"])
+            payload = job.describe()
+            if job.status == "succeeded":
+                payload["result"] = job.result
+            else:
+                payload["partial"] = list(job.progress.partial)
+            return payload
+
+        if tool_name == "job_cancel":
+            job = await self.jobs.cancel(arguments["job_id"])
+            payload = job.describe()
+            payload["partial"] = list(job.progress.partial)
+            return payload
+
+        raise ValueError(f"Unknown job tool: {tool_name}")
@@ -0,0 +1,85 @@
+"""MCP progress notifications for long-running tool calls.
+
+When a client sends a ``progressToken`` with ``tools/call``, the dispatcher
+binds a ``ProgressTracker`` whose updates are forwarded to the client as
+``notifications/progress`` (done out of total, plus the current stage).
+Updates are coalesced: at most one notification per interval, always
+ending with the latest state.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Optional
+
+import structlog
+
+from utils.constants import PROGRESS_NOTIFY_INTERVAL
+from utils.progress import ProgressTracker
+
+logger = structlog.get_logger(__name__)
+
+
+def has_progress_token(context: Any) -> bool:
+    """Whether the request behind a FastMCP ``Context`` asked for progress"""
+    if context is None:
+        return False
+    try:
+        meta = context.request_context.meta
+    except (AttributeError, ValueError, LookupError):  # Outside of a request
+        return False
+    return meta is not None and getattr(meta, "progressToken", None) is not None
+
+
+class ProgressNotifier:
+    """
+    ``ProgressTracker.on_change`` callback sending MCP progress notifications
+
+    Args:
+        context: FastMCP ``Context`` of the request
+        interval: Minimum seconds between two notifications
+    """
+
+    def __init__(self, context: Any, interval: float = PROGRESS_NOTIFY_INTERVAL):
+        self._context = context
+        self.interval = interval
+        self._tracker: Optional[ProgressTracker] = None
+        self._version = 0
+        self._sent_version = 0
+        self._last_sent = float("-inf")
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def __call__(self, tracker: ProgressTracker) -> None:
+        self._tracker = tracker
+        self._version += 1
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._pump())
+
+    async def close(self) -> None:
+        """Stop the pending notification and send the final state"""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        if self._sent_version != self._version:
+            await self._send()
+
+    async def _pump(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._sent_version != self._version:
+            wait = self._last_sent + self.interval - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            await self._send()
+
+    async def _send(self) -> None:
+        tracker = self._tracker
+        if tracker is None:
+            return
+        self._sent_version = self._version
+        self._last_sent = asyncio.get_running_loop().time()
+        try:
+            await self._context.report_progress(
+                tracker.done + tracker.failed, tracker.total or None, tracker.message()
+            )
+        except Exception:  # noqa: BLE001 - progress is best effort
+            logger.debug("progress_notification_failed", exc_info=True)
@@ -0,0 +1,120 @@
+"""Registration of prebuilt tools, resource templates and subscriptions on FastMCP.
+
+FastMCP only registers tools and resource templates built from a Python
+function. Tools built from a JSON schema (``dispatch.build_tool``) and the
+query-aware card template (``resources.QueryResourceTemplate``) therefore go
+straight into its managers, and resource subscriptions are wired on its
+low-level server. That private access lives here only, and fails at import
+on an mcp release it was not written against, or on first use if the
+internals change shape.
+"""
+
+from __future__ import annotations
+
+from importlib.metadata import version
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping
+
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.resources import ResourceTemplate
+from mcp.server.fastmcp.tools.base import Tool
+from mcp.server.lowlevel import Server
+from pydantic import AnyUrl
+
+# Major mcp release whose FastMCP internals this module relies on
+SUPPORTED_MCP_MAJOR = 1
+
+MCP_VERSION = version("mcp")
+if int(MCP_VERSION.split(".")[0]) != SUPPORTED_MCP_MAJOR:
+    raise ImportError(
+        f"runtime.registry relies on FastMCP internals of mcp {SUPPORTED_MCP_MAJOR}.x; "
+        f"mcp {MCP_VERSION} is installed"
+    )
+
+
+def add_prebuilt_tool(app: FastMCP, tool: Tool) -> bool:
+    """
+    Register an already built ``Tool`` (skips signature introspection)
+
+    Args:
+        app: Target server
+        tool: Tool to register (replaces one with the same name)
+
+    Returns:
+        Whether a tool with the same name was already registered
+    """
+    tools = _registry(app, "_tool_manager", "_tools")
+    replaced = tool.name in tools
+    tools[tool.name] = tool
+    return replaced
+
+
+def registered_tools(app: FastMCP) -> List[Tool]:
+    """Tools registered so far, in registration order"""
+    return list(_registry(app, "_tool_manager", "_tools").values())
+
+
+def tools_by_name(app: FastMCP) -> Mapping[str, Tool]:
+    """Read-only live view of the registered tools (later registrations included)"""
+    return MappingProxyType(_registry(app, "_tool_manager", "_tools"))
+
+
+def add_resource_template(app: FastMCP, template: ResourceTemplate) -> None:
+    """
+    Register an already built ``ResourceTemplate`` (e.g., a subclass)
+
+    Args:
+        app: Target server
+        template: Template keyed by its ``uri_template``
+    """
+    _registry(app, "_resource_manager", "_templates")[template.uri_template] = template
+
+
+def enable_resource_subscriptions(
+    app: FastMCP,
+    on_subscribe: Callable[[str, Any], None],
+    on_unsubscribe: Callable[[str, Any], None],
+) -> None:
+    """
+    Handle ``resources/subscribe`` and advertise ``subscribe: true``
+
+    Args:
+        app: Target server
+        on_subscribe: Called with the resource URI and the requesting session
+        on_unsubscribe: Same, for ``resources/unsubscribe``
+    """
+    server = getattr(app, "_mcp_server", None)
+    if not isinstance(server, Server):
+        raise RuntimeError(
+            f"FastMCP._mcp_server is not a low-level Server in mcp {MCP_VERSION}; "
+            "update runtime/registry.py for this release"
+        )
+
+    @server.subscribe_resource()
+    async def _subscribe(uri: AnyUrl) -> None:
+        on_subscribe(str(uri), server.request_context.session)
+
+    @server.unsubscribe_resource()
+    async def _unsubscribe(uri: AnyUrl) -> None:
+        on_unsubscribe(str(uri), server.request_context.session)
+
+    # The low-level server always advertises ``subscribe: false``
+    get_capabilities = server.get_capabilities
+
+    def _capabilities(*args: Any, **kwargs: Any) -> Any:
+        capabilities = get_capabilities(*args, **kwargs)
+        if capabilities.resources is not None:
+            capabilities.resources.subscribe = True
+        return capabilities
+
+    server.get_capabilities = _capabilities  # type: ignore[method-assign]
+
+
+def _registry(app: FastMCP, manager: str, attribute: str) -> Dict[str, Any]:
+    registry = getattr(getattr(app, manager, None), attribute, None)
+    if not isinstance(registry, dict):
+        raise RuntimeError(
+            f"FastMCP.{manager}.{attribute} is not a dict in mcp {MCP_VERSION}; "
+            "update runtime/registry.py for this release"
+        )
+    return registry
@@ -0,0 +1,340 @@
+"""MCP resources backed by cached Notion data.
+
+``notion://database/{type}`` resources serve the database schema from a
+cache instead of calling ``get_database`` on every read. A low-frequency
+poller re-reads each schema and compares ``last_edited_time``; when it
+changed, sessions subscribed to the resource get
+``notifications/resources/updated`` and re-read it, so clients no longer
+need to poll.
+
+``notion://database/{type}/cards`` lists the cards of a database straight
+from the local ``CardStore`` mirror, as compact projections with keyset
+pagination (``?status=...&parent=...&limit=...&cursor=...``): browsing costs
+no API calls.
+
+``notion://metrics`` exposes the in-process metrics registry.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import weakref
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+import structlog
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.resources import ResourceTemplate
+from pydantic import AnyUrl
+
+from services.card_store import (
+    normalize_id,
+    property_date,
+    property_option,
+    property_relation_ids,
+    property_text,
+)
+from services.service_pool import NotionServicePool
+from utils import DATE_FIELD, RELATION_FIELD, TITLE_FIELD, DatabaseType
+from utils.constants import (
+    CARD_RESOURCE_MAX_PAGE_SIZE,
+    CARD_RESOURCE_PAGE_SIZE,
+    RESOURCE_POLL_INTERVAL_SECONDS,
+)
+from utils.metrics import METRICS
+
+from .registry import add_resource_template, enable_resource_subscriptions
+
+logger = structlog.get_logger(__name__)
+
+STATUS_FIELD = "Status"
+CARD_QUERY_PARAMETERS = ("status", "parent", "limit", "cursor")
+
+
+def database_uri(db_type: DatabaseType) -> str:
+    """URI of the schema resource of a database type"""
+    return f"notion://database/{db_type.value}"
+
+
+def cards_uri(db_type: DatabaseType) -> str:
+    """URI of the card list resource of a database type (without query)"""
+    return f"{database_uri(db_type)}/cards"
+
+
+class QueryParameters(Dict[str, Any]):
+    """
+    Query parameters of a matching URI, truthy even when empty
+
+    ``ResourceManager.get_resource`` only accepts a match when
+    ``template.matches(uri)`` is truthy, which would reject the bare URI.
+    """
+
+    def __bool__(self) -> bool:
+        return True
+
+
+class QueryResourceTemplate(ResourceTemplate):
+    """
+    Resource template whose parameters come from the URI query string
+
+    FastMCP templates only match ``{name}`` path segments. This template
+    matches its base URI with an optional query (``base?status=x``) and
+    passes the known query parameters to the function.
+    """
+
+    @property
+    def base_uri(self) -> str:
+        return self.uri_template.split("{", 1)[0]
+
+    def matches(self, uri: str) -> Dict[str, Any] | None:
+        path, _, query = uri.partition("?")
+        if path != self.base_uri:
+            return None
+        known = self.parameters.get("properties", {})
+        return QueryParameters(
+            (name, values[-1])
+            for name, values in parse_qs(query).items()
+            if name in known and values
+        )
+
+
+def register_metrics_resource(app: FastMCP) -> None:
+    """Register ``notion://metrics`` (snapshot of :data:`utils.metrics.METRICS`)"""
+
+    @app.resource(
+        "notion://metrics",
+        name="metrics",
+        title="Server Metrics",
+        description=(
+            "Latência por tool, chamadas à API do Notion por invocação, latência e status "
+            "por endpoint, 429, retries, acertos de cache e bytes trafegados."
+        ),
+        mime_type="application/json",
+    )
+    def _read_metrics() -> Dict[str, Any]:
+        return METRICS.snapshot()
+
+
+def project_card(page: Dict[str, Any], db_type: DatabaseType) -> Dict[str, Any]:
+    """Compact view of a stored page: what an agent needs to browse"""
+    properties = page.get("properties") or {}
+    period = property_date(properties.get(DATE_FIELD[db_type]))
+    parents = property_relation_ids(properties.get(RELATION_FIELD[db_type]))
+    return {
+        "id": page["id"],
+        "title": property_text(properties.get(TITLE_FIELD[db_type])),
+        "status": property_option(properties.get(STATUS_FIELD)),
+        "start": period.get("start"),
+        "end": period.get("end"),
+        "parent": parents[0] if parents else None,
+        "url": page.get("url"),
+        "last_edited_time": page.get("last_edited_time"),
+    }
+
+
+def _sort_key(card: Dict[str, Any]) -> Tuple[int, str, str]:
+    # Dated cards first, chronologically; ID breaks ties so the order is total
+    start = card.get("start") or ""
+    return (0 if start else 1, start, normalize_id(card["id"]))
+
+
+def _encode_cursor(key: Tuple[int, str, str]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[int, str, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        rank, start, page_id = json.loads(base64.urlsafe_b64decode(padded))
+        return (int(rank), str(start), str(page_id))
+    except (ValueError, TypeError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor}") from exc
+
+
+class DatabaseResources:
+    """
+    Cached database schema resources, their update subscriptions and the
+    card list resources served from the card store
+
+    Args:
+        pool: Services routed by database ID
+        database_ids: Configured databases
+    """
+
+    def __init__(self, pool: NotionServicePool, database_ids: Dict[DatabaseType, str | None]):
+        self.pool = pool
+        self.database_ids = {db_type: db_id for db_type, db_id in database_ids.items() if db_id}
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+        self._subscribers: Dict[str, "weakref.WeakSet[Any]"] = {}
+
+    def list_cards(
+        self,
+        db_type: DatabaseType,
+        status: Optional[str] = None,
+        parent: Optional[str] = None,
+        limit: int = CARD_RESOURCE_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        One page of stored cards of a database (no API call)
+
+        Args:
+            db_type: Database type
+            status: Only cards with this status
+            parent: Only children of this page ID
+            limit: Cards per page (capped at ``CARD_RESOURCE_MAX_PAGE_SIZE``)
+            cursor: ``next_cursor`` of the previous page
+
+        Returns:
+            Dict with ``cards``, ``next_cursor`` (``None`` on the last page),
+            ``total`` matching cards and ``synced_at`` (``None`` while the
+            mirror has not been fully listed yet)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        database_id = self.database_ids[db_type]
+        parent_id = normalize_id(parent) if parent else None
+        cards: List[Dict[str, Any]] = []
+        for page in self.pool.store.pages(database_id):
+            card = project_card(page, db_type)
+            if status is not None and card["status"] != status:
+                continue
+            if parent_id is not None and normalize_id(card["parent"]) != parent_id:
+                continue
+            cards.append(card)
+        cards.sort(key=_sort_key)
+
+        start = 0
+        if cursor:
+            start = bisect_right([_sort_key(card) for card in cards], _decode_cursor(cursor))
+        size = max(1, min(limit, CARD_RESOURCE_MAX_PAGE_SIZE))
+        page = cards[start : start + size]
+        has_more = start + size < len(cards)
+        synced_at = self.pool.store.synced_at(database_id)
+
+        return {
+            "cards": page,
+            "next_cursor": _encode_cursor(_sort_key(page[-1])) if has_more else None,
+            "total": len(cards),
+            "synced_at": synced_at.isoformat() if synced_at else None,
+        }
+
+    async def read(self, database_id: str) -> Dict[str, Any]:
+        """Cached schema of a database (fetched on first read)"""
+        schema = self._schemas.get(database_id)
+        METRICS.record_cache("database_schema", schema is not None)
+        if schema is None:
+            await self.refresh(database_id)
+            schema = self._schemas[database_id]
+        return schema
+
+    async def refresh(self, database_id: str) -> bool:
+        """
+        Re-read a schema and update the cache
+
+        Returns:
+            True if a cached schema changed (``last_edited_time`` differs)
+        """
+        schema = await self.pool.for_database(database_id).get_database(database_id)
+        previous = self._schemas.get(database_id)
+        self._schemas[database_id] = schema
+        return previous is not None and (
+            previous.get("last_edited_time") != schema.get("last_edited_time")
+        )
+
+    async def poll(self) -> int:
+        """
+        Refresh every database once and notify subscribers of changed ones
+
+        Returns:
+            Number of changed schemas
+        """
+        changed = 0
+        for db_type, database_id in self.database_ids.items():
+            try:
+                if not await self.refresh(database_id):
+                    continue
+            except Exception as exc:  # noqa: BLE001 - keep polling the others
+                logger.warning(
+                    "resource_poll_failed", database_type=db_type.value, error=str(exc)
+                )
+                continue
+            changed += 1
+            logger.info("database_schema_changed", database_type=db_type.value)
+            await self.notify(database_uri(db_type))
+        return changed
+
+    async def poll_forever(self, interval: float = RESOURCE_POLL_INTERVAL_SECONDS) -> None:
+        """Run ``poll`` every ``interval`` seconds until cancelled"""
+        while True:
+            await asyncio.sleep(interval)
+            await self.poll()
+
+    def subscribe(self, uri: str, session: Any) -> None:
+        """Send updates of ``uri`` to ``session`` (dropped once the session is gone)"""
+        self._subscribers.setdefault(uri, weakref.WeakSet()).add(session)
+
+    def unsubscribe(self, uri: str, session: Any) -> None:
+        """Stop sending updates of ``uri`` to ``session``"""
+        subscribers = self._subscribers.get(uri)
+        if subscribers is not None:
+            subscribers.discard(session)
+
+    async def notify(self, uri: str) -> None:
+        """Send ``notifications/resources/updated`` to the subscribers of ``uri``"""
+        for session in list(self._subscribers.get(uri, ())):
+            try:
+                await session.send_resource_updated(AnyUrl(uri))
+            except Exception:  # noqa: BLE001 - closed session
+                self.unsubscribe(uri, session)
+
+    def register(self, app: FastMCP) -> None:
+        """Register the resources and the subscribe/unsubscribe handlers on ``app``"""
+        for db_type, database_id in self.database_ids.items():
+            self._register_database(app, db_type, database_id)
+            self._register_cards(app, db_type)
+
+        enable_resource_subscriptions(app, self.subscribe, self.unsubscribe)
+
+    def _register_database(self, app: FastMCP, db_type: DatabaseType, database_id: str) -> None:
+        @app.resource(
+            database_uri(db_type),
+            name=f"{db_type.value}-database",
+            title=f"{db_type.value.title()} Database",
+            description=f"Esquema completo da base {db_type.value}.",
+            mime_type="application/json",
+        )
+        async def _read_database() -> Dict[str, Any]:
+            return await self.read(database_id)
+
+    def _register_cards(self, app: FastMCP, db_type: DatabaseType) -> None:
+        def read_cards(
+            status: Optional[str] = None,
+            parent: Optional[str] = None,
+            limit: int = CARD_RESOURCE_PAGE_SIZE,
+            cursor: Optional[str] = None,
+        ) -> Dict[str, Any]:
+            return self.list_cards(db_type, status, parent, limit, cursor)
+
+        template = QueryResourceTemplate.from_function(
+            read_cards,
+            uri_template=f"{cards_uri(db_type)}{{?{','.join(CARD_QUERY_PARAMETERS)}}}",
+            name=f"{db_type.value}-cards",
+            title=f"{db_type.value.title()} Cards",
+            description=(
+                f"Cards da base {db_type.value} vindos do espelho local (sem chamadas à API), "
+                "paginados por next_cursor."
+            ),
+            mime_type="application/json",
+        )
+        add_resource_template(app, template)
+
+    def start_polling(self, interval: float) -> Optional["asyncio.Task[None]"]:
+        """Start the poller (``None`` when disabled or nothing is configured)"""
+        if interval <= 0 or not self.database_ids:
+            return None
+        return asyncio.create_task(self.poll_forever(interval), name="resource-poller")
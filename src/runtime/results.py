@@ -0,0 +1,231 @@
+"""Size budget for tool results, with server-side continuation.
+
+A query or a full course import can return hundreds of kilobytes of JSON:
+slow to serialize and transmit, and expensive for the agent's context.
+Results over the budget are cut down to what fits, the largest list
+(``results``, ``phases``, ``changes``...) keeps its first items, and a
+``continuation`` entry carries a token. ``notion_result_continue`` serves
+the remaining items from a small cache, one budget-sized page at a time.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import structlog
+
+from utils.constants import RESULT_BUDGET_BYTES, RESULT_CACHE_LIMIT, RESULT_CACHE_TTL_SECONDS
+
+logger = structlog.get_logger(__name__)
+
+CONTINUE_TOOL_NAME = "notion_result_continue"
+
+
+def _size(value: Any) -> int:
+    return len(json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str).encode())
+
+
+@dataclass
+class _CachedResult:
+    tool: str
+    field: Optional[str]  # None: the result itself was the list (or JSON text chunks)
+    items: List[Any]
+    text: bool  # Items are chunks of the serialized result
+    expires_at: float
+    next_offset: Optional[int] = None
+
+
+class ResultCache:
+    """
+    Fit tool results into a size budget and keep the rest for continuation
+
+    Args:
+        budget_bytes: Largest serialized result returned as is (<= 0 disables)
+        limit: Truncated results kept (least recently used are dropped)
+        ttl_seconds: How long a continuation token stays valid
+        clock: Monotonic clock (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        budget_bytes: int = RESULT_BUDGET_BYTES,
+        limit: int = RESULT_CACHE_LIMIT,
+        ttl_seconds: float = RESULT_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.budget_bytes = budget_bytes
+        self.limit = limit
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, _CachedResult]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def fit(self, tool: str, result: Any) -> Any:
+        """
+        Return ``result`` unchanged if it fits the budget, else its first page
+
+        The first page keeps every field except the largest list, which is
+        cut to the items that fit; ``continuation`` tells how to get the rest.
+        """
+        if self.budget_bytes <= 0:
+            return result
+        size = _size(result)
+        if size <= self.budget_bytes:
+            return result
+
+        field, items = _pageable(result)
+        text = items is None
+        if text:
+            # No list to page through: serve the JSON text in chunks
+            serialized = json.dumps(result, ensure_ascii=False, default=str)
+            chunk = max(1, self.budget_bytes // 8)
+            items = [serialized[i : i + chunk] for i in range(0, len(serialized), chunk)]
+        rest = _size({**result, field: []}) if field is not None else 0
+
+        page, next_offset = self._take(items, 0, self.budget_bytes - rest)
+        token = self._store(_CachedResult(tool, field, items, text, 0.0, next_offset))
+
+        if text:
+            head: Dict[str, Any] = {"chunk": "".join(page)}
+        elif field is None:
+            head = {"items": page}
+        else:
+            head = {**result, field: page}
+        head["continuation"] = {
+            "token": token,
+            "field": field,
+            "returned": len(page),
+            "total": len(items),
+            "next_offset": next_offset,
+            "size_bytes": size,
+            "tool": CONTINUE_TOOL_NAME,
+        }
+        logger.info(
+            "tool_result_truncated",
+            tool=tool,
+            size_bytes=size,
+            budget_bytes=self.budget_bytes,
+            field=field,
+            returned=len(page),
+            total=len(items),
+        )
+        return head
+
+    def next(self, token: str, offset: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Next page of a truncated result
+
+        Args:
+            token: ``continuation.token`` of the truncated result
+            offset: First item to return (default: after the last page served)
+
+        Raises:
+            ValueError: If the token is unknown or expired
+        """
+        self._expire()
+        entry = self._entries.get(token)
+        if entry is None:
+            raise ValueError(f"Unknown or expired continuation token: {token}")
+        self._entries.move_to_end(token)
+
+        start = entry.next_offset if offset is None else offset
+        start = min(max(0, start or 0), len(entry.items))
+        page, next_offset = self._take(entry.items, start, self.budget_bytes)
+        entry.next_offset = next_offset
+
+        payload: Dict[str, Any] = {
+            "token": token,
+            "tool": entry.tool,
+            "field": entry.field,
+            "offset": start,
+            "next_offset": next_offset,
+            "total": len(entry.items),
+        }
+        if entry.text:
+            payload["chunk"] = "".join(page)
+        else:
+            payload["items"] = page
+        return payload
+
+    def _take(self, items: List[Any], start: int, budget: int) -> Tuple[List[Any], Optional[int]]:
+        """Items from ``start`` that fit ``budget`` (at least one)"""
+        page: List[Any] = []
+        used = 2  # Brackets
+        index = start
+        while index < len(items):
+            cost = _size(items[index]) + 1
+            if page and used + cost > budget:
+                break
+            page.append(items[index])
+            used += cost
+            index += 1
+        return page, (index if index < len(items) else None)
+
+    def _store(self, entry: _CachedResult) -> str:
+        self._expire()
+        token = uuid.uuid4().hex[:16]
+        entry.expires_at = self._clock() + self.ttl_seconds
+        self._entries[token] = entry
+        while len(self._entries) > self.limit:
+            self._entries.popitem(last=False)
+        return token
+
+    def _expire(self) -> None:
+        now = self._clock()
+        for token in [token for token, entry in self._entries.items() if entry.expires_at <= now]:
+            del self._entries[token]
+
+
+def _pageable(result: Any) -> Tuple[Optional[str], Optional[List[Any]]]:
+    """The list worth paging: the result itself or its largest list field"""
+    if isinstance(result, list):
+        return None, result
+    if not isinstance(result, dict):
+        return None, None
+    lists = [(key, value) for key, value in result.items() if isinstance(value, list) and value]
+    if not lists:
+        return None, None
+    key, value = max(lists, key=lambda item: _size(item[1]))
+    return key, value
+
+
+class ResultTools:
+    """``notion_result_continue`` over a ``ResultCache``"""
+
+    def __init__(self, results: ResultCache):
+        self.results = results
+
+    def get_tools(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "name": CONTINUE_TOOL_NAME,
+                "description": (
+                    "Fetch the rest of a tool result that was truncated to the size budget "
+                    "(use continuation.token; call again until next_offset is null)."
+                ),
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "token": {"type": "string", "description": "continuation.token"},
+                        "offset": {
+                            "type": "integer",
+                            "minimum": 0,
+                            "description": "First item (default: continue after the last page)",
+                        },
+                    },
+                    "required": ["token"],
+                },
+            }
+        ]
+
+    async def handle_tool_call(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        if tool_name == CONTINUE_TOOL_NAME:
+            return self.results.next(arguments["token"], arguments.get("offset"))
+        raise ValueError(f"Unknown result tool: {tool_name}")
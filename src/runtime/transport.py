@@ -0,0 +1,62 @@
+"""Transport runners for the Notion MCP server.
+
+``stdio`` serves a single client per process. The HTTP transports
+(``streamable-http`` and ``sse``) keep one long-running process on the
+configured host/port, so several editors and agents share the same warm
+``NotionService``: one HTTP pool, one rate limiter and one card store.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+import anyio
+import structlog
+
+from .app import DeferredToolsFastMCP
+from .config import TransportConfig
+
+logger = structlog.get_logger(__name__)
+
+
+def serve(app: DeferredToolsFastMCP, transport: TransportConfig) -> None:
+    """Run the server with the selected transport (blocks until shutdown)."""
+    if not transport.shared:
+        app.run("stdio")
+        return
+    anyio.run(_serve_http, app, transport)
+
+
+async def _serve_http(app: DeferredToolsFastMCP, transport: TransportConfig) -> None:
+    import uvicorn
+
+    if transport.transport == "streamable-http":
+        starlette_app = app.streamable_http_app()
+    else:
+        starlette_app = app.sse_app()
+
+    # Hold the shared runtime for the life of the server, around the session
+    # manager: sessions come and go without closing the warm service.
+    manager_lifespan = starlette_app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(instance: Any) -> AsyncIterator[None]:
+        async with app.runtime.hold(), manager_lifespan(instance):
+            yield
+
+    starlette_app.router.lifespan_context = lifespan
+
+    logger.info(
+        "http_transport_starting",
+        transport=transport.transport,
+        host=transport.host,
+        port=transport.port,
+    )
+    config = uvicorn.Config(
+        starlette_app,
+        host=transport.host,
+        port=transport.port,
+        log_level=app.settings.log_level.lower(),
+    )
+    await uvicorn.Server(config).serve()
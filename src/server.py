@@ -2,15 +2,40 @@
 
 from __future__ import annotations
 
-from runtime import configure_logging, create_fastmcp_app, load_environment
+from utils.timing import PhaseTimer
 
 
 def main() -> None:
-    """Load configuration and start the FastMCP stdio server."""
-    load_environment()
-    configure_logging()
-    app = create_fastmcp_app()
-    app.run("stdio")
+    """Load configuration and start the FastMCP server.
+
+    The transport is stdio unless ``--transport`` (or ``MCP_TRANSPORT``)
+    selects ``streamable-http`` or ``sse``.
+    """
+    timer = PhaseTimer()
+
+    with timer.phase("import_runtime"):
+        import structlog
+
+        from runtime import (
+            configure_logging,
+            create_fastmcp_app,
+            load_environment,
+            load_transport_config,
+            serve,
+        )
+
+    with timer.phase("load_environment"):
+        load_environment()
+        transport = load_transport_config()
+    with timer.phase("configure_logging"):
+        configure_logging()
+    with timer.phase("create_app"):
+        app = create_fastmcp_app(transport)
+
+    structlog.get_logger(__name__).info(
+        "server_boot", transport=transport.transport, timings_ms=timer.as_dict()
+    )
+    serve(app, transport)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 """Service layer for Notion API"""
 
 from .notion_service import NotionService
+from .service_pool import NotionServicePool
 
-__all__ = ["NotionService"]
+__all__ = ["NotionService", "NotionServicePool"]
@@ -0,0 +1,333 @@
+"""
+In-memory store of Notion pages seen by a NotionService.
+
+Every page returned by create/update/get/query responses is ingested, so
+the store stays warm without extra requests. On top of it a dedup index
+maps (database, normalized title, parent, date) to a page ID, which lets
+idempotent creates return an existing card with no round trip, and a
+``ScheduleIndex`` holds the timed periods used for conflict checks.
+"""
+
+import asyncio
+import re
+import unicodedata
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import structlog
+
+from .schedule_index import ScheduleIndex, normalize_id
+
+logger = structlog.get_logger(__name__)
+
+DedupKey = Tuple[str, str, str, str]
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass(frozen=True, slots=True)
+class DatabaseFields:
+    """Property names used to build dedup keys for one database"""
+
+    title: str
+    relation: Optional[str] = None
+    date: Optional[str] = None
+
+
+def normalize_title(title: str) -> str:
+    """Casefold and collapse whitespace so trivial title variations collide"""
+    normalized = unicodedata.normalize("NFC", title or "")
+    return _WHITESPACE.sub(" ", normalized).strip().casefold()
+
+
+def normalize_date(value: Optional[str]) -> str:
+    """Render a Notion date (``YYYY-MM-DD`` or ISO datetime) as a comparable string"""
+    if not value:
+        return ""
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return value
+    if "T" not in value:
+        return parsed.date().isoformat()
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc)
+    return parsed.replace(microsecond=0).isoformat()
+
+
+def property_text(prop: Optional[Dict[str, Any]]) -> str:
+    """Plain text of a title/rich_text property (request or response shape)"""
+    if not prop:
+        return ""
+    items = prop.get("title")
+    if items is None:
+        items = prop.get("rich_text") or []
+    return "".join(
+        item.get("plain_text") or (item.get("text") or {}).get("content", "") for item in items
+    )
+
+
+def property_relation_ids(prop: Optional[Dict[str, Any]]) -> List[str]:
+    """Related page IDs of a relation property"""
+    if not prop:
+        return []
+    return [item.get("id", "") for item in prop.get("relation") or []]
+
+
+def property_option(prop: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Option name of a status/select property"""
+    if not prop:
+        return None
+    option = prop.get("status") or prop.get("select") or {}
+    return option.get("name")
+
+
+def property_date(prop: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """``{"start", "end"}`` of a date property (empty dict when unset)"""
+    if not prop:
+        return {}
+    return prop.get("date") or {}
+
+
+class CardStore:
+    """
+    Pages by ID plus a dedup index per registered database
+
+    Pages from databases that are not registered yet are kept and indexed
+    as soon as their fields are registered.
+    """
+
+    def __init__(self) -> None:
+        self._pages: Dict[str, Dict[str, Any]] = {}
+        self._database_of: Dict[str, str] = {}
+        self._fields: Dict[str, DatabaseFields] = {}
+        self._dedup: Dict[DedupKey, str] = {}
+        self._key_of: Dict[str, DedupKey] = {}
+        self._pending: Dict[DedupKey, "asyncio.Future[Dict[str, Any]]"] = {}
+        self._synced_at: Dict[str, datetime] = {}
+        self.schedule = ScheduleIndex()
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def register_database(
+        self,
+        database_id: str,
+        title_field: str,
+        relation_field: Optional[str] = None,
+        date_field: Optional[str] = None,
+    ) -> None:
+        """
+        Declare the property names of a database and index its known pages
+
+        Args:
+            database_id: Database ID
+            title_field: Title property name
+            relation_field: Parent relation property name
+            date_field: Date property name
+        """
+        database = normalize_id(database_id)
+        self._fields[database] = DatabaseFields(title_field, relation_field, date_field)
+        for page_id, page_database in self._database_of.items():
+            if page_database == database:
+                self._index(page_id)
+
+    def ingest(self, response: Any, database_id: Optional[str] = None) -> None:
+        """
+        Ingest a page, or the ``results`` of a query response
+
+        Args:
+            response: Notion API response
+            database_id: Database the page belongs to, when the response
+                does not carry its parent (e.g., trimmed create responses)
+        """
+        if not isinstance(response, dict):
+            return
+        if response.get("object") == "list":
+            for page in response.get("results") or []:
+                self._ingest_page(page, database_id)
+            return
+        self._ingest_page(response, database_id)
+
+    def ingest_many(
+        self, pages: Iterable[Dict[str, Any]], database_id: Optional[str] = None
+    ) -> None:
+        """Ingest several pages"""
+        for page in pages:
+            self._ingest_page(page, database_id)
+
+    def get(self, page_id: str) -> Optional[Dict[str, Any]]:
+        """Stored page by ID"""
+        return self._pages.get(normalize_id(page_id))
+
+    def database_of(self, page_id: str) -> Optional[str]:
+        """Normalized ID of the database a stored page belongs to"""
+        return self._database_of.get(normalize_id(page_id))
+
+    def title(self, page_id: str) -> str:
+        """Title of a stored page from a registered database ("" when unknown)"""
+        page_id = normalize_id(page_id)
+        fields = self._fields.get(self._database_of.get(page_id, ""))
+        page = self._pages.get(page_id)
+        if fields is None or page is None:
+            return ""
+        return property_text((page.get("properties") or {}).get(fields.title))
+
+    def pages(self, database_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Stored pages, optionally restricted to one database"""
+        if database_id is None:
+            yield from self._pages.values()
+            return
+        database = normalize_id(database_id)
+        for page_id, page in self._pages.items():
+            if self._database_of.get(page_id) == database:
+                yield page
+
+    def dedup_key(self, database_id: str, properties: Dict[str, Any]) -> Optional[DedupKey]:
+        """
+        Dedup key for page properties (request or response shape)
+
+        Returns:
+            ``(database, title, parent, date)`` or ``None`` when the
+            database is not registered or the title is empty
+        """
+        database = normalize_id(database_id)
+        fields = self._fields.get(database)
+        if fields is None:
+            return None
+
+        title = normalize_title(property_text(properties.get(fields.title)))
+        if not title:
+            return None
+
+        parents = property_relation_ids(properties.get(fields.relation)) if fields.relation else []
+        parent = normalize_id(parents[0]) if parents else ""
+        start = property_date(properties.get(fields.date)).get("start") if fields.date else None
+        return (database, title, parent, normalize_date(start))
+
+    def find(self, key: Optional[DedupKey]) -> Optional[Dict[str, Any]]:
+        """Stored page matching a dedup key"""
+        if key is None:
+            return None
+        page_id = self._dedup.get(key)
+        return self._pages.get(page_id) if page_id else None
+
+    def pending(self, key: DedupKey) -> "Optional[asyncio.Future[Dict[str, Any]]]":
+        """Creation in flight for ``key``, if any"""
+        return self._pending.get(key)
+
+    def begin(self, key: DedupKey) -> "asyncio.Future[Dict[str, Any]]":
+        """Mark a creation for ``key`` as in flight"""
+        future: "asyncio.Future[Dict[str, Any]]" = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        return future
+
+    def finish(
+        self,
+        key: DedupKey,
+        page: Optional[Dict[str, Any]] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Resolve an in-flight creation"""
+        future = self._pending.pop(key, None)
+        if future is None or future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+            # Waiters may not exist; avoid "exception was never retrieved"
+            future.exception()
+        else:
+            future.set_result(page or {})
+
+    def discard(self, page_id: str) -> None:
+        """Forget a page (e.g., archived)"""
+        page_id = normalize_id(page_id)
+        self._pages.pop(page_id, None)
+        self._database_of.pop(page_id, None)
+        self._unindex(page_id)
+
+    def prune(self, database_id: str, keep: Iterable[str]) -> int:
+        """
+        Forget pages of a database missing from a full listing
+
+        The database is then considered mirrored (see ``synced_at``).
+
+        Args:
+            database_id: Database that was fully listed
+            keep: IDs returned by the listing
+
+        Returns:
+            Number of pages dropped
+        """
+        database = normalize_id(database_id)
+        kept = {normalize_id(page_id) for page_id in keep}
+        stale = [
+            page_id
+            for page_id, page_database in self._database_of.items()
+            if page_database == database and page_id not in kept
+        ]
+        for page_id in stale:
+            self.discard(page_id)
+        self._synced_at[database] = datetime.now(timezone.utc)
+        return len(stale)
+
+    def synced_at(self, database_id: str) -> Optional[datetime]:
+        """When a database was last fully listed (``None``: partial mirror)"""
+        return self._synced_at.get(normalize_id(database_id))
+
+    def clear(self) -> None:
+        """Drop every stored page"""
+        self._pages.clear()
+        self._database_of.clear()
+        self._dedup.clear()
+        self._key_of.clear()
+        self._synced_at.clear()
+        self.schedule.clear()
+
+    def _ingest_page(self, page: Any, database_id: Optional[str]) -> None:
+        if not isinstance(page, dict) or not page.get("id"):
+            return
+        if page.get("object", "page") != "page":
+            return
+
+        page_id = normalize_id(page["id"])
+        if page.get("archived") or page.get("in_trash"):
+            self.discard(page_id)
+            return
+
+        parent = page.get("parent") or {}
+        database = normalize_id(parent.get("database_id") or database_id)
+        if not database:
+            database = self._database_of.get(page_id, "")
+
+        if "properties" not in page and page_id in self._pages:
+            # Partial response: keep the richer stored copy
+            return
+
+        self._pages[page_id] = page
+        if database:
+            self._database_of[page_id] = database
+        self._index(page_id)
+
+    def _index(self, page_id: str) -> None:
+        self._unindex(page_id)
+        database = self._database_of.get(page_id)
+        page = self._pages.get(page_id)
+        if not database or page is None:
+            return
+        properties = page.get("properties") or {}
+        fields = self._fields.get(database)
+        if fields is not None and fields.date:
+            self.schedule.add(page_id, property_date(properties.get(fields.date)), database)
+        key = self.dedup_key(database, properties)
+        if key is None:
+            return
+        self._dedup[key] = page_id
+        self._key_of[page_id] = key
+
+    def _unindex(self, page_id: str) -> None:
+        self.schedule.remove(page_id)
+        key = self._key_of.pop(page_id, None)
+        if key is not None and self._dedup.get(key) == page_id:
+            del self._dedup[key]
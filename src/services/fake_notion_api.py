@@ -0,0 +1,617 @@
+"""
+In-process stand-in for the Notion API, served through an httpx transport.
+
+``FakeNotionAPI`` keeps databases, pages, blocks and users in memory and
+answers the endpoints ``NotionService`` calls (pages, database query with
+filters, sorts and cursors, block children, users and search) with
+Notion-shaped payloads and errors. Latency, jitter, rate limiting (429 with
+``Retry-After``) and random server errors are configurable, so throughput
+work (rate limiter, bulk helpers, jobs, dedup) can be measured offline.
+
+Example:
+    >>> api = FakeNotionAPI(latency_seconds=0.05, rate_limit_per_second=3)
+    >>> database_id = api.add_database("Studies", {"Name": "title", "Status": "status"})
+    >>> service = NotionService(token="fake", transport=api)
+"""
+
+import asyncio
+import json
+import random
+import re
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from utils.metrics import endpoint_template
+
+from .card_store import normalize_date, normalize_id, property_text
+
+# Property types whose value is rich text / a list
+TEXT_TYPES = ("title", "rich_text")
+LIST_TYPES = ("title", "rich_text", "multi_select", "relation", "people", "files")
+
+_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "equals": lambda value, target: value == target,
+    "does_not_equal": lambda value, target: value != target,
+    "contains": lambda value, target: value is not None and target in value,
+    "does_not_contain": lambda value, target: value is None or target not in value,
+    "starts_with": lambda value, target: (value or "").startswith(target),
+    "ends_with": lambda value, target: (value or "").endswith(target),
+    "greater_than": lambda value, target: value is not None and value > target,
+    "less_than": lambda value, target: value is not None and value < target,
+    "greater_than_or_equal_to": lambda value, target: value is not None and value >= target,
+    "less_than_or_equal_to": lambda value, target: value is not None and value <= target,
+    "before": lambda value, target: value is not None and value < target,
+    "after": lambda value, target: value is not None and value > target,
+    "on_or_before": lambda value, target: value is not None and value <= target,
+    "on_or_after": lambda value, target: value is not None and value >= target,
+    "is_empty": lambda value, target: value in (None, "", []),
+    "is_not_empty": lambda value, target: value not in (None, "", []),
+}
+
+_ID = r"(?P<id>[^/]+)"
+_ROUTES: List[Tuple[str, "re.Pattern[str]", str]] = [
+    (method, re.compile(f"{pattern}$"), handler)
+    for method, pattern, handler in (
+        ("POST", "pages", "_create_page"),
+        ("GET", f"pages/{_ID}", "_get_page"),
+        ("PATCH", f"pages/{_ID}", "_update_page"),
+        ("GET", f"databases/{_ID}", "_get_database"),
+        ("POST", f"databases/{_ID}/query", "_query_database"),
+        ("GET", f"blocks/{_ID}/children", "_list_children"),
+        ("PATCH", f"blocks/{_ID}/children", "_append_children"),
+        ("GET", f"blocks/{_ID}", "_get_block"),
+        ("PATCH", f"blocks/{_ID}", "_update_block"),
+        ("DELETE", f"blocks/{_ID}", "_delete_block"),
+        ("GET", "users/me", "_get_me"),
+        ("GET", f"users/{_ID}", "_get_user"),
+        ("GET", "users", "_list_users"),
+        ("POST", "search", "_search"),
+    )
+]
+
+
+class FakeNotionError(Exception):
+    """Error answered as a Notion error object"""
+
+    def __init__(self, status: int, code: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+
+
+class FakeNotionAPI(httpx.AsyncBaseTransport):
+    """
+    In-memory Notion API usable as the transport of ``NotionService``
+
+    Args:
+        latency_seconds: Delay added to every response
+        jitter_seconds: Extra random delay, uniform in ``[0, jitter_seconds]``
+        rate_limit_per_second: Average requests accepted per second (token
+            bucket); beyond, the API answers 429 (``None`` disables)
+        rate_limit_burst: Bucket capacity (default: twice the rate, since
+            Notion tolerates short bursts above its average)
+        rate_limit_probability: Chance of answering 429 regardless of rate
+        error_probability: Chance of answering 503 ``service_unavailable``
+        retry_after_seconds: ``Retry-After`` header of 429 responses
+        seed: Seed of the random source (jitter and injected failures)
+    """
+
+    def __init__(
+        self,
+        latency_seconds: float = 0.0,
+        jitter_seconds: float = 0.0,
+        rate_limit_per_second: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        rate_limit_probability: float = 0.0,
+        error_probability: float = 0.0,
+        retry_after_seconds: int = 1,
+        seed: Optional[int] = None,
+    ):
+        self.latency_seconds = latency_seconds
+        self.jitter_seconds = jitter_seconds
+        self.rate_limit_per_second = rate_limit_per_second
+        self.rate_limit_burst = rate_limit_burst
+        self.rate_limit_probability = rate_limit_probability
+        self.error_probability = error_probability
+        self.retry_after_seconds = retry_after_seconds
+        self._random = random.Random(seed)
+        self._tokens: Optional[float] = None
+        self._refilled = time.monotonic()
+
+        self.databases: Dict[str, Dict[str, Any]] = {}
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        self.blocks: Dict[str, Dict[str, Any]] = {}
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self._children: Dict[str, List[str]] = {}
+        # Requests per "METHOD endpoint" and per answered status
+        self.requests: Counter = Counter()
+        self.statuses: Counter = Counter()
+
+        self.bot = self._add_user({"type": "bot", "name": "Fake Integration", "bot": {}})
+
+    # ========== STATE ==========
+
+    def add_database(
+        self,
+        title: str,
+        properties: Optional[Dict[str, str]] = None,
+        database_id: Optional[str] = None,
+    ) -> str:
+        """
+        Create a database
+
+        Args:
+            title: Database title
+            properties: Property name -> type (default: ``{"Name": "title"}``);
+                pages may only set properties of this schema
+            database_id: ID to use (default: a new UUID)
+
+        Returns:
+            Database ID
+        """
+        database_id = database_id or str(uuid.uuid4())
+        now = _now()
+        self.databases[normalize_id(database_id)] = {
+            "object": "database",
+            "id": database_id,
+            "title": [_rich_text(title)],
+            "properties": {
+                name: {"id": _short_id(name), "name": name, "type": kind, kind: {}}
+                for name, kind in (properties or {"Name": "title"}).items()
+            },
+            "created_time": now,
+            "last_edited_time": now,
+            "archived": False,
+            "url": _url(database_id),
+        }
+        return database_id
+
+    def add_user(self, name: str, email: Optional[str] = None) -> str:
+        """Add a person to the workspace and return its ID"""
+        return self._add_user({"type": "person", "name": name, "person": {"email": email}})["id"]
+
+    def _add_user(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        user = {"object": "user", "id": str(uuid.uuid4()), "avatar_url": None, **fields}
+        self.users[normalize_id(user["id"])] = user
+        return user
+
+    # ========== TRANSPORT ==========
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.split("/v1/", 1)[-1].strip("/")
+        self.requests[f"{request.method} {endpoint_template(path)}"] += 1
+
+        delay = self.latency_seconds + self._random.uniform(0, self.jitter_seconds)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        try:
+            self._check_faults(request)
+            body = json.loads(request.content) if request.content else {}
+            status, payload = 200, self._route(request.method, path, body, request.url.params)
+        except FakeNotionError as exc:
+            status = exc.status
+            payload = {
+                "object": "error",
+                "status": exc.status,
+                "code": exc.code,
+                "message": exc.message,
+            }
+
+        self.statuses[status] += 1
+        headers = {"Retry-After": str(self.retry_after_seconds)} if status == 429 else None
+        return httpx.Response(status, json=payload, headers=headers)
+
+    def _check_faults(self, request: httpx.Request) -> None:
+        if not request.headers.get("Authorization", "").removeprefix("Bearer ").strip():
+            raise FakeNotionError(401, "unauthorized", "API token is invalid.")
+        if self.rate_limit_probability and self._random.random() < self.rate_limit_probability:
+            raise _rate_limited()
+        if self.rate_limit_per_second:
+            rate = self.rate_limit_per_second
+            capacity = self.rate_limit_burst or max(1, int(2 * rate))
+            now = time.monotonic()
+            tokens = capacity if self._tokens is None else self._tokens
+            self._tokens = min(capacity, tokens + (now - self._refilled) * rate)
+            self._refilled = now
+            if self._tokens < 1:
+                raise _rate_limited()
+            self._tokens -= 1
+        if self.error_probability and self._random.random() < self.error_probability:
+            raise FakeNotionError(503, "service_unavailable", "Notion is unavailable.")
+
+    def _route(
+        self, method: str, path: str, body: Dict[str, Any], params: Any
+    ) -> Dict[str, Any]:
+        for route_method, pattern, handler in _ROUTES:
+            match = pattern.match(path)
+            if match and route_method == method:
+                return getattr(self, handler)(body, params, **match.groupdict())
+        raise FakeNotionError(400, "invalid_request_url", f"Invalid request URL: {method} {path}")
+
+    # ========== PAGES ==========
+
+    def _create_page(self, body: Dict[str, Any], params: Any) -> Dict[str, Any]:
+        parent = body.get("parent") or {}
+        database_id = parent.get("database_id")
+        if database_id is not None:
+            database = self._database(database_id)
+            schema = {name: spec["type"] for name, spec in database["properties"].items()}
+            parent = {"type": "database_id", "database_id": database["id"]}
+        elif parent.get("page_id") is not None:
+            parent = {"type": "page_id", "page_id": self._page(parent["page_id"])["id"]}
+            schema = {"title": "title"}
+        else:
+            raise FakeNotionError(400, "validation_error", "body.parent should be defined.")
+
+        page_id = str(uuid.uuid4())
+        now = _now()
+        properties = {name: _property_value(name, kind, {}) for name, kind in schema.items()}
+        properties.update(_properties(body.get("properties") or {}, schema))
+        page = {
+            "object": "page",
+            "id": page_id,
+            "created_time": now,
+            "last_edited_time": now,
+            "created_by": {"object": "user", "id": self.bot["id"]},
+            "last_edited_by": {"object": "user", "id": self.bot["id"]},
+            "cover": body.get("cover"),
+            "icon": body.get("icon"),
+            "parent": parent,
+            "archived": False,
+            "in_trash": False,
+            "properties": properties,
+            "url": _url(page_id),
+        }
+        self.pages[normalize_id(page_id)] = page
+        self._append(page_id, "page_id", body.get("children") or [])
+        return page
+
+    def _get_page(self, body: Dict[str, Any], params: Any, id: str) -> Dict[str, Any]:
+        return self._page(id)
+
+    def _update_page(self, body: Dict[str, Any], params: Any, id: str) -> Dict[str, Any]:
+        page = self._page(id)
+        if body.get("properties"):
+            database_id = page["parent"].get("database_id")
+            if database_id is not None:
+                schema = {
+                    name: spec["type"]
+                    for name, spec in self._database(database_id)["properties"].items()
+                }
+            else:
+                schema = {"title": "title"}
+            page["properties"].update(_properties(body["properties"], schema))
+        for key in ("icon", "cover"):
+            if key in body:
+                page[key] = body[key]
+        for key in ("archived", "in_trash"):
+            if key in body:
+                page["archived"] = page["in_trash"] = bool(body[key])
+        page["last_edited_time"] = _now()
+        return page
+
+    def _page(self, page_id: str) -> Dict[str, Any]:
+        page = self.pages.get(normalize_id(page_id))
+        if page is None:
+            raise _not_found("page", page_id)
+        return page
+
+    # ========== DATABASES ==========
+
+    def _get_database(self, body: Dict[str, Any], params: Any, id: str) -> Dict[str, Any]:
+        return self._database(id)
+
+    def _query_database(self, body: Dict[str, Any], params: Any, id: str) -> Dict[str, Any]:
+        database = self._database(id)
+        database_key = normalize_id(database["id"])
+        pages = [
+            page
+            for page in self.pages.values()
+            if not page["archived"]
+            and normalize_id(page["parent"].get("database_id")) == database_key
+        ]
+        if body.get("filter"):
+            pages = [page for page in pages if _matches(page, body["filter"])]
+        for sort in reversed(body.get("sorts") or []):
+            pages = _sorted(pages, sort)
+        return _paginate(pages, body.get("start_cursor"), body.get("page_size"), "page_or_database")
+
+    def _database(self, database_id: str) -> Dict[str, Any]:
+        database = self.databases.get(normalize_id(database_id))
+        if database is None:
+            raise _not_found("database", database_id)
+        return database
+
+    # ========== BLOCKS ==========
+
+    def _get_block(self, body: Dict[str, Any], params: Any, id: str) -> Dict[str, Any]:
+        return self._block(id)
+
+    def _list_children(self, body: Dict[str, Any], params: Any, id: str) -> Dict[str, Any]:
+        if normalize_id(id) not in self.pages:
+            self._block(id)
+        children = [
+            self.blocks[key]
+            for key in self._children.get(normalize_id(id), [])
+            if not self.blocks[key]["archived"]
+        ]
+        return _paginate(
+            children, params.get("start_cursor"), params.get("page_size"), "block"
+        )
+
+    def _append_children(self, body: Dict[str, Any], params: Any, id: str) -> Dict[str, Any]:
+        if normalize_id(id) in self.pages:
+            parent_type = "page_id"
+        else:
+            self._block(id)
+            parent_type = "block_id"
+        appended = self._append(id, parent_type, body.get("children") or [])
+        return {"object": "list", "results": appended, "next_cursor": None, "has_more": False}
+
+    def _update_block(self, body: Dict[str, Any], params: Any, id: str) -> Dict[str, Any]:
+        block = self._block(id)
+        if block["type"] in body:
+            block[block["type"]] = body[block["type"]]
+        if "archived" in body:
+            block["archived"] = bool(body["archived"])
+        block["last_edited_time"] = _now()
+        return block
+
+    def _delete_block(self, body: Dict[str, Any], params: Any, id: str) -> Dict[str, Any]:
+        block = self._block(id)
+        block["archived"] = True
+        block["last_edited_time"] = _now()
+        return block
+
+    def _append(
+        self, parent_id: str, parent_type: str, children: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        appended = []
+        for child in children:
+            kind = child.get("type") or next(
+                (key for key in child if key not in ("object", "type")), "paragraph"
+            )
+            content = dict(child.get(kind) or {})
+            nested = content.pop("children", [])
+            block_id = str(uuid.uuid4())
+            now = _now()
+            block = {
+                "object": "block",
+                "id": block_id,
+                "parent": {"type": parent_type, parent_type: parent_id},
+                "created_time": now,
+                "last_edited_time": now,
+                "has_children": bool(nested),
+                "archived": False,
+                "type": kind,
+                kind: content,
+            }
+            self.blocks[normalize_id(block_id)] = block
+            self._children.setdefault(normalize_id(parent_id), []).append(normalize_id(block_id))
+            self._append(block_id, "block_id", nested)
+            appended.append(block)
+        return appended
+
+    def _block(self, block_id: str) -> Dict[str, Any]:
+        block = self.blocks.get(normalize_id(block_id))
+        if block is None:
+            raise _not_found("block", block_id)
+        return block
+
+    # ========== USERS ==========
+
+    def _get_me(self, body: Dict[str, Any], params: Any) -> Dict[str, Any]:
+        return self.bot
+
+    def _get_user(self, body: Dict[str, Any], params: Any, id: str) -> Dict[str, Any]:
+        user = self.users.get(normalize_id(id))
+        if user is None:
+            raise _not_found("user", id)
+        return user
+
+    def _list_users(self, body: Dict[str, Any], params: Any) -> Dict[str, Any]:
+        return _paginate(
+            list(self.users.values()), params.get("start_cursor"), params.get("page_size"), "user"
+        )
+
+    # ========== SEARCH ==========
+
+    def _search(self, body: Dict[str, Any], params: Any) -> Dict[str, Any]:
+        wanted = (body.get("filter") or {}).get("value")
+        items: List[Dict[str, Any]] = []
+        if wanted in (None, "page"):
+            items += [page for page in self.pages.values() if not page["archived"]]
+        if wanted in (None, "database"):
+            items += list(self.databases.values())
+
+        query = (body.get("query") or "").casefold()
+        if query:
+            items = [item for item in items if query in _title(item).casefold()]
+        sort = body.get("sort") or {"timestamp": "last_edited_time", "direction": "descending"}
+        items = _sorted(items, sort)
+        return _paginate(items, body.get("start_cursor"), body.get("page_size"), "page_or_database")
+
+
+# ========== PAYLOAD HELPERS ==========
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _url(object_id: str) -> str:
+    return f"https://www.notion.so/{normalize_id(object_id)}"
+
+
+def _short_id(name: str) -> str:
+    return uuid.uuid5(uuid.NAMESPACE_OID, name).hex[:4]
+
+
+def _rich_text(content: str) -> Dict[str, Any]:
+    return {"type": "text", "text": {"content": content, "link": None}, "plain_text": content}
+
+
+def _title(item: Dict[str, Any]) -> str:
+    if item["object"] == "database":
+        return "".join(text["plain_text"] for text in item["title"])
+    for prop in item["properties"].values():
+        if prop["type"] == "title":
+            return property_text(prop)
+    return ""
+
+
+def _properties(values: Dict[str, Any], schema: Dict[str, str]) -> Dict[str, Any]:
+    """Response shape of request property values, checked against the schema"""
+    properties = {}
+    for name, value in values.items():
+        if name not in schema:
+            raise FakeNotionError(
+                400, "validation_error", f"{name} is not a property that exists."
+            )
+        properties[name] = _property_value(name, schema[name], value)
+    return properties
+
+
+def _property_value(name: str, kind: str, value: Dict[str, Any]) -> Dict[str, Any]:
+    data = value.get(kind, [] if kind in LIST_TYPES else None)
+    if kind in TEXT_TYPES:
+        data = [
+            _rich_text(item.get("plain_text") or (item.get("text") or {}).get("content", ""))
+            for item in data or []
+        ]
+    elif kind in ("select", "status") and data:
+        data = {"id": _short_id(data["name"]), "name": data["name"], "color": "default"}
+    elif kind == "multi_select":
+        data = [{"id": _short_id(item["name"]), "name": item["name"]} for item in data or []]
+    elif kind == "relation":
+        data = [{"id": item["id"]} for item in data or []]
+    elif kind == "date" and data:
+        data = {"start": data["start"], "end": data.get("end"), "time_zone": None}
+    return {"id": _short_id(name), "type": kind, kind: data}
+
+
+def _comparable(prop: Dict[str, Any]) -> Any:
+    """Value of a property as filters and sorts compare it"""
+    kind = prop["type"]
+    data = prop.get(kind)
+    if kind in TEXT_TYPES:
+        return property_text(prop)
+    if kind in ("select", "status"):
+        return data["name"] if data else None
+    if kind == "multi_select":
+        return [item["name"] for item in data]
+    if kind == "relation":
+        return [normalize_id(item["id"]) for item in data]
+    if kind == "date":
+        return data["start"] if data else None
+    return data
+
+
+def _matches(page: Dict[str, Any], condition: Dict[str, Any]) -> bool:
+    if "and" in condition:
+        return all(_matches(page, item) for item in condition["and"])
+    if "or" in condition:
+        return any(_matches(page, item) for item in condition["or"])
+
+    if "timestamp" in condition:
+        kind = "date"
+        value = page[condition["timestamp"]]
+        operations = condition[condition["timestamp"]]
+    else:
+        prop = page["properties"].get(condition.get("property"))
+        if prop is None:
+            raise FakeNotionError(
+                400,
+                "validation_error",
+                f"Could not find property with name or id: {condition.get('property')}",
+            )
+        kind = next(key for key in condition if key != "property")
+        value = _comparable(prop)
+        operations = condition[kind]
+
+    for operator, target in operations.items():
+        check = _OPERATORS.get(operator)
+        if check is None:
+            raise FakeNotionError(400, "validation_error", f"Unsupported filter: {operator}")
+        if kind == "relation" and isinstance(target, str):
+            target = normalize_id(target)
+        elif kind == "date" and isinstance(target, str) and value is not None:
+            value, target = _date_pair(value, target)
+        if not check(value, target):
+            return False
+    return True
+
+
+def _date_pair(value: str, target: str) -> Tuple[str, str]:
+    # Date-only operands compare by calendar day, as written
+    if "T" not in value or "T" not in target:
+        return value[:10], target[:10]
+    return normalize_date(value), normalize_date(target)
+
+
+def _sorted(items: List[Dict[str, Any]], sort: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Stable sort by one property or timestamp; empty values last"""
+    if "timestamp" in sort:
+        def key(item: Dict[str, Any]) -> Any:
+            return item.get(sort["timestamp"])
+    else:
+        def key(item: Dict[str, Any]) -> Any:
+            prop = item["properties"].get(sort["property"])
+            value = _comparable(prop) if prop is not None else None
+            if isinstance(value, str):
+                value = normalize_date(value) if prop["type"] == "date" else value.casefold()
+            return value if value not in ("", []) else None
+
+    present = [item for item in items if key(item) is not None]
+    missing = [item for item in items if key(item) is None]
+    descending = sort.get("direction") == "descending"
+    return sorted(present, key=key, reverse=descending) + missing
+
+
+def _paginate(
+    items: List[Dict[str, Any]],
+    start_cursor: Optional[str],
+    page_size: Any,
+    result_type: str,
+) -> Dict[str, Any]:
+    start = 0
+    if start_cursor:
+        ids = [normalize_id(item["id"]) for item in items]
+        if normalize_id(start_cursor) not in ids:
+            raise FakeNotionError(
+                400, "validation_error", f"start_cursor provided is invalid: {start_cursor}"
+            )
+        start = ids.index(normalize_id(start_cursor))
+    size = max(1, min(int(page_size or 100), 100))
+    page = items[start : start + size]
+    has_more = start + size < len(items)
+    return {
+        "object": "list",
+        "results": page,
+        "next_cursor": items[start + size]["id"] if has_more else None,
+        "has_more": has_more,
+        "type": result_type,
+        result_type: {},
+    }
+
+
+def _not_found(kind: str, object_id: str) -> FakeNotionError:
+    return FakeNotionError(
+        404,
+        "object_not_found",
+        f"Could not find {kind} with ID: {object_id}. "
+        "Make sure the relevant pages and databases are shared with your integration.",
+    )
+
+
+def _rate_limited() -> FakeNotionError:
+    return FakeNotionError(
+        429, "rate_limited", "You have been rate limited. Please try again later."
+    )
@@ -5,6 +5,7 @@ Provides all Notion API operations with error handling, retry logic,
 and rate limiting.
 """
 
+import time
 from typing import Any, Dict, List, Optional
 
 import httpx
@@ -18,9 +19,20 @@ from tenacity import (
 
 from exceptions import NotionAPIError, NotionRateLimitError
 from utils.constants import NOTION_API_VERSION, NOTION_BASE_URL, REQUEST_TIMEOUT
+from utils.metrics import METRICS, endpoint_template
+from utils.tracing import KIND_CLIENT, TRACER
+
+from .card_store import CardStore
+from .rate_limiter import AsyncRateLimiter
 
 logger = structlog.get_logger(__name__)
 
+
+def _count_retry(retry_state: Any) -> None:
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    METRICS.inc("notion_retries_total", reason=type(error).__name__ if error else "unknown")
+
+
 __all__ = ["NotionService", "NotionAPIError", "NotionRateLimitError"]
 
 
@@ -42,13 +54,24 @@ class NotionService:
     - Type validation
     """
 
-    def __init__(self, token: str, version: str = NOTION_API_VERSION):
+    def __init__(
+        self,
+        token: str,
+        version: str = NOTION_API_VERSION,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+        store: Optional[CardStore] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         """
         Initialize Notion service
 
         Args:
             token: Notion API token (integration token)
             version: Notion API version
+            rate_limiter: Limiter shared by every request (default: RATE_LIMIT_PER_SECOND)
+            store: Card store to feed (e.g., shared by the services of a pool)
+            transport: httpx transport of the client (e.g., ``FakeNotionAPI``
+                for offline tests and benchmarks; default: network)
         """
         self.token = token
         self.version = version
@@ -60,21 +83,42 @@ class NotionService:
             "Notion-Version": version,
         }
 
-        self.client = httpx.AsyncClient(
-            headers=self.headers,
-            timeout=REQUEST_TIMEOUT,
-        )
+        # Created on first use: building the transport is the most expensive
+        # part of server startup and many sessions never hit the API.
+        self._client: Optional[httpx.AsyncClient] = None
+        self._transport = transport
+        self.rate_limiter = rate_limiter or AsyncRateLimiter()
+        # Warmed by every page response; backs idempotent creates
+        self.store = store if store is not None else CardStore()
 
         logger.info("notion_service_initialized", version=version)
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client (lazily created)"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=REQUEST_TIMEOUT,
+                transport=self._transport,
+            )
+        return self._client
+
+    @client.setter
+    def client(self, value: httpx.AsyncClient) -> None:
+        self._client = value
+
     async def close(self) -> None:
         """Close HTTP client"""
-        await self.client.aclose()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     @retry(
         retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
+        before_sleep=_count_retry,
     )
     async def _request(
         self,
@@ -109,18 +153,26 @@ class NotionService:
         )
 
         try:
-            response = await self._send_request(
-                method=method,
-                url=url,
-                json_data=json_data,
-                params=params,
-            )
-            return self._handle_response(endpoint, response)
+            with TRACER.span(
+                f"{method} {endpoint_template(endpoint)}",
+                KIND_CLIENT,
+                **{"http.request.method": method, "url.full": url},
+            ) as span:
+                response = await self._send_request(
+                    method=method,
+                    url=url,
+                    json_data=json_data,
+                    params=params,
+                )
+                span.set_attribute("http.response.status_code", response.status_code)
+                return self._handle_response(endpoint, response)
         except httpx.TimeoutException as exc:
             logger.error("request_timeout", endpoint=endpoint, error=str(exc))
+            METRICS.inc("notion_request_errors_total", error="timeout")
             raise
         except httpx.NetworkError as exc:
             logger.error("network_error", endpoint=endpoint, error=str(exc))
+            METRICS.inc("notion_request_errors_total", error="network")
             raise
 
     async def _send_request(
@@ -131,12 +183,28 @@ class NotionService:
         json_data: Optional[Dict[str, Any]],
         params: Optional[Dict[str, Any]],
     ) -> httpx.Response:
-        return await self.client.request(
+        with TRACER.span("rate_limiter.acquire") as span:
+            waited = await self.rate_limiter.acquire()
+            span.set_attribute("rate_limiter.waited_ms", round(waited * 1000, 1))
+        if waited:
+            logger.debug("rate_limiter_wait", url=url, waited_ms=round(waited * 1000, 1))
+            METRICS.observe("rate_limiter_wait_ms", waited * 1000)
+        start = time.perf_counter()
+        response = await self.client.request(
             method=method,
             url=url,
             json=json_data,
             params=params,
         )
+        METRICS.record_request(
+            method,
+            url.removeprefix(self.base_url).lstrip("/"),
+            response.status_code,
+            (time.perf_counter() - start) * 1000,
+            request_bytes=len(response.request.content) if json_data is not None else 0,
+            response_bytes=len(response.content),
+        )
+        return response
 
     def _handle_response(self, endpoint: str, response: httpx.Response) -> Dict[str, Any]:
         if response.status_code == 429:
@@ -210,7 +278,9 @@ class NotionService:
 
         logger.info("creating_page", database_id=database_id)
 
-        return await self._request("POST", "pages", json_data=payload)
+        page = await self._request("POST", "pages", json_data=payload)
+        self.store.ingest(page, database_id)
+        return page
 
     async def get_page(self, page_id: str) -> Dict[str, Any]:
         """
@@ -223,7 +293,9 @@ class NotionService:
             Page object
         """
         logger.info("getting_page", page_id=page_id)
-        return await self._request("GET", f"pages/{page_id}")
+        page = await self._request("GET", f"pages/{page_id}")
+        self.store.ingest(page)
+        return page
 
     async def update_page(
         self,
@@ -262,7 +334,11 @@ class NotionService:
 
         logger.info("updating_page", page_id=page_id)
 
-        return await self._request("PATCH", f"pages/{page_id}", json_data=payload)
+        page = await self._request("PATCH", f"pages/{page_id}", json_data=payload)
+        self.store.ingest(page)
+        if archived:
+            self.store.discard(page_id)
+        return page
 
     async def archive_page(self, page_id: str) -> Dict[str, Any]:
         """
@@ -324,7 +400,47 @@ class NotionService:
 
         logger.info("querying_database", database_id=database_id)
 
-        return await self._request("POST", f"databases/{database_id}/query", json_data=payload)
+        result = await self._request("POST", f"databases/{database_id}/query", json_data=payload)
+        self.store.ingest(result, database_id)
+        return result
+
+    async def query_database_all(
+        self,
+        database_id: str,
+        filter_conditions: Optional[Dict[str, Any]] = None,
+        sorts: Optional[List[Dict[str, str]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Query every matching page, following pagination cursors
+
+        Args:
+            database_id: Database ID to query
+            filter_conditions: Filter conditions
+            sorts: Sort configuration
+
+        Returns:
+            All matching pages
+        """
+        pages: List[Dict[str, Any]] = []
+        cursor: Optional[str] = None
+        requests = 0
+
+        while True:
+            result = await self.query_database(
+                database_id=database_id,
+                filter_conditions=filter_conditions,
+                sorts=sorts,
+                start_cursor=cursor,
+            )
+            requests += 1
+            pages.extend(result.get("results", []))
+
+            cursor = result.get("next_cursor")
+            if not result.get("has_more") or not cursor:
+                break
+
+        logger.info("queried_database_all", database_id=database_id, count=len(pages), requests=requests)
+        return pages
 
     async def get_database(self, database_id: str) -> Dict[str, Any]:
         """
@@ -0,0 +1,64 @@
+"""
+Async token-bucket rate limiter shared by all requests of a NotionService.
+
+Notion allows an average of three requests per second per integration.
+Concurrent callers wait for a token instead of hitting HTTP 429.
+"""
+
+import asyncio
+import time
+from typing import Callable, Optional
+
+from utils.constants import RATE_LIMIT_PER_SECOND
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket limiting requests per second across coroutines
+
+    Args:
+        rate_per_second: Tokens added per second (<= 0 disables limiting)
+        burst: Bucket capacity (default: ``rate_per_second``)
+        clock: Monotonic clock in seconds (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float = RATE_LIMIT_PER_SECOND,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate_per_second
+        self.capacity = float(burst if burst is not None else max(1, int(rate_per_second)))
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self) -> float:
+        """
+        Wait until a request slot is available
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        waited = 0.0
+        # Callers are served in FIFO order: only the lock holder sleeps
+        async with self._lock:
+            while True:
+                now = self._clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+
+                delay = (1 - self._tokens) / self.rate
+                waited += delay
+                await asyncio.sleep(delay)
@@ -0,0 +1,121 @@
+"""
+Time rollups over card hierarchies, computed from the local card store.
+
+A hierarchy (course > phase > section > class) is flattened into parallel
+arrays in breadth-first order, so every child comes after its parent. A
+single reverse pass then adds each node's seconds into its parent: total
+and remaining time of every level in O(n), with no page reads.
+"""
+
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from .card_store import normalize_id, property_relation_ids
+
+
+@dataclass(slots=True)
+class RollupTree:
+    """Breadth-first arrays of a hierarchy (index 0 is the root)"""
+
+    ids: List[str]
+    parents: array
+    own_seconds: array
+    open_flags: array
+
+    def has_children(self) -> List[bool]:
+        flags = [False] * len(self.ids)
+        for parent in self.parents[1:]:
+            flags[parent] = True
+        return flags
+
+
+def build_tree(
+    root_id: str,
+    pages: Iterable[dict],
+    relation_field: str,
+    seconds_of: Callable[[dict], int],
+    is_open: Callable[[dict], bool],
+) -> RollupTree:
+    """
+    Flatten the subtree of ``root_id`` from a set of pages
+
+    Args:
+        root_id: Root page ID (must be among ``pages``)
+        pages: Candidate pages (e.g., every stored page of the database)
+        relation_field: Parent relation property
+        seconds_of: Own duration of a page, in seconds
+        is_open: Whether a page still counts towards remaining time
+
+    Returns:
+        Tree arrays in breadth-first order
+
+    Raises:
+        KeyError: If the root page is not among ``pages``
+    """
+    by_id: Dict[str, dict] = {}
+    children: Dict[str, List[str]] = {}
+    for page in pages:
+        page_id = normalize_id(page.get("id"))
+        by_id[page_id] = page
+        parents = property_relation_ids((page.get("properties") or {}).get(relation_field))
+        if parents:
+            children.setdefault(normalize_id(parents[0]), []).append(page_id)
+
+    root = normalize_id(root_id)
+    if root not in by_id:
+        raise KeyError(root_id)
+
+    ids: List[str] = []
+    parent_indexes = array("l")
+    own_seconds = array("q")
+    open_flags = array("b")
+    queue = deque([(root, -1)])
+    seen = {root}
+    while queue:
+        page_id, parent_index = queue.popleft()
+        page = by_id[page_id]
+        index = len(ids)
+        ids.append(page["id"])
+        parent_indexes.append(parent_index)
+        own_seconds.append(seconds_of(page))
+        open_flags.append(1 if is_open(page) else 0)
+        for child in children.get(page_id, []):
+            if child not in seen:  # Guard against relation cycles
+                seen.add(child)
+                queue.append((child, index))
+
+    return RollupTree(ids, parent_indexes, own_seconds, open_flags)
+
+
+def compute_rollups(tree: RollupTree) -> Tuple[Sequence[int], Sequence[int]]:
+    """
+    Total and remaining seconds of every node
+
+    Leaves contribute their own duration (remaining only while open);
+    parents are the sum of their children, regardless of their own value.
+
+    Returns:
+        ``(totals, remaining)`` aligned with ``tree.ids``
+    """
+    has_children = tree.has_children()
+    totals = array(
+        "q",
+        (0 if parent else own for parent, own in zip(has_children, tree.own_seconds, strict=True)),
+    )
+    remaining = array(
+        "q",
+        (
+            0 if parent else own * is_open
+            for parent, own, is_open in zip(
+                has_children, tree.own_seconds, tree.open_flags, strict=True
+            )
+        ),
+    )
+    parents = tree.parents
+    for index in range(len(tree.ids) - 1, 0, -1):
+        parent = parents[index]
+        totals[parent] += totals[index]
+        remaining[parent] += remaining[index]
+    return totals, remaining
@@ -0,0 +1,191 @@
+"""
+In-memory interval index of scheduled cards across databases.
+
+The CardStore feeds it with the date property of every indexed page, so
+the index follows syncs and our own writes. Only timed intervals up to
+``SCHEDULE_MAX_INTERVAL_HOURS`` are kept: date-only cards and long spans
+(projects, series, courses) are containers, not appointments.
+
+Intervals live in arrays sorted by start. Because every interval is
+shorter than the bound, all overlaps of ``[start, end)`` start within
+``[start - bound, end)``: one bisect plus a scan of that window.
+"""
+
+from bisect import bisect_left
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from utils.constants import SCHEDULE_MAX_INTERVAL_HOURS
+from utils.formatters import SAO_PAULO_TZ
+
+
+class ScheduledInterval(NamedTuple):
+    """Timed interval of a page, as epoch seconds"""
+
+    start: float
+    end: float
+    page_id: str
+    database: str
+
+
+def normalize_id(value: Optional[str]) -> str:
+    """Notion IDs with or without dashes, in any case, compare equal"""
+    return (value or "").replace("-", "").lower()
+
+
+def interval_bounds(period: Optional[Dict[str, Any]]) -> Optional[Tuple[float, float]]:
+    """
+    Epoch bounds of a timed Notion period
+
+    Naive datetimes are read as GMT-3, like ``format_date_gmt3``. A period
+    without ``end`` is an instant.
+
+    Returns:
+        ``(start, end)`` or ``None`` for date-only or unparsable periods
+    """
+    if not period or not period.get("start") or "T" not in period["start"]:
+        return None
+    try:
+        start = _epoch(period["start"])
+        end = _epoch(period["end"]) if period.get("end") else start
+    except ValueError:
+        return None
+    return (start, end) if end >= start else None
+
+
+def _epoch(value: str) -> float:
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = SAO_PAULO_TZ.localize(parsed)
+    return parsed.timestamp()
+
+
+def _overlaps(start: float, end: float, other_start: float, other_end: float) -> bool:
+    # Touching intervals (class ends 21:00, recording starts 21:00) do not conflict
+    if start == end or other_start == other_end:
+        # An instant holds its own timestamp: it clashes with the same instant
+        # and with intervals running at that moment (from their start, exclusive end)
+        return (
+            start == other_start
+            or other_start <= start < other_end
+            or start <= other_start < end
+        )
+    return start < other_end and other_start < end
+
+
+class ScheduleIndex:
+    """
+    Page ID -> timed interval, queryable by overlap
+
+    Page IDs are normalized (``normalize_id``), so dashed and undashed
+    forms of an ID address the same interval.
+
+    Args:
+        max_interval_hours: Longest interval indexed
+    """
+
+    def __init__(self, max_interval_hours: float = SCHEDULE_MAX_INTERVAL_HOURS):
+        self.max_span = max_interval_hours * 3600
+        self._intervals: Dict[str, ScheduledInterval] = {}
+        self._sorted: List[ScheduledInterval] = []
+        self._starts: List[float] = []
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def add(self, page_id: str, period: Optional[Dict[str, Any]], database: str = "") -> None:
+        """Index (or reindex) the period of a page; non-timed periods remove it"""
+        page_id = normalize_id(page_id)
+        bounds = interval_bounds(period)
+        if bounds is None or bounds[1] - bounds[0] > self.max_span:
+            self.remove(page_id)
+            return
+        self._intervals[page_id] = ScheduledInterval(bounds[0], bounds[1], page_id, database)
+        self._dirty = True
+
+    def remove(self, page_id: str) -> None:
+        """Forget the interval of a page"""
+        if self._intervals.pop(normalize_id(page_id), None) is not None:
+            self._dirty = True
+
+    def clear(self) -> None:
+        """Drop every interval"""
+        self._intervals.clear()
+        self._dirty = True
+
+    def overlapping(
+        self, start: float, end: float, exclude: Iterable[str] = ()
+    ) -> List[ScheduledInterval]:
+        """Indexed intervals overlapping ``[start, end)`` (an instant when equal)"""
+        self._rebuild()
+        excluded = {normalize_id(page_id) for page_id in exclude}
+        found = []
+        position = bisect_left(self._starts, start - self.max_span)
+        while position < len(self._sorted) and self._starts[position] <= end:
+            interval = self._sorted[position]
+            if interval.page_id not in excluded and _overlaps(
+                start, end, interval.start, interval.end
+            ):
+                found.append(interval)
+            position += 1
+        return found
+
+    def find_conflicts(
+        self,
+        periods: Sequence[Optional[Dict[str, Any]]],
+        exclude: Iterable[str] = (),
+    ) -> List[Dict[str, Any]]:
+        """
+        Check planned periods against the index and against each other
+
+        Args:
+            periods: Planned Notion periods (``{"start", "end"}``), in input order
+            exclude: Page IDs to ignore (e.g., the cards being moved)
+
+        Returns:
+            One entry per conflicting period: ``index``, ``period`` and
+            ``conflicts`` (indexed pages as ``page_id``/``database``/bounds,
+            other planned periods as ``index``)
+        """
+        excluded = {normalize_id(page_id) for page_id in exclude}
+        planned = []
+        for index, period in enumerate(periods):
+            bounds = interval_bounds(period)
+            if bounds is not None:
+                planned.append((bounds[0], bounds[1], index))
+
+        clashes: Dict[int, List[Dict[str, Any]]] = {}
+        for start, end, index in planned:
+            for interval in self.overlapping(start, end, excluded):
+                clashes.setdefault(index, []).append(
+                    {
+                        "page_id": interval.page_id,
+                        "database": interval.database,
+                        "start": datetime.fromtimestamp(interval.start, SAO_PAULO_TZ).isoformat(),
+                        "end": datetime.fromtimestamp(interval.end, SAO_PAULO_TZ).isoformat(),
+                    }
+                )
+
+        # Planned periods against each other: sweep by start
+        planned.sort()
+        active: List[Tuple[float, float, int]] = []
+        for start, end, index in planned:
+            active = [item for item in active if item[1] > start or item[0] == item[1] == start]
+            for other_start, other_end, other_index in active:
+                if _overlaps(start, end, other_start, other_end):
+                    clashes.setdefault(index, []).append({"index": other_index})
+                    clashes.setdefault(other_index, []).append({"index": index})
+            active.append((start, end, index))
+
+        return [
+            {"index": index, "period": periods[index], "conflicts": clashes[index]}
+            for index in sorted(clashes)
+        ]
+
+    def _rebuild(self) -> None:
+        if not self._dirty:
+            return
+        self._sorted = sorted(self._intervals.values())
+        self._starts = [interval.start for interval in self._sorted]
+        self._dirty = False
@@ -0,0 +1,119 @@
+"""
+Pool of NotionService instances, one per integration token.
+
+Notion rate limits each integration separately. With one token per
+workspace/integration, the pool keeps one HTTP client and one rate limiter
+per token and routes every call by database ID, so throughput adds up
+across integrations. All services feed the same CardStore: dedup,
+conflict detection and rollups see every configured database.
+"""
+
+from typing import Dict, List, Mapping, Optional
+
+import httpx
+import structlog
+
+from exceptions import NotionAPIError, NotionRateLimitError
+
+from .card_store import CardStore, normalize_id
+from .notion_service import NotionService
+
+logger = structlog.get_logger(__name__)
+
+
+class NotionServicePool:
+    """
+    NotionService per token, routed by database (or page) ID
+
+    Args:
+        default_token: Token used for databases without their own token
+        database_tokens: Database ID -> token of the integration owning it
+        transport: httpx transport shared by every service (default: network)
+    """
+
+    def __init__(
+        self,
+        default_token: str,
+        database_tokens: Optional[Mapping[str, str]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.store = CardStore()
+        self._transport = transport
+        self._by_token: Dict[str, NotionService] = {}
+        self._by_database: Dict[str, NotionService] = {}
+        # Pages outside the store (e.g., children of pages) found by lookup
+        self._by_page: Dict[str, NotionService] = {}
+        self.default = self._service(default_token)
+        for database_id, token in (database_tokens or {}).items():
+            if database_id and token:
+                self._by_database[normalize_id(database_id)] = self._service(token)
+        logger.info(
+            "notion_service_pool_initialized",
+            tokens=len(self._by_token),
+            routed_databases=len(self._by_database),
+        )
+
+    def __len__(self) -> int:
+        return len(self._by_token)
+
+    @property
+    def services(self) -> List[NotionService]:
+        """One service per distinct token"""
+        return list(self._by_token.values())
+
+    def for_database(self, database_id: Optional[str]) -> NotionService:
+        """Service of the integration owning a database (default when unknown)"""
+        return self._by_database.get(normalize_id(database_id), self.default)
+
+    async def for_page(self, page_id: Optional[str]) -> NotionService:
+        """
+        Service for a page, routed through the database it is stored under
+
+        With a single token there is nothing to choose. Otherwise a page the
+        card store has not seen (cold start, page created in the Notion UI)
+        is read through each integration in turn; the response is ingested,
+        so later calls route from the store.
+
+        Raises:
+            NotionAPIError: If no configured integration can read the page
+        """
+        if not page_id or len(self._by_token) == 1:
+            return self.default
+        database_id = self.store.database_of(page_id)
+        if database_id is not None:
+            return self.for_database(database_id)
+        known = self._by_page.get(normalize_id(page_id))
+        if known is not None:
+            return known
+
+        errors: List[str] = []
+        for service in self.services:
+            try:
+                page = await service.get_page(page_id)
+            except NotionRateLimitError:
+                raise
+            except NotionAPIError as exc:  # Not shared with this integration
+                errors.append(str(exc))
+                continue
+            database_id = (page.get("parent") or {}).get("database_id")
+            if database_id is not None and normalize_id(database_id) in self._by_database:
+                return self.for_database(database_id)
+            self._by_page[normalize_id(page_id)] = service
+            return service
+
+        raise NotionAPIError(
+            f"Page {page_id} is not accessible to any configured integration: "
+            + "; ".join(errors)
+        )
+
+    async def close(self) -> None:
+        """Close every HTTP client"""
+        for service in self.services:
+            await service.close()
+
+    def _service(self, token: str) -> NotionService:
+        if token not in self._by_token:
+            self._by_token[token] = NotionService(
+                token, store=self.store, transport=self._transport
+            )
+        return self._by_token[token]
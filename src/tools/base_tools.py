@@ -8,14 +8,28 @@ from typing import Any, Dict, List
 
 import structlog
 
+from utils.log_policy import log_tool_call
+
 logger = structlog.get_logger(__name__)
 
 
 class BaseNotionTools:
-    """Base tools for Notion API operations"""
+    """Base tools for Notion API operations
+
+    With a service pool, calls are routed to the integration owning the
+    target database (``database_id``) or page (``page_id``).
+    """
 
-    def __init__(self, notion_service):
+    def __init__(self, notion_service, pool=None):
         self.service = notion_service
+        self.pool = pool
+
+    async def _service_for(self, arguments: Dict[str, Any]):
+        if self.pool is None:
+            return self.service
+        if arguments.get("database_id"):
+            return self.pool.for_database(arguments["database_id"])
+        return await self.pool.for_page(arguments.get("page_id"))
 
     def get_tools(self) -> List[Dict[str, Any]]:
         """Get base Notion API tools"""
@@ -122,31 +136,32 @@ class BaseNotionTools:
 
     async def handle_tool_call(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
         """Handle base tool calls"""
-        logger.info("handling_base_tool", tool=tool_name, args=arguments)
+        log_tool_call(logger, "handling_base_tool", tool_name, arguments)
+        service = await self._service_for(arguments)
 
         if tool_name == "notion_create_page":
-            return await self.service.create_page(**arguments)
+            return await service.create_page(**arguments)
 
         elif tool_name == "notion_update_page":
-            return await self.service.update_page(**arguments)
+            return await service.update_page(**arguments)
 
         elif tool_name == "notion_get_page":
-            return await self.service.get_page(**arguments)
+            return await service.get_page(**arguments)
 
         elif tool_name == "notion_query_database":
-            return await self.service.query_database(**arguments)
+            return await service.query_database(**arguments)
 
         elif tool_name == "notion_delete_page":
-            return await self.service.delete_page(**arguments)
+            return await service.delete_page(**arguments)
 
         elif tool_name == "notion_append_blocks":
-            return await self.service.append_blocks(**arguments)
+            return await service.append_blocks(**arguments)
 
         elif tool_name == "notion_update_blocks":
-            return await self.service.update_blocks(**arguments)
+            return await service.update_blocks(**arguments)
 
         elif tool_name == "notion_delete_blocks":
-            return await self.service.delete_blocks(**arguments)
+            return await service.delete_blocks(**arguments)
 
         else:
             raise ValueError(f"Unknown base tool: {tool_name}")
@@ -10,6 +10,9 @@ import structlog
 
 from custom.personal_notion import PersonalNotion
 from utils.constants import PersonalStatus
+from utils.log_policy import log_tool_call
+
+from .schema import CHECK_CONFLICTS_PROPERTY, IDEMPOTENT_PROPERTY
 
 logger = structlog.get_logger(__name__)
 
@@ -69,6 +72,7 @@ class PersonalNotionTools:
                         },
                         "descricao": {"type": "string"},
                         "icon": {"type": "string", "default": "👤"},
+                        "idempotent": IDEMPOTENT_PROPERTY,
                     },
                     "required": ["title"],
                 },
@@ -89,13 +93,14 @@ class PersonalNotionTools:
                         "data": {"type": "object"},
                         "descricao": {"type": "string"},
                         "icon": {"type": "string", "default": "✅"},
+                        "idempotent": IDEMPOTENT_PROPERTY,
                     },
                     "required": ["parent_id", "title"],
                 },
             },
             {
                 "name": "personal_use_template",
-                "description": "Create a personal card using one of the generic templates.",
+                "description": "Create a personal card using one of the generic templates (or every occurrence up to 'until').",
                 "inputSchema": {
                     "type": "object",
                     "properties": {
@@ -112,6 +117,17 @@ class PersonalNotionTools:
                             "type": "object",
                             "description": "Optional overrides applied to the template payload.",
                         },
+                        "until": {
+                            "type": "string",
+                            "description": "Repeat the template from reference_date until this date (YYYY-MM-DD), skipping occurrences that already exist.",
+                        },
+                        "interval": {
+                            "type": "integer",
+                            "minimum": 1,
+                            "default": 1,
+                            "description": "Weeks (weekday templates) or months (monthly templates) between occurrences when 'until' is set.",
+                        },
+                        "check_conflicts": CHECK_CONFLICTS_PROPERTY,
                     },
                     "required": ["template_name", "reference_date"],
                 },
@@ -139,7 +155,7 @@ class PersonalNotionTools:
 
     async def handle_tool_call(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
         """Dispatch personal tool calls."""
-        logger.info("handling_personal_tool", tool=tool_name, args=arguments)
+        log_tool_call(logger, "handling_personal_tool", tool_name, arguments)
         self._ensure_available()
 
         if tool_name == "personal_create_task":
@@ -154,6 +170,15 @@ class PersonalNotionTools:
             reference = datetime.fromisoformat(arguments.pop("reference_date"))
             overrides = arguments.pop("overrides", None)
             template_name = arguments.get("template_name")
+            if arguments.get("until"):
+                return await self.personal_notion.use_template_recurring(
+                    template_name=template_name,
+                    start_date=reference,
+                    end_date=datetime.fromisoformat(arguments["until"]),
+                    interval=arguments.get("interval", 1),
+                    overrides=overrides,
+                    check_conflicts=arguments.get("check_conflicts", "off"),
+                )
             return await self.personal_notion.use_template(
                 template_name=template_name,
                 reference_date=reference,
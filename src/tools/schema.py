@@ -0,0 +1,25 @@
+"""
+Input schema properties shared by the tools of several databases
+"""
+
+from typing import Any, Dict
+
+from utils.constants import CONFLICT_CHECK_MODES
+
+IDEMPOTENT_PROPERTY: Dict[str, Any] = {
+    "type": "boolean",
+    "description": (
+        "Return the existing card with the same title, parent and date instead of "
+        "creating a duplicate"
+    ),
+}
+
+CHECK_CONFLICTS_PROPERTY: Dict[str, Any] = {
+    "type": "string",
+    "enum": CONFLICT_CHECK_MODES,
+    "default": "off",
+    "description": (
+        "Check overlaps with scheduled cards of every database: off (default), "
+        "report returns them, reject aborts before any change."
+    ),
+}
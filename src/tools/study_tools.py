@@ -9,6 +9,9 @@ from typing import Any, Dict, List, Optional
 import structlog
 
 from utils.constants import StudiesStatus
+from utils.log_policy import log_tool_call
+
+from .schema import CHECK_CONFLICTS_PROPERTY, IDEMPOTENT_PROPERTY
 
 logger = structlog.get_logger(__name__)
 
@@ -65,6 +68,7 @@ class StudyNotionTools:
                         "tempo_total": {"type": "string", "description": "Total workload (e.g., '40:00:00')."},
                         "descricao": {"type": "string"},
                         "icon": {"type": "string"},
+                        "idempotent": IDEMPOTENT_PROPERTY,
                     },
                     "required": ["title"],
                 },
@@ -127,6 +131,11 @@ class StudyNotionTools:
                                 "required": ["title"],
                             },
                         },
+                        "resume": {
+                            "type": "boolean",
+                            "description": "Skip cards recorded by a previous failed run of the same course (default: true)",
+                        },
+                        "check_conflicts": CHECK_CONFLICTS_PROPERTY,
                     },
                     "required": ["title", "sinopse"],
                 },
@@ -143,6 +152,7 @@ class StudyNotionTools:
                         "tempo_total": {"type": "string"},
                         "descricao": {"type": "string"},
                         "icon": {"type": "string", "default": "📖"},
+                        "idempotent": IDEMPOTENT_PROPERTY,
                     },
                     "required": ["parent_id", "title"],
                 },
@@ -159,6 +169,7 @@ class StudyNotionTools:
                         "tempo_total": {"type": "string"},
                         "descricao": {"type": "string"},
                         "icon": {"type": "string", "default": "📑"},
+                        "idempotent": IDEMPOTENT_PROPERTY,
                     },
                     "required": ["parent_id", "title"],
                 },
@@ -177,23 +188,54 @@ class StudyNotionTools:
                         "icon": {"type": "string", "default": "🎯"},
                         "descricao": {"type": "string"},
                         "categorias": {"type": "array", "items": {"type": "string"}},
+                        "idempotent": IDEMPOTENT_PROPERTY,
                     },
                     "required": ["parent_id", "title", "start_time", "duration_minutes"],
                 },
             },
             {
                 "name": "study_reschedule_section",
-                "description": "Reschedule classes for a section (keeps study hour rules).",
+                "description": "Reschedule classes for a section (keeps study hour rules, updates only changed periods).",
                 "inputSchema": {
                     "type": "object",
                     "properties": {
                         "parent_id": {"type": "string"},
                         "new_start": {"type": "string", "description": "YYYY-MM-DD"},
                         "respect_weekends": {"type": "boolean", "default": True},
+                        "dry_run": {
+                            "type": "boolean",
+                            "default": False,
+                            "description": "Return the planned changes without updating Notion",
+                        },
+                        "check_conflicts": CHECK_CONFLICTS_PROPERTY,
                     },
                     "required": ["parent_id", "new_start"],
                 },
             },
+            {
+                "name": "study_recompute_rollups",
+                "description": "Recompute 'Tempo Total' of a course/phase/section from its classes (updates only totals that changed).",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "root_id": {
+                            "type": "string",
+                            "description": "Course, phase or section ID",
+                        },
+                        "refresh": {
+                            "type": "boolean",
+                            "default": True,
+                            "description": "Reload the database (one paginated query) before computing",
+                        },
+                        "dry_run": {
+                            "type": "boolean",
+                            "default": False,
+                            "description": "Return the planned changes without updating Notion",
+                        },
+                    },
+                    "required": ["root_id"],
+                },
+            },
             {
                 "name": "study_query_schedule",
                 "description": "Query classes/sessions within an optional timeframe.",
@@ -211,7 +253,7 @@ class StudyNotionTools:
 
     async def handle_tool_call(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
         """Dispatch study tool calls."""
-        logger.info("handling_study_tool", tool=tool_name, args=arguments)
+        log_tool_call(logger, "handling_study_tool", tool_name, arguments)
         self._ensure_available()
 
         if tool_name == "study_create_course":
@@ -246,8 +288,13 @@ class StudyNotionTools:
                 parent_id=arguments["parent_id"],
                 new_start_date=new_start,
                 respect_weekends=respect_weekends,
+                dry_run=arguments.get("dry_run", False),
+                check_conflicts=arguments.get("check_conflicts", "off"),
             )
 
+        if tool_name == "study_recompute_rollups":
+            return await self.study_notion.recompute_rollups(**arguments)
+
         if tool_name == "study_query_schedule":
             return await self.study_notion.query_schedule(**arguments)
 
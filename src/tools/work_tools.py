@@ -8,6 +8,9 @@ from typing import Any, Dict, List
 import structlog
 
 from utils.constants import WORK_CLIENTS, WORK_PROJECTS, Priority, WorkStatus
+from utils.log_policy import log_tool_call
+
+from .schema import IDEMPOTENT_PROPERTY
 
 logger = structlog.get_logger(__name__)
 
@@ -73,6 +76,7 @@ class WorkNotionTools:
                             "type": "string",
                             "description": "Emoji para o card (ex: 🚀).",
                         },
+                        "idempotent": IDEMPOTENT_PROPERTY,
                     },
                     "required": ["title"],
                 },
@@ -154,6 +158,7 @@ class WorkNotionTools:
                         "tempo_total": {"type": "string"},
                         "descricao": {"type": "string"},
                         "icon": {"type": "string"},
+                        "idempotent": IDEMPOTENT_PROPERTY,
                     },
                     "required": ["parent_id", "title"],
                 },
@@ -204,7 +209,7 @@ class WorkNotionTools:
 
     async def handle_tool_call(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
         """Execute WorkNotion tool calls."""
-        logger.info("handling_work_tool", tool=tool_name, args=arguments)
+        log_tool_call(logger, "handling_work_tool", tool_name, arguments)
         self._ensure_available()
 
         if tool_name == "work_create_project":
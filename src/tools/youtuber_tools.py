@@ -9,6 +9,9 @@ from typing import Any, Dict, List
 import structlog
 
 from utils.constants import YoutuberStatus
+from utils.log_policy import log_tool_call
+
+from .schema import CHECK_CONFLICTS_PROPERTY, IDEMPOTENT_PROPERTY
 
 logger = structlog.get_logger(__name__)
 
@@ -58,6 +61,7 @@ class YoutuberNotionTools:
                                 },
                             },
                         },
+                        "check_conflicts": CHECK_CONFLICTS_PROPERTY,
                     },
                     "required": ["title", "sinopse", "total_episodes", "first_recording"],
                 },
@@ -76,6 +80,7 @@ class YoutuberNotionTools:
                         "resumo_episodio": {"type": "string"},
                         "status": {"type": "string", "enum": STATUS_OPTIONS, "default": YoutuberStatus.PARA_GRAVAR.value},
                         "icon": {"type": "string", "default": "📺"},
+                        "idempotent": IDEMPOTENT_PROPERTY,
                     },
                     "required": [
                         "parent_id",
@@ -98,6 +103,11 @@ class YoutuberNotionTools:
                         "recording_interval_days": {"type": "integer", "default": 1},
                         "publication_hour": {"type": "integer", "default": 12},
                         "base_title": {"type": "string", "default": "Episode"},
+                        "sinopse": {
+                            "type": "string",
+                            "description": "Synopsis for episode 1 (default: the series card description)",
+                        },
+                        "check_conflicts": CHECK_CONFLICTS_PROPERTY,
                     },
                     "required": ["series_id", "total_episodes", "start_recording"],
                 },
@@ -144,7 +154,7 @@ class YoutuberNotionTools:
 
     async def handle_tool_call(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
         """Dispatch youtuber tool calls."""
-        logger.info("handling_youtuber_tool", tool=tool_name, args=arguments)
+        log_tool_call(logger, "handling_youtuber_tool", tool_name, arguments)
         self._ensure_available()
 
         if tool_name == "youtuber_create_series":
@@ -1,31 +1,40 @@
 """Utility modules for Notion MCP Server."""
 
+from .checkpoint import CheckpointManifest
+from .concurrency import gather_bounded
 from .constants import (
-    DEFAULT_STATUS,
-    RELATION_FIELD,
-    TITLE_FIELD,
+    CONFLICT_CHECK_MODES,
     DATE_FIELD,
+    DEFAULT_STATUS,
     DESCRIPTION_FIELD,
+    RELATION_FIELD,
     STATUS_BY_DATABASE,
+    TEMPLATE_RECURRENCE_MAX_OCCURRENCES,
+    TITLE_FIELD,
+    WORK_CLIENTS,
+    WORK_PROJECTS,
     DatabaseType,
     PersonalStatus,
     Priority,
     StudiesStatus,
     WorkStatus,
     YoutuberStatus,
-    WORK_CLIENTS,
-    WORK_PROJECTS,
 )
 from .formatters import (
     calculate_class_end_time,
     create_period,
+    duration_to_seconds,
     enforce_study_hours_limit,
     format_date_gmt3,
     format_duration,
+    format_seconds,
     get_next_business_day,
     get_study_hours,
+    is_treatment_pause,
     parse_duration,
 )
+from .log_policy import TOOL_CALL_LOG_POLICY, ToolCallLogPolicy, log_tool_call
+from .study_calendar import StudySlot, StudySlotCalendar
 from .validators import (
     ValidationError,
     validate_card_data,
@@ -52,6 +61,8 @@ __all__ = [
     "TITLE_FIELD",
     "DATE_FIELD",
     "DESCRIPTION_FIELD",
+    "CONFLICT_CHECK_MODES",
+    "TEMPLATE_RECURRENCE_MAX_OCCURRENCES",
     # Formatters
     "format_date_gmt3",
     "create_period",
@@ -59,8 +70,22 @@ __all__ = [
     "calculate_class_end_time",
     "enforce_study_hours_limit",
     "get_next_business_day",
+    "is_treatment_pause",
     "parse_duration",
     "format_duration",
+    "duration_to_seconds",
+    "format_seconds",
+    # Study calendar
+    "StudySlot",
+    "StudySlotCalendar",
+    # Checkpoints
+    "CheckpointManifest",
+    # Concurrency
+    "gather_bounded",
+    # Logging
+    "ToolCallLogPolicy",
+    "TOOL_CALL_LOG_POLICY",
+    "log_tool_call",
     # Validators
     "validate_title",
     "validate_status",
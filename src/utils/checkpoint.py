@@ -0,0 +1,174 @@
+"""
+Checkpoint manifests for resumable bulk imports.
+
+A manifest maps node paths of an import payload (``"course"``, ``"0"``,
+``"0.1"``, ``"0.1.3"`` for phase/section/class indexes) to the page created
+for them. While a level runs, each created node is appended to a journal
+next to the manifest; when the level ends (or fails) the manifest is saved
+atomically and the journal dropped. A failed, interrupted or killed import
+can therefore be rerun and only the missing nodes are created. A completed
+import deletes its manifest: the next import with the same title starts
+from scratch.
+"""
+
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Set, TextIO, Union
+
+import structlog
+
+from .constants import CHECKPOINT_DIR_VARIABLE, DEFAULT_CHECKPOINT_DIR
+
+logger = structlog.get_logger(__name__)
+
+
+class CheckpointManifest:
+    """
+    Node path -> created page ID, persisted as JSON
+
+    Args:
+        path: Manifest file
+        data: Previously saved manifest content
+    """
+
+    def __init__(self, path: Path, data: Optional[Dict[str, Any]] = None):
+        self.path = path
+        self.journal = path.with_suffix(".journal")
+        self._nodes: Dict[str, Dict[str, str]] = dict((data or {}).get("nodes", {}))
+        self.created = 0
+        self.skipped = 0
+        self._dirty = False
+        self._journal_file: Optional[TextIO] = None
+
+    @classmethod
+    def for_import(
+        cls,
+        database_id: str,
+        title: str,
+        resume: bool = True,
+        directory: Optional[Union[str, Path]] = None,
+    ) -> "CheckpointManifest":
+        """
+        Open the manifest of an import (one per database and root title)
+
+        Args:
+            database_id: Target database ID
+            title: Root card title (e.g., course title)
+            resume: Load existing progress; False starts a fresh manifest
+            directory: Manifest directory (default: ``NOTION_CHECKPOINT_DIR``
+                or ``logs/checkpoints``)
+
+        Returns:
+            Manifest bound to its file
+        """
+        directory = Path(directory or os.getenv(CHECKPOINT_DIR_VARIABLE, DEFAULT_CHECKPOINT_DIR))
+        digest = hashlib.sha1(f"{database_id}\n{title}".encode("utf-8")).hexdigest()[:16]
+        path = directory / f"{digest}.json"
+
+        data = None
+        if resume and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                logger.warning("checkpoint_unreadable", path=str(path), error=str(exc))
+
+        manifest = cls(path, data)
+        if resume:
+            manifest._replay_journal()
+        else:
+            manifest.journal.unlink(missing_ok=True)
+        if manifest._nodes:
+            logger.info("checkpoint_resumed", path=str(path), nodes=len(manifest._nodes))
+        return manifest
+
+    def get(self, node: str, title: str) -> Optional[str]:
+        """
+        Page ID recorded for ``node`` if it was created with the same title
+
+        A title mismatch means the payload changed at that position, so the
+        node is treated as missing.
+        """
+        entry = self._nodes.get(node)
+        if entry is None or entry.get("title") != title:
+            return None
+        self.skipped += 1
+        return entry["id"]
+
+    def page_ids(self) -> Set[str]:
+        """IDs of every page recorded so far"""
+        return {entry["id"] for entry in self._nodes.values()}
+
+    def record(self, node: str, title: str, page_id: str) -> None:
+        """Record a created node (journaled at once inside ``saving``, else by ``save``)"""
+        entry = {"id": page_id, "title": title}
+        self._nodes[node] = entry
+        self.created += 1
+        self._dirty = True
+        if self._journal_file is not None:
+            self._journal_file.write(json.dumps({"node": node, **entry}, ensure_ascii=False) + "\n")
+            self._journal_file.flush()
+
+    def save(self) -> None:
+        """Write the manifest atomically if nodes were recorded since the last save"""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_suffix(".tmp")
+        content = json.dumps({"nodes": self._nodes}, ensure_ascii=False)
+        temporary.write_text(content, encoding="utf-8")
+        os.replace(temporary, self.path)
+        self._dirty = False
+
+    @contextmanager
+    def saving(self) -> Iterator[None]:
+        """
+        Journal the nodes recorded in the enclosed level as they arrive
+
+        The manifest is saved (and the journal dropped) once the level ends,
+        whether it succeeded or failed; if the process dies first, the
+        journal is replayed by the next ``for_import``.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(self.journal, "a", encoding="utf-8") as journal:
+                self._journal_file = journal
+                try:
+                    yield
+                finally:
+                    self._journal_file = None
+        finally:
+            self.save()
+            self.journal.unlink(missing_ok=True)
+
+    def complete(self) -> None:
+        """Delete the manifest once every node exists (nothing left to resume)"""
+        self._dirty = False
+        for path in (self.path, self.journal):
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as exc:
+                logger.warning("checkpoint_not_removed", path=str(path), error=str(exc))
+
+    def _replay_journal(self) -> None:
+        """Add nodes journaled by a level that never finished"""
+        try:
+            lines = self.journal.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return
+        except OSError as exc:
+            logger.warning("checkpoint_journal_unreadable", path=str(self.journal), error=str(exc))
+            return
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                self._nodes[entry["node"]] = {"id": entry["id"], "title": entry["title"]}
+            except (ValueError, KeyError, TypeError):
+                continue  # Line cut short by the interruption
+        self._dirty = bool(lines)
+
+    def summary(self) -> Dict[str, Any]:
+        """Manifest location and created/skipped counters"""
+        return {"path": str(self.path), "created": self.created, "skipped": self.skipped}
@@ -0,0 +1,67 @@
+"""
+Bounded concurrency helpers for bulk Notion operations.
+
+Throughput is governed by the service rate limiter; the bound here only
+keeps the number of in-flight requests (and open sockets) small. Every
+item is reported to the progress tracker bound to the caller's context
+(see ``utils/progress.py``), which is how background jobs count work.
+"""
+
+import asyncio
+from typing import Awaitable, Iterable, List, TypeVar
+
+from .constants import BULK_CONCURRENCY
+from .progress import report_done, report_total
+
+T = TypeVar("T")
+
+
+async def gather_bounded(
+    awaitables: Iterable[Awaitable[T]],
+    limit: int = BULK_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> List[T]:
+    """
+    Await all items with at most ``limit`` running at once
+
+    Results keep the input order. Every item runs to completion before the
+    first failure (in input order) is re-raised, so no request is abandoned
+    halfway.
+
+    Args:
+        awaitables: Coroutines or futures to run
+        limit: Maximum number running concurrently
+        return_exceptions: Return exceptions in place of results instead of raising
+
+    Returns:
+        Results (or exceptions) in input order
+
+    Example:
+        >>> pages = await gather_bounded(service.get_page(pid) for pid in page_ids)
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+    items = list(awaitables)
+    report_total(len(items))
+
+    async def run(item: Awaitable[T]) -> T:
+        try:
+            async with semaphore:
+                result = await item
+        except asyncio.CancelledError:
+            # Items still queued behind the semaphore were never started
+            if asyncio.iscoroutine(item):
+                item.close()
+            raise
+        except Exception as exc:
+            report_done(error=exc)
+            raise
+        report_done(result)
+        return result
+
+    results = await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
+    if return_exceptions:
+        return results  # type: ignore[return-value]
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results  # type: ignore[return-value]
@@ -131,6 +131,20 @@ STUDY_HOURS = {
     "max_end": 21,  # NUNCA passar das 21:00
 }
 
+# Treatment pause windows as (month, first day, last day): Tuesday keeps default hours
+STUDY_TREATMENT_PAUSES = (
+    (12, 18, 31),  # Last 2 weeks of December
+    (1, 1, 14),  # First 2 weeks of January
+)
+STUDY_CALENDAR_HORIZON_DAYS = 366  # Initial span of a StudySlotCalendar (grows on demand)
+
+# Scheduling conflicts (see services/schedule_index.py)
+SCHEDULE_MAX_INTERVAL_HOURS = 24  # Longer periods are containers, not appointments
+CONFLICT_CHECK_MODES = ["off", "report", "reject"]
+
+# Personal template recurrence (see PersonalNotion.use_template_recurring)
+TEMPLATE_RECURRENCE_MAX_OCCURRENCES = 400
+
 # YouTube recording hours
 YOUTUBE_HOURS = {
     "start": 21,  # 21:00
@@ -147,3 +161,42 @@ NOTION_BASE_URL = "https://api.notion.com/v1"
 REQUEST_TIMEOUT = 30
 MAX_RETRIES = 3
 RATE_LIMIT_PER_SECOND = 3
+BULK_CONCURRENCY = 6  # In-flight requests per bulk operation (see utils/concurrency.py)
+BATCH_MAX_CALLS = 100  # Tool calls per notion_batch request (see runtime/batch.py)
+
+# MCP resources (see runtime/resources.py)
+RESOURCE_POLL_INTERVAL_SECONDS = 300  # Schema change checks of cached database resources
+CARD_RESOURCE_PAGE_SIZE = 50  # Cards per page of notion://database/{type}/cards
+CARD_RESOURCE_MAX_PAGE_SIZE = 200
+
+# Tool result size budget (see runtime/results.py)
+RESULT_BUDGET_BYTES = 48_000  # Larger results are paged through notion_result_continue
+RESULT_CACHE_LIMIT = 32  # Truncated results kept for continuation
+RESULT_CACHE_TTL_SECONDS = 900
+
+# Metrics (see utils/metrics.py)
+METRICS_LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+METRICS_COUNT_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+METRICS_FILE_VARIABLE = "NOTION_METRICS_FILE"  # Prometheus textfile, e.g. logs/metrics.prom
+METRICS_WRITE_INTERVAL_SECONDS = 60
+
+# Tracing (see utils/tracing.py)
+TRACE_FILE_VARIABLE = "NOTION_TRACE_FILE"  # OTLP/JSON lines, e.g. logs/traces.jsonl
+TRACE_SERVICE_NAME = "notion-mcp"
+TRACE_MAX_SPANS_PER_TRACE = 5000
+
+# Background jobs (see runtime/jobs.py and utils/progress.py)
+JOB_HISTORY_LIMIT = 50  # Finished jobs kept for job_status/job_result
+PROGRESS_PARTIAL_LIMIT = 200  # Partial results kept per job
+PROGRESS_NOTIFY_INTERVAL = 0.25  # Seconds between MCP progress notifications of a call
+
+# Resumable imports (see utils/checkpoint.py)
+CHECKPOINT_DIR_VARIABLE = "NOTION_CHECKPOINT_DIR"
+DEFAULT_CHECKPOINT_DIR = "logs/checkpoints"
+
+# Tool-call argument logging (see utils/log_policy.py)
+LOG_ARGUMENT_MAX_CHARS = 200  # Characters kept per string value
+LOG_ARGUMENT_MAX_ITEMS = 10  # Items kept per list/dict
+LOG_ARGUMENT_MAX_DEPTH = 4  # Nesting depth rendered
+LOG_SAMPLE_BURST = 5  # Calls per tool always logged
+LOG_SAMPLE_EVERY = 20  # After the burst, log one call out of N
@@ -9,11 +9,13 @@ from typing import Optional, Tuple, Union
 
 import pytz
 
-from .constants import STUDY_HOURS
+from .constants import STUDY_HOURS, STUDY_TREATMENT_PAUSES
 
 # Sao Paulo timezone (GMT-3)
 SAO_PAULO_TZ = pytz.timezone("America/Sao_Paulo")
 
+_DAYS_TO_NEXT_BUSINESS_DAY = (1, 1, 1, 1, 3, 2, 1)
+
 
 def format_date_gmt3(dt: datetime, include_time: bool = True) -> str:
     """
@@ -80,38 +82,42 @@ def create_period(
     return result
 
 
+def is_treatment_pause(date: datetime) -> bool:
+    """
+    Check whether a date falls in a treatment pause window
+
+    Args:
+        date: Date to check
+
+    Returns:
+        True during the windows of ``STUDY_TREATMENT_PAUSES``
+    """
+    month, day = date.month, date.day
+    return any(
+        month == pause_month and first <= day <= last
+        for pause_month, first, last in STUDY_TREATMENT_PAUSES
+    )
+
+
 def get_study_hours(weekday: int = 0, date: Optional[datetime] = None) -> Tuple[float, int]:
     """
     Return study hours for the given weekday based on configuration.
-    
+
     Rules:
     - Default: 19:00-21:00
     - Tuesday: 19:30-21:00 (except during treatment pause periods)
     - Treatment pause: First 2 weeks of January and last 2 weeks of December
       During pause, Tuesday uses default hours (19:00-21:00)
-    
+
     Args:
         weekday: Day of week (0=Monday, 1=Tuesday, etc.)
         date: Optional datetime to check for treatment pause periods
-    
+
     Returns:
         Tuple of (start_hour, end_hour)
     """
-    # Check if we're in treatment pause period
-    in_treatment_pause = False
-    if date:
-        month = date.month
-        day = date.day
-        
-        # Last 2 weeks of December (days 18-31)
-        if month == 12 and day >= 18:
-            in_treatment_pause = True
-        # First 2 weeks of January (days 1-14)
-        elif month == 1 and day <= 14:
-            in_treatment_pause = True
-    
     # Tuesday special schedule (only if NOT in treatment pause)
-    if weekday == 1 and "tuesday" in STUDY_HOURS and not in_treatment_pause:
+    if weekday == 1 and "tuesday" in STUDY_HOURS and not (date and is_treatment_pause(date)):
         config = STUDY_HOURS["tuesday"]
     else:
         config = STUDY_HOURS["default"]
@@ -188,10 +194,8 @@ def get_next_business_day(date: datetime) -> datetime:
     Returns:
         Next business day
     """
-    next_day = date + timedelta(days=1)
-    while next_day.weekday() >= 5:  # Skip Saturday (5) and Sunday (6)
-        next_day += timedelta(days=1)
-    return next_day
+    # Friday -> Monday, Saturday -> Monday, otherwise the following day
+    return date + timedelta(days=_DAYS_TO_NEXT_BUSINESS_DAY[date.weekday()])
 
 
 def parse_duration(duration_str: str) -> int:
@@ -223,6 +227,43 @@ def parse_duration(duration_str: str) -> int:
         raise ValueError(f"Invalid duration format: {duration_str}")
 
 
+def duration_to_seconds(duration_str: str) -> int:
+    """
+    Parse a duration string to whole seconds
+
+    Args:
+        duration_str: Duration in format 'HH:MM:SS' or 'MM:SS' (hours may exceed 24)
+
+    Returns:
+        Total seconds
+
+    Examples:
+        >>> duration_to_seconds('40:00:00')
+        144000
+    """
+    parts = duration_str.strip().split(":")
+    if len(parts) not in (2, 3):
+        raise ValueError(f"Invalid duration format: {duration_str}")
+
+    seconds = 0
+    for part in parts:
+        seconds = seconds * 60 + int(part)
+    return seconds
+
+
+def format_seconds(seconds: int) -> str:
+    """
+    Format whole seconds to HH:MM:SS (hours may exceed 24)
+
+    Examples:
+        >>> format_seconds(144000)
+        '40:00:00'
+    """
+    hours, rest = divmod(int(seconds), 3600)
+    minutes, secs = divmod(rest, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
 def format_duration(minutes: Union[int, float]) -> str:
     """
     Format minutes to HH:MM:SS
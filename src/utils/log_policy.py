@@ -0,0 +1,189 @@
+"""
+Logging policy for tool-call arguments.
+
+Tool handlers receive payloads that can hold hundreds of classes or episodes.
+This module keeps those log records cheap:
+- Large strings, lists and nested objects are truncated
+- Repetitive calls to the same tool are sampled
+- Serialization only happens when a record is actually rendered
+- Bytes rendered per tool are tracked so the logging cost is visible
+"""
+
+import json
+from collections import defaultdict
+from typing import Any, Dict
+
+from .constants import (
+    LOG_ARGUMENT_MAX_CHARS,
+    LOG_ARGUMENT_MAX_DEPTH,
+    LOG_ARGUMENT_MAX_ITEMS,
+    LOG_SAMPLE_BURST,
+    LOG_SAMPLE_EVERY,
+)
+
+
+class LazyArguments:
+    """
+    Deferred, size-capped view over tool arguments
+
+    Nothing is copied or serialized at construction time. structlog calls
+    ``__structlog__`` (JSON renderer) or ``repr`` (console renderer) only when
+    the record is emitted, so filtered-out records cost a single allocation.
+    """
+
+    __slots__ = ("_policy", "_tool", "_arguments", "_rendered")
+
+    def __init__(self, policy: "ToolCallLogPolicy", tool: str, arguments: Any):
+        self._policy = policy
+        self._tool = tool
+        self._arguments = arguments
+        self._rendered: Any = None
+
+    def __structlog__(self) -> Any:
+        if self._rendered is None:
+            self._rendered = self._policy.truncate(self._arguments)
+            size = len(json.dumps(self._rendered, ensure_ascii=False, default=str).encode("utf-8"))
+            self._policy.record_bytes(self._tool, size)
+        return self._rendered
+
+    def __repr__(self) -> str:
+        return repr(self.__structlog__())
+
+
+class ToolCallLogPolicy:
+    """
+    Truncation and sampling rules for tool-call log records
+
+    Sampling is per tool: the first ``burst`` calls are always logged, then
+    only one call out of every ``sample_every``. Skipped calls are counted and
+    reported on the next emitted record.
+
+    Args:
+        max_chars: Maximum characters kept from a string value
+        max_items: Maximum items kept from a list or dict
+        max_depth: Maximum nesting depth rendered
+        burst: Calls always logged before sampling kicks in
+        sample_every: Log one call out of N after the burst (1 disables sampling)
+    """
+
+    def __init__(
+        self,
+        max_chars: int = LOG_ARGUMENT_MAX_CHARS,
+        max_items: int = LOG_ARGUMENT_MAX_ITEMS,
+        max_depth: int = LOG_ARGUMENT_MAX_DEPTH,
+        burst: int = LOG_SAMPLE_BURST,
+        sample_every: int = LOG_SAMPLE_EVERY,
+    ):
+        self.max_chars = max_chars
+        self.max_items = max_items
+        self.max_depth = max_depth
+        self.burst = burst
+        self.sample_every = max(1, sample_every)
+
+        self._calls: Dict[str, int] = defaultdict(int)
+        self._logged: Dict[str, int] = defaultdict(int)
+        self._skipped: Dict[str, int] = defaultdict(int)
+        self._bytes: Dict[str, int] = defaultdict(int)
+
+    def log_tool_call(self, log: Any, event: str, tool: str, arguments: Any) -> None:
+        """
+        Emit a tool-call record if the sampler lets it through
+
+        Args:
+            log: structlog logger
+            event: Event name (e.g., "handling_study_tool")
+            tool: Tool name
+            arguments: Raw tool arguments
+        """
+        self._calls[tool] += 1
+        count = self._calls[tool]
+
+        if count > self.burst and (count - self.burst) % self.sample_every:
+            self._skipped[tool] += 1
+            return
+
+        skipped = self._skipped.pop(tool, 0)
+        self._logged[tool] += 1
+
+        log.info(
+            event,
+            tool=tool,
+            args=LazyArguments(self, tool, arguments),
+            call_count=count,
+            sampled_out=skipped,
+        )
+
+    def truncate(self, value: Any, depth: int = 0) -> Any:
+        """
+        Return a size-capped copy of ``value`` safe to serialize
+
+        Args:
+            value: Any JSON-like value
+            depth: Current nesting depth
+
+        Returns:
+            Truncated value
+        """
+        if isinstance(value, str):
+            if len(value) <= self.max_chars:
+                return value
+            return f"{value[:self.max_chars]}...(+{len(value) - self.max_chars} chars)"
+
+        if value is None or isinstance(value, (bool, int, float)):
+            return value
+
+        if isinstance(value, dict):
+            if depth >= self.max_depth:
+                return f"<dict with {len(value)} keys>"
+            result: Dict[str, Any] = {}
+            for index, (key, item) in enumerate(value.items()):
+                if index >= self.max_items:
+                    result["..."] = f"+{len(value) - self.max_items} keys"
+                    break
+                result[str(key)] = self.truncate(item, depth + 1)
+            return result
+
+        if isinstance(value, (list, tuple)):
+            if depth >= self.max_depth:
+                return f"<list with {len(value)} items>"
+            items = [self.truncate(item, depth + 1) for item in value[: self.max_items]]
+            if len(value) > self.max_items:
+                items.append(f"...(+{len(value) - self.max_items} items)")
+            return items
+
+        return self.truncate(str(value), depth)
+
+    def record_bytes(self, tool: str, size: int) -> None:
+        """Account bytes rendered for a tool's arguments"""
+        self._bytes[tool] += size
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Per-tool logging counters
+
+        Returns:
+            Dict mapping tool name to calls, logged records and bytes rendered
+        """
+        return {
+            tool: {
+                "calls": calls,
+                "logged": self._logged.get(tool, 0),
+                "bytes": self._bytes.get(tool, 0),
+            }
+            for tool, calls in self._calls.items()
+        }
+
+    def reset(self) -> None:
+        """Clear all counters"""
+        self._calls.clear()
+        self._logged.clear()
+        self._skipped.clear()
+        self._bytes.clear()
+
+
+TOOL_CALL_LOG_POLICY = ToolCallLogPolicy()
+
+
+def log_tool_call(log: Any, event: str, tool: str, arguments: Any) -> None:
+    """Log a tool call through the shared :data:`TOOL_CALL_LOG_POLICY`"""
+    TOOL_CALL_LOG_POLICY.log_tool_call(log, event, tool, arguments)
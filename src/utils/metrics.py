@@ -0,0 +1,262 @@
+"""
+In-process metrics: tool latency, Notion API calls, caches and payloads.
+
+A single registry (:data:`METRICS`) collects counters and latency
+histograms keyed by name and labels. The runtime times every tool call
+(``tool_call``), ``NotionService`` records each HTTP request, and caches
+report hits and misses. The registry renders as JSON (``notion://metrics``
+resource) or as Prometheus text exposition (optional textfile under
+``logs/``).
+"""
+
+import os
+import re
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .constants import METRICS_COUNT_BUCKETS, METRICS_LATENCY_BUCKETS_MS
+
+Labels = Tuple[Tuple[str, str], ...]
+
+_ID_SEGMENT = re.compile(r"(?<=/)[0-9a-fA-F]{8}-?(?:[0-9a-fA-F]{4}-?){3}[0-9a-fA-F]{12}(?=/|$)")
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Endpoint with IDs replaced (``pages/<uuid>`` -> ``pages/{id}``) to bound label values"""
+    return _ID_SEGMENT.sub("{id}", "/" + endpoint.strip("/"))[1:]
+
+
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus semantics)"""
+
+    __slots__ = ("bounds", "counts", "count", "sum", "max")
+
+    def __init__(self, bounds: Tuple[float, ...] = METRICS_LATENCY_BUCKETS_MS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # Last slot: +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the ``q`` quantile (``None`` if empty)
+
+        Beyond the last bucket, the largest observed value is returned.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts[:-1], strict=True):  # Without +Inf
+            seen += count
+            if seen >= rank:
+                return bound
+        return round(self.max, 1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 1),
+            "avg": round(self.sum / self.count, 1) if self.count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "max": round(self.max, 1),
+        }
+
+
+class _ToolCall:
+    """Notion requests made on behalf of one tool invocation"""
+
+    __slots__ = ("tool", "notion_calls")
+
+    def __init__(self, tool: str):
+        self.tool = tool
+        self.notion_calls = 0
+
+
+_current_call: ContextVar[Optional[_ToolCall]] = ContextVar("metrics_tool_call", default=None)
+
+
+class MetricsRegistry:
+    """
+    Counters and histograms keyed by metric name and labels
+
+    Metric names follow Prometheus conventions (``_total`` counters,
+    ``_ms`` histograms).
+    """
+
+    def __init__(self) -> None:
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self._started = time.time()
+
+    def inc(self, name: str, amount: float = 1, **labels: Any) -> None:
+        """Add ``amount`` to a counter"""
+        key = (name, _labels(labels))
+        self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        bounds: Tuple[float, ...] = METRICS_LATENCY_BUCKETS_MS,
+        **labels: Any,
+    ) -> None:
+        """Record a value (milliseconds by default) in a histogram"""
+        key = (name, _labels(labels))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = Histogram(bounds)
+        histogram.observe(value)
+
+    @contextmanager
+    def tool_call(self, tool: str) -> Iterator[None]:
+        """
+        Time a tool invocation and count the Notion requests it makes
+
+        Nested invocations (e.g., calls inside ``notion_batch``) are timed
+        too; their requests also count towards the enclosing call.
+        """
+        call = _ToolCall(tool)
+        parent = _current_call.get()
+        token = _current_call.set(call)
+        start = time.perf_counter()
+        status = "error"
+        try:
+            yield
+            status = "ok"
+        finally:
+            _current_call.reset(token)
+            if parent is not None:
+                parent.notion_calls += call.notion_calls
+            self.inc("tool_calls_total", tool=tool, status=status)
+            self.observe("tool_latency_ms", (time.perf_counter() - start) * 1000, tool=tool)
+            self.observe("tool_notion_calls", call.notion_calls, METRICS_COUNT_BUCKETS, tool=tool)
+
+    def record_request(
+        self,
+        method: str,
+        endpoint: str,
+        status: int,
+        elapsed_ms: float,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+    ) -> None:
+        """Record one Notion API request (attributed to the current tool call)"""
+        call = _current_call.get()
+        if call is not None:
+            call.notion_calls += 1
+        template = endpoint_template(endpoint)
+        tool = call.tool if call is not None else ""
+        self.inc("notion_requests_total", method=method, endpoint=template, status=status)
+        self.observe("notion_request_latency_ms", elapsed_ms, method=method, endpoint=template)
+        if status == 429:
+            self.inc("notion_rate_limited_total", endpoint=template, tool=tool)
+        if request_bytes:
+            self.inc("notion_payload_bytes_total", request_bytes, direction="sent")
+        if response_bytes:
+            self.inc("notion_payload_bytes_total", response_bytes, direction="received")
+
+    def record_cache(self, cache: str, hit: bool) -> None:
+        """Count a cache lookup"""
+        self.inc("cache_requests_total", cache=cache, result="hit" if hit else "miss")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON view: counters, histogram summaries and cache hit ratios"""
+        counters: Dict[str, List[Dict[str, Any]]] = {}
+        for (name, labels), value in sorted(self._counters.items()):
+            counters.setdefault(name, []).append({**dict(labels), "value": value})
+        histograms: Dict[str, List[Dict[str, Any]]] = {}
+        for (name, labels), histogram in sorted(self._histograms.items(), key=lambda i: i[0]):
+            histograms.setdefault(name, []).append({**dict(labels), **histogram.snapshot()})
+
+        lookups: Dict[str, Dict[str, float]] = {}
+        for (name, labels), value in self._counters.items():
+            if name == "cache_requests_total":
+                label_map = dict(labels)
+                lookups.setdefault(label_map["cache"], {})[label_map["result"]] = value
+        hit_ratios = {
+            cache: round(counts.get("hit", 0) / sum(counts.values()), 3)
+            for cache, counts in sorted(lookups.items())
+        }
+
+        return {
+            "uptime_seconds": round(time.time() - self._started, 1),
+            "counters": counters,
+            "histograms": histograms,
+            "cache_hit_ratio": hit_ratios,
+        }
+
+    def render_prometheus(self, prefix: str = "notion_mcp_") -> str:
+        """Prometheus text exposition of every metric"""
+        lines: List[str] = []
+        typed = set()
+        for (name, labels), value in sorted(self._counters.items()):
+            metric = prefix + name
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} counter")
+                typed.add(metric)
+            lines.append(f"{metric}{_render_labels(labels)} {_number(value)}")
+        for (name, labels), histogram in sorted(self._histograms.items(), key=lambda i: i[0]):
+            metric = prefix + name
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} histogram")
+                typed.add(metric)
+            cumulative = 0
+            for bound, count in zip(
+                histogram.bounds + (float("inf"),), histogram.counts, strict=True
+            ):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _number(bound)
+                lines.append(
+                    f"{metric}_bucket{_render_labels(labels + (('le', le),))} {cumulative}"
+                )
+            lines.append(f"{metric}_sum{_render_labels(labels)} {_number(histogram.sum)}")
+            lines.append(f"{metric}_count{_render_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """Write the text exposition atomically (node-exporter textfile style)"""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temporary = target.with_name(f".{target.name}.tmp")
+        temporary.write_text(self.render_prometheus(), encoding="utf-8")
+        os.replace(temporary, target)
+
+    def reset(self) -> None:
+        """Drop every metric"""
+        self._counters.clear()
+        self._histograms.clear()
+        self._started = time.time()
+
+
+def _labels(labels: Dict[str, Any]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _render_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else f"{value:.3f}"
+
+
+# Shared by the whole process
+METRICS = MetricsRegistry()
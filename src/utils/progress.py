@@ -0,0 +1,138 @@
+"""
+Progress reporting for long-running operations.
+
+The runtime binds a ``ProgressTracker`` to the context of a background job
+(or of a request); bulk helpers such as ``gather_bounded`` report into
+whatever tracker is bound, so domain code needs no extra parameter. With
+no tracker bound, reporting is a no-op.
+"""
+
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional
+
+from .constants import PROGRESS_PARTIAL_LIMIT
+
+_current: ContextVar[Optional["ProgressTracker"]] = ContextVar("progress_tracker", default=None)
+
+
+class ProgressTracker:
+    """
+    Counts of planned/finished work items, the current stage (e.g.,
+    ``"sections"``) with the time spent per stage, and a bounded list of
+    partial results
+
+    Args:
+        partial_limit: Partial results kept (oldest first)
+        on_change: Called after every update (e.g., to forward notifications)
+    """
+
+    def __init__(
+        self,
+        partial_limit: int = PROGRESS_PARTIAL_LIMIT,
+        on_change: Optional[Callable[["ProgressTracker"], None]] = None,
+    ):
+        self.total = 0
+        self.done = 0
+        self.failed = 0
+        self.partial: List[Any] = []
+        self.partial_limit = partial_limit
+        self.on_change = on_change
+        self.stage: Optional[str] = None
+        self.stage_timings: Dict[str, float] = {}
+        self._stage_started = time.perf_counter()
+
+    def set_stage(self, stage: str) -> None:
+        """Enter a new stage, closing the timing of the previous one"""
+        self._close_stage()
+        self.stage = stage
+        self._changed()
+
+    def add_total(self, count: int) -> None:
+        """Announce ``count`` more work items"""
+        self.total += count
+        self._changed()
+
+    def advance(self, result: Any = None, error: Optional[BaseException] = None) -> None:
+        """Mark one work item as finished"""
+        if error is not None:
+            self.failed += 1
+        else:
+            self.done += 1
+            if result is not None and len(self.partial) < self.partial_limit:
+                self.partial.append(_summarize(result))
+        self._changed()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counters (and current stage, once set) as a dict"""
+        snapshot: Dict[str, Any] = {"done": self.done, "failed": self.failed, "total": self.total}
+        if self.stage is not None:
+            snapshot["stage"] = self.stage
+        return snapshot
+
+    def message(self) -> str:
+        """Human-readable progress line, e.g. ``"classes: 12/40"``"""
+        counts = f"{self.done + self.failed}/{self.total}"
+        if self.failed:
+            counts += f" ({self.failed} failed)"
+        return f"{self.stage}: {counts}" if self.stage else counts
+
+    def finish(self) -> Dict[str, float]:
+        """Close the current stage and return milliseconds spent per stage"""
+        self._close_stage()
+        self.stage_timings = {key: round(value, 1) for key, value in self.stage_timings.items()}
+        return dict(self.stage_timings)
+
+    def _close_stage(self) -> None:
+        now = time.perf_counter()
+        if self.stage is not None:
+            elapsed = (now - self._stage_started) * 1000
+            self.stage_timings[self.stage] = self.stage_timings.get(self.stage, 0.0) + elapsed
+        self._stage_started = now
+
+    def _changed(self) -> None:
+        if self.on_change is not None:
+            self.on_change(self)
+
+
+def _summarize(result: Any) -> Any:
+    # Pages are large; their ID (and URL) is what a caller needs to follow up
+    if isinstance(result, dict) and "id" in result:
+        return {key: result[key] for key in ("object", "id", "url") if key in result}
+    return result
+
+
+def bind_tracker(tracker: Optional[ProgressTracker]) -> Any:
+    """Bind ``tracker`` to the current context; returns a token for ``reset_tracker``"""
+    return _current.set(tracker)
+
+
+def reset_tracker(token: Any) -> None:
+    """Restore the tracker bound before ``bind_tracker``"""
+    _current.reset(token)
+
+
+def current_tracker() -> Optional[ProgressTracker]:
+    """Tracker bound to the current context, if any"""
+    return _current.get()
+
+
+def report_total(count: int) -> None:
+    """Announce ``count`` more work items to the bound tracker"""
+    tracker = _current.get()
+    if tracker is not None and count:
+        tracker.add_total(count)
+
+
+def report_stage(stage: str) -> None:
+    """Name the stage the bound tracker is in (e.g., ``"classes"``)"""
+    tracker = _current.get()
+    if tracker is not None:
+        tracker.set_stage(stage)
+
+
+def report_done(result: Any = None, error: Optional[BaseException] = None) -> None:
+    """Mark one work item as finished on the bound tracker"""
+    tracker = _current.get()
+    if tracker is not None:
+        tracker.advance(result, error)
@@ -0,0 +1,179 @@
+"""
+Precomputed calendar of valid study slots.
+
+One pass over the horizon resolves weekday hours, Tuesday hours and
+treatment pauses into flat arrays, so bulk scheduling does constant work
+per class instead of re-evaluating the rules day by day.
+"""
+
+from array import array
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .constants import STUDY_CALENDAR_HORIZON_DAYS
+from .formatters import get_study_hours
+
+_NO_SLOT = 0xFFFF
+
+
+class StudySlot(NamedTuple):
+    """Study window of one day"""
+
+    start: datetime
+    end: datetime
+
+    @property
+    def minutes(self) -> int:
+        return int((self.end - self.start).total_seconds() // 60)
+
+
+class StudySlotCalendar:
+    """
+    Valid study slots from ``start`` onwards
+
+    Per day of the horizon, ``_start_minute``/``_end_minute`` hold the study
+    window (``_NO_SLOT`` when the day is skipped) and ``_next_day`` holds
+    the offset of the first slot on or after that day. The arrays are grown
+    transparently when a lookup goes past the horizon.
+
+    Args:
+        start: First day of the calendar (its tzinfo is kept on slots)
+        horizon_days: Initial number of days precomputed
+        skip_weekends: Leave Saturdays and Sundays without slots
+
+    Example:
+        >>> calendar = StudySlotCalendar(datetime(2025, 1, 6))
+        >>> periods = calendar.assign([120, 90, 90])
+    """
+
+    def __init__(
+        self,
+        start: Union[date, datetime],
+        horizon_days: int = STUDY_CALENDAR_HORIZON_DAYS,
+        skip_weekends: bool = True,
+    ):
+        self.origin = start.date() if isinstance(start, datetime) else start
+        self.tzinfo = start.tzinfo if isinstance(start, datetime) else None
+        self.skip_weekends = skip_weekends
+        self._start_minute = array("H")
+        self._end_minute = array("H")
+        self._next_day = array("l")
+        self._extend(max(7, horizon_days))
+
+    @property
+    def horizon_days(self) -> int:
+        return len(self._start_minute)
+
+    def slot_on_or_after(self, day: Union[date, datetime]) -> StudySlot:
+        """
+        First study slot on ``day`` or later
+
+        Args:
+            day: Reference day (time of day is ignored)
+
+        Returns:
+            Slot of the first valid day
+        """
+        return self._slot(self._next_slot_offset(self._offset(day)))
+
+    def next_slot(self, after: Union[date, datetime]) -> StudySlot:
+        """First study slot strictly after the day of ``after``"""
+        return self._slot(self._next_slot_offset(self._offset(after) + 1))
+
+    def window(self, day: Union[date, datetime]) -> Optional[StudySlot]:
+        """Study slot of ``day`` itself, or ``None`` when the day has none"""
+        offset = self._offset(day)
+        self._ensure(offset)
+        if self._start_minute[offset] == _NO_SLOT:
+            return None
+        return self._slot(offset)
+
+    def assign(
+        self,
+        durations: Iterable[int],
+        start: Optional[Union[date, datetime]] = None,
+    ) -> List[Tuple[datetime, datetime]]:
+        """
+        Schedule classes on consecutive study slots
+
+        Args:
+            durations: Duration in minutes of each class, in order
+            start: First day to use (default: calendar start)
+
+        Returns:
+            ``(start, end)`` of each class
+
+        Raises:
+            ValueError: If a duration is not positive or does not fit its slot
+        """
+        offset = self._next_slot_offset(self._offset(start or self.origin))
+        periods: List[Tuple[datetime, datetime]] = []
+
+        for duration in durations:
+            duration = int(duration)
+            if duration <= 0:
+                raise ValueError("Class duration must be greater than zero.")
+
+            slot = self._slot(offset)
+            if duration > slot.minutes:
+                raise ValueError(
+                    f"Duration exceeds the daily limit on {slot.start.date().isoformat()} "
+                    "(finishes after 21:00). Reduce the workload or reschedule."
+                )
+
+            periods.append((slot.start, slot.start + timedelta(minutes=duration)))
+            offset = self._next_slot_offset(offset + 1)
+
+        return periods
+
+    def _offset(self, day: Union[date, datetime]) -> int:
+        day = day.date() if isinstance(day, datetime) else day
+        offset = (day - self.origin).days
+        if offset < 0:
+            raise ValueError(f"{day.isoformat()} is before the calendar start.")
+        return offset
+
+    def _next_slot_offset(self, offset: int) -> int:
+        self._ensure(offset)
+        next_offset = self._next_day[offset]
+        while next_offset < 0:
+            # No slot until the end of the horizon: grow and resolve again
+            self._ensure(self.horizon_days)
+            next_offset = self._next_day[offset]
+        return next_offset
+
+    def _slot(self, offset: int) -> StudySlot:
+        day = self.origin + timedelta(days=offset)
+        start_minute = self._start_minute[offset]
+        end_minute = self._end_minute[offset]
+        return StudySlot(
+            datetime.combine(day, time(start_minute // 60, start_minute % 60), self.tzinfo),
+            datetime.combine(day, time(end_minute // 60, end_minute % 60), self.tzinfo),
+        )
+
+    def _ensure(self, offset: int) -> None:
+        if offset >= self.horizon_days:
+            self._extend(max(offset + 1, self.horizon_days * 2))
+
+    def _extend(self, total_days: int) -> None:
+        first = self.horizon_days
+        for offset in range(first, total_days):
+            day = self.origin + timedelta(days=offset)
+            weekday = day.weekday()
+            if self.skip_weekends and weekday >= 5:
+                self._start_minute.append(_NO_SLOT)
+                self._end_minute.append(_NO_SLOT)
+                continue
+            start_hour, end_hour = get_study_hours(weekday, date=day)
+            self._start_minute.append(int(round(start_hour * 60)))
+            self._end_minute.append(int(round(end_hour * 60)))
+
+        # Backward pass: nearest slot on or after each day (-1 past the horizon)
+        self._next_day.extend([-1] * (total_days - first))
+        following = -1
+        for offset in range(total_days - 1, -1, -1):
+            if offset < first and self._next_day[offset] >= 0:
+                break
+            if self._start_minute[offset] != _NO_SLOT:
+                following = offset
+            self._next_day[offset] = following
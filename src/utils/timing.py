@@ -0,0 +1,51 @@
+"""
+Lightweight wall-clock timing helpers.
+
+Used to report where time goes in multi-step operations (server boot,
+level-by-level course creation) without pulling in a profiler.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+class PhaseTimer:
+    """
+    Accumulates elapsed milliseconds per named phase
+
+    Example:
+        >>> timer = PhaseTimer()
+        >>> with timer.phase("load_config"):
+        ...     config = load_config()
+        >>> timer.as_dict()
+        {'load_config': 1.2, 'total': 1.2}
+    """
+
+    def __init__(self) -> None:
+        self._started = time.perf_counter()
+        self._phases: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block under ``name`` (repeated names accumulate)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    def record(self, name: str, elapsed_ms: float) -> None:
+        """Add an externally measured duration to ``name``"""
+        self._phases[name] = self._phases.get(name, 0.0) + elapsed_ms
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        Phase durations rounded to 0.1 ms, plus total elapsed since creation
+
+        Returns:
+            Dict mapping phase name to milliseconds
+        """
+        result = {name: round(value, 1) for name, value in self._phases.items()}
+        result["total"] = round((time.perf_counter() - self._started) * 1000, 1)
+        return result
@@ -0,0 +1,304 @@
+"""
+Lightweight tracing: spans from a tool call down to each HTTP request.
+
+Spans nest through a context variable, so the dispatcher, the custom layer
+and ``NotionService`` open spans without passing anything around, and
+background jobs inherit the span that started them. Finished spans are
+grouped per trace and appended to a JSONL file, one OTLP/JSON
+``resourceSpans`` document per line (the format of the OpenTelemetry
+Collector ``file`` exporter, readable by its ``otlpjsonfile`` receiver).
+
+With no exporter configured, ``span`` yields a no-op span and nothing is
+recorded.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .constants import TRACE_MAX_SPANS_PER_TRACE, TRACE_SERVICE_NAME
+
+# OTLP ``Span.SpanKind`` and ``Status.StatusCode`` values
+KIND_INTERNAL = 1
+KIND_SERVER = 2
+KIND_CLIENT = 3
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class Span:
+    """One timed operation of a trace"""
+
+    __slots__ = (
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "name",
+        "kind",
+        "attributes",
+        "events",
+        "start_ns",
+        "end_ns",
+        "status",
+        "status_message",
+        "_started",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str],
+        kind: int,
+        attributes: Dict[str, Any],
+    ):
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.attributes = attributes
+        self.events: List[Dict[str, Any]] = []
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.status = STATUS_UNSET
+        self.status_message = ""
+        self._started = time.perf_counter_ns()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def add_event(self, name: str, **attributes: Any) -> None:
+        self.events.append(
+            {
+                "timeUnixNano": str(time.time_ns()),
+                "name": name,
+                "attributes": _attributes(attributes),
+            }
+        )
+
+    def record_error(self, error: BaseException) -> None:
+        self.status = STATUS_ERROR
+        self.status_message = f"{type(error).__name__}: {error}"
+
+    def end(self) -> None:
+        # Monotonic duration, so the end never precedes the start
+        self.end_ns = self.start_ns + time.perf_counter_ns() - self._started
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Span in OTLP/JSON encoding"""
+        span: Dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": _attributes(self.attributes),
+            "status": {"code": self.status},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        if self.events:
+            span["events"] = self.events
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+
+class _NoopSpan:
+    """Stand-in yielded while tracing is disabled"""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def add_event(self, name: str, **attributes: Any) -> None:
+        pass
+
+    def record_error(self, error: BaseException) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("tracing_span", default=None)
+
+
+class JsonlSpanExporter:
+    """
+    Append traces to a JSONL file (one OTLP ``resourceSpans`` per line)
+
+    The file is opened per export (once per trace), so no handle outlives
+    a write.
+
+    Args:
+        path: Target file (parent directories are created)
+        service_name: ``service.name`` resource attribute
+    """
+
+    def __init__(self, path: str, service_name: str = TRACE_SERVICE_NAME):
+        self.path = Path(path)
+        self.service_name = service_name
+
+    def export(self, spans: List[Span]) -> None:
+        if not spans:
+            return
+        document = {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": _attributes({"service.name": self.service_name})},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "notion_mcp"},
+                            "spans": [span.to_otlp() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(document, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    def close(self) -> None:
+        """Nothing to release (kept for exporters holding a connection)"""
+
+
+class _OpenTrace:
+    """Finished spans of a trace waiting for its last open span"""
+
+    __slots__ = ("spans", "active", "dropped")
+
+    def __init__(self) -> None:
+        self.spans: List[Span] = []
+        self.active = 0
+        self.dropped = 0
+
+
+class Tracer:
+    """
+    Open spans and hand finished traces to an exporter
+
+    Finished spans are buffered per trace and exported together once no span
+    of the trace is open anymore, so background jobs outliving the tool call
+    that started them end up in the same batch instead of a write per span.
+
+    Args:
+        exporter: Destination of finished spans (``None`` disables tracing)
+        max_spans: Spans buffered per trace (extra ones are dropped and counted)
+    """
+
+    def __init__(
+        self,
+        exporter: Optional[JsonlSpanExporter] = None,
+        max_spans: int = TRACE_MAX_SPANS_PER_TRACE,
+    ):
+        self.exporter = exporter
+        self.max_spans = max_spans
+        self._open: Dict[str, _OpenTrace] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def configure(self, exporter: Optional[JsonlSpanExporter]) -> None:
+        """Replace the exporter (closing the previous one)"""
+        self.shutdown()
+        self.exporter = exporter
+
+    @contextmanager
+    def span(self, name: str, kind: int = KIND_INTERNAL, **attributes: Any) -> Iterator[Any]:
+        """
+        Time the enclosed block as a child of the current span
+
+        Exceptions mark the span as failed and propagate.
+
+        Args:
+            name: Span name (e.g., ``"tools/call study_create_class"``)
+            kind: ``KIND_INTERNAL``, ``KIND_SERVER`` or ``KIND_CLIENT``
+            **attributes: Initial attributes (``None`` values are skipped)
+
+        Yields:
+            The span (a no-op stand-in while tracing is disabled)
+        """
+        if self.exporter is None:
+            yield NOOP_SPAN
+            return
+
+        parent = _current_span.get()
+        trace_id = parent.trace_id if parent is not None else os.urandom(16).hex()
+        span = Span(
+            name,
+            trace_id,
+            parent.span_id if parent is not None else None,
+            kind,
+            {key: value for key, value in attributes.items() if value is not None},
+        )
+        trace = self._open.get(trace_id)
+        if trace is None:
+            trace = self._open[trace_id] = _OpenTrace()
+        trace.active += 1
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_error(exc)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+            self._finish(span)
+
+    def _finish(self, span: Span) -> None:
+        trace = self._open.get(span.trace_id)
+        if self.exporter is None or trace is None:
+            return
+        trace.active -= 1
+        if trace.active > 0:
+            # Keep a slot for the span closing the trace (usually the root)
+            if len(trace.spans) < self.max_spans - 1:
+                trace.spans.append(span)
+            else:
+                trace.dropped += 1
+            return
+        del self._open[span.trace_id]
+        if trace.dropped:
+            span.set_attribute("tracing.dropped_spans", trace.dropped)
+        self.exporter.export(trace.spans + [span])
+
+    def shutdown(self) -> None:
+        """Export traces still open and close the exporter"""
+        if self.exporter is None:
+            return
+        for trace in self._open.values():
+            self.exporter.export(trace.spans)
+        self._open.clear()
+        self.exporter.close()
+
+
+def current_span() -> Optional[Span]:
+    """Span bound to the current context, if any"""
+    return _current_span.get()
+
+
+def _attributes(values: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _value(value)} for key, value in values.items()]
+
+
+def _value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+# Shared by the whole process
+TRACER = Tracer()
@@ -46,3 +46,11 @@ def mock_error_response():
         "message": "Invalid request",
     }
     return response
+
+
+@pytest.fixture(autouse=True)
+def checkpoint_dir(tmp_path, monkeypatch):
+    """Keep import checkpoint manifests out of the working tree"""
+    directory = tmp_path / "checkpoints"
+    monkeypatch.setenv("NOTION_CHECKPOINT_DIR", str(directory))
+    return directory
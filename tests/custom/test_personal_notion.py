@@ -42,3 +42,80 @@ async def test_create_medical_appointment(personal_notion: PersonalNotion) -> No
     assert props["Atividade"]["select"]["name"] == "Consulta Médica"
     date_payload = props["Data"]["date"]
     assert date_payload["start"].endswith("-03:00")
+
+
+@pytest.mark.asyncio
+async def test_use_template_recurring_skips_existing_occurrences(personal_notion: PersonalNotion) -> None:
+    existing = {
+        "object": "page",
+        "id": "planning-jan-13",
+        "parent": {"database_id": personal_notion.database_id},
+        "properties": {
+            personal_notion.title_field: {"title": [{"plain_text": "Planejamento Semanal"}]},
+            personal_notion.date_field: {
+                "date": {"start": "2025-01-13T10:00:00.000Z", "end": "2025-01-13T12:00:00.000Z"}
+            },
+        },
+    }
+    query_response = {"object": "list", "results": [existing], "has_more": False}
+
+    with (
+        patch.object(personal_notion.service, "_request", new=AsyncMock(return_value=query_response)) as mock_query,
+        patch.object(personal_notion.service, "create_page", new=AsyncMock(return_value={"id": "new"})) as mock_create,
+    ):
+        result = await personal_notion.use_template_recurring(
+            "weekly_planning", datetime(2025, 1, 1), datetime(2025, 1, 31)
+        )
+
+    mock_query.assert_awaited_once()
+    assert result["occurrences"] == 4  # Mondays 6, 13, 20 and 27
+    assert result["skipped"] == [{"start": "2025-01-13T07:00:00-03:00", "id": "planning-jan-13"}]
+    assert mock_create.await_count == 3
+    starts = [call.kwargs["properties"]["Data"]["date"]["start"] for call in mock_create.call_args_list]
+    assert sorted(starts) == [
+        "2025-01-06T07:00:00-03:00",
+        "2025-01-20T07:00:00-03:00",
+        "2025-01-27T07:00:00-03:00",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_use_template_recurring_reports_failed_occurrences(personal_notion: PersonalNotion) -> None:
+    query_response = {"object": "list", "results": [], "has_more": False}
+
+    async def flaky_create_page(properties: dict, **_: object) -> dict:
+        start = properties["Data"]["date"]["start"]
+        if start.startswith("2025-01-13"):
+            raise RuntimeError("Notion API error 500")
+        return {"id": f"page-{start[:10]}"}
+
+    with (
+        patch.object(personal_notion.service, "_request", new=AsyncMock(return_value=query_response)),
+        patch.object(personal_notion.service, "create_page", side_effect=flaky_create_page),
+    ):
+        result = await personal_notion.use_template_recurring(
+            "weekly_planning", datetime(2025, 1, 1), datetime(2025, 1, 20)
+        )
+
+    assert [page and page["id"] for page in result["created"]] == [
+        "page-2025-01-06",
+        None,
+        "page-2025-01-20",
+    ]
+    assert result["errors"] == [
+        {"index": 1, "start": "2025-01-13T07:00:00-03:00", "error": "Notion API error 500"}
+    ]
+
+
+def test_monthly_recurrence_respects_interval(personal_notion: PersonalNotion) -> None:
+    template = PersonalNotion.TEMPLATES["financial_review_monthly"]
+
+    references = personal_notion._recurrence_references(
+        template, datetime(2025, 1, 29), datetime(2025, 12, 31), interval=3
+    )
+
+    assert [reference.date().isoformat() for reference in references] == [
+        "2025-04-28",
+        "2025-07-28",
+        "2025-10-28",
+    ]
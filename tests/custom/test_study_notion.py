@@ -1,4 +1,5 @@
 """Tests for StudyNotion functionality."""
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, patch
 
@@ -89,3 +90,304 @@ async def test_query_schedule_builds_filters(study_notion: StudyNotion) -> None:
     filters = call_kwargs["filter_conditions"]["and"]
     assert any(filt["property"] == "Status" for filt in filters)
     assert any(filt["property"] == "Período" for filt in filters)
+
+
+@pytest.mark.asyncio
+async def test_create_course_complete_keeps_order_with_concurrent_levels(study_notion: StudyNotion) -> None:
+    fases = [
+        {
+            "title": f"Fase {phase}",
+            "sections": [
+                {
+                    "title": f"Seção {phase}.{section}",
+                    "classes": [
+                        {"title": f"Aula {phase}.{section}.{lesson}", "start": "2025-01-06T19:00:00", "duration_minutes": 60}
+                        for lesson in range(3)
+                    ],
+                }
+                for section in range(2)
+            ],
+        }
+        for phase in range(3)
+    ]
+
+    async def fake_subitem(parent_id: str, title: str, **_: object) -> dict:
+        # Later items finish first to exercise ordering
+        await asyncio.sleep(0.001 * (10 - int(title.split()[-1].split(".")[-1])))
+        return {"id": title, "parent": parent_id}
+
+    with (
+        patch.object(study_notion, "create_card", new=AsyncMock(return_value={"id": "course"})),
+        patch.object(study_notion, "create_phase", side_effect=fake_subitem),
+        patch.object(study_notion, "create_section", side_effect=fake_subitem),
+        patch.object(study_notion, "create_class", side_effect=fake_subitem),
+    ):
+        result = await study_notion.create_course_complete(title="Curso", fases=fases)
+
+    assert [entry["phase"]["id"] for entry in result["phases"]] == ["Fase 0", "Fase 1", "Fase 2"]
+    section = result["phases"][1]["sections"][1]
+    assert section["section"] == {"id": "Seção 1.1", "parent": "Fase 1"}
+    assert [card["id"] for card in section["classes"]] == ["Aula 1.1.0", "Aula 1.1.1", "Aula 1.1.2"]
+    assert all(card["parent"] == "Seção 1.1" for card in section["classes"])
+
+
+@pytest.mark.asyncio
+async def test_create_course_complete_validates_before_creating(study_notion: StudyNotion) -> None:
+    fases = [{"title": "Fase 1", "sections": [{"title": "Seção", "classes": [{"title": "Aula", "start": "2025-01-06T18:00:00"}]}]}]
+
+    with patch.object(study_notion.service, "create_page", new=AsyncMock()) as mock_create, pytest.raises(ValueError):
+        await study_notion.create_course_complete(title="Curso", fases=fases)
+
+    mock_create.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_create_course_complete_resumes_from_checkpoint(
+    study_notion: StudyNotion, checkpoint_dir
+) -> None:
+    fases = [
+        {
+            "title": "Fase 1",
+            "sections": [
+                {
+                    "title": "Seção 1",
+                    "classes": [
+                        {"title": f"Aula {lesson}", "start": "2025-01-06T19:00:00", "duration_minutes": 60}
+                        for lesson in range(3)
+                    ],
+                }
+            ],
+        }
+    ]
+    created: list = []
+
+    async def flaky_create_page(properties: dict, **_: object) -> dict:
+        title = properties[study_notion.title_field]["title"][0]["text"]["content"]
+        if title == "Aula 2" and not created.count("Aula 2 failed"):
+            created.append("Aula 2 failed")
+            raise RuntimeError("network down")
+        created.append(title)
+        return {"object": "page", "id": f"id-{title}"}
+
+    with patch.object(study_notion.service, "create_page", side_effect=flaky_create_page):
+        with pytest.raises(RuntimeError):
+            await study_notion.create_course_complete(title="Curso", fases=fases)
+        result = await study_notion.create_course_complete(title="Curso", fases=fases)
+
+    assert created == ["Curso", "Fase 1", "Seção 1", "Aula 0", "Aula 1", "Aula 2 failed", "Aula 2"]
+    assert result["checkpoint"]["created"] == 1
+    assert result["checkpoint"]["skipped"] == 5
+    classes = result["phases"][0]["sections"][0]["classes"]
+    assert [card["id"] for card in classes] == ["id-Aula 0", "id-Aula 1", "id-Aula 2"]
+    # A completed import leaves nothing to resume: importing again creates every card
+    assert list(checkpoint_dir.glob("*.json")) == []
+    with patch.object(study_notion.service, "create_page", side_effect=flaky_create_page):
+        again = await study_notion.create_course_complete(title="Curso", fases=fases)
+    assert again["checkpoint"] == {**again["checkpoint"], "created": 6, "skipped": 0}
+    assert created[7:] == ["Curso", "Fase 1", "Seção 1", "Aula 0", "Aula 1", "Aula 2"]
+
+
+@pytest.mark.asyncio
+async def test_create_course_complete_resumes_a_level_cut_short_by_a_crash(
+    study_notion: StudyNotion, checkpoint_dir
+) -> None:
+    lessons = [f"Aula {lesson}" for lesson in range(4)]
+    fases = [
+        {
+            "title": "Fase 1",
+            "sections": [
+                {
+                    "title": "Seção 1",
+                    "classes": [
+                        {"title": title, "start": "2025-01-06T19:00:00", "duration_minutes": 60}
+                        for title in lessons
+                    ],
+                }
+            ],
+        }
+    ]
+    created: list = []
+    on_disk_at_crash: dict = {}
+
+    async def crashing_create_page(properties: dict, **_: object) -> dict:
+        title = properties[study_notion.title_field]["title"][0]["text"]["content"]
+        if title == "Aula 3" and not on_disk_at_crash:
+            # Files as a killed process would leave them, before any cleanup
+            on_disk_at_crash.update({path.name: path.read_bytes() for path in checkpoint_dir.iterdir()})
+            raise RuntimeError("killed")
+        created.append(title)
+        return {"object": "page", "id": f"id-{title}"}
+
+    with patch.object(study_notion.service, "create_page", side_effect=crashing_create_page):
+        with pytest.raises(RuntimeError):
+            await study_notion.create_course_complete(title="Curso", fases=fases)
+        for path in checkpoint_dir.iterdir():
+            path.unlink()
+        for name, content in on_disk_at_crash.items():
+            (checkpoint_dir / name).write_bytes(content)
+        result = await study_notion.create_course_complete(title="Curso", fases=fases)
+
+    assert created == ["Curso", "Fase 1", "Seção 1", *lessons]
+    assert result["checkpoint"]["created"] == 1
+
+
+def _class_page(page_id: str, start: str, end: str) -> dict:
+    return {
+        "id": page_id,
+        "properties": {
+            "Project name": {"title": [{"plain_text": page_id}]},
+            "Período": {"date": {"start": start, "end": end}},
+            "Tempo Total": {"rich_text": [{"text": {"content": "01:00:00"}}]},
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_reschedule_classes_pages_through_results_and_patches_only_changes(study_notion: StudyNotion) -> None:
+    first_page = {
+        "results": [_class_page("aula-1", "2025-01-06T19:00:00.000-03:00", "2025-01-06T20:00:00.000-03:00")],
+        "has_more": True,
+        "next_cursor": "cursor-2",
+    }
+    second_page = {
+        "results": [_class_page("aula-2", "2025-01-06T22:00:00.000Z", "2025-01-06T23:00:00.000Z")],
+        "has_more": False,
+        "next_cursor": None,
+    }
+
+    with (
+        patch.object(study_notion.service, "query_database", new=AsyncMock(side_effect=[first_page, second_page])) as mock_query,
+        patch.object(study_notion.service, "update_page", new=AsyncMock(return_value={"id": "aula-2"})) as mock_update,
+    ):
+        result = await study_notion.reschedule_classes("section", datetime(2025, 1, 6))
+
+    assert mock_query.call_args_list[1].kwargs["start_cursor"] == "cursor-2"
+    assert result["total"] == 2
+    assert result["unchanged"] == 1
+    assert [change["id"] for change in result["changes"]] == ["aula-2"]
+    # The second class moves from Monday (same instant as the first) to Tuesday
+    assert result["changes"][0]["to"]["start"].startswith("2025-01-07T19:")
+    mock_update.assert_awaited_once()
+    assert mock_update.call_args.kwargs["page_id"] == "aula-2"
+
+
+@pytest.mark.asyncio
+async def test_reschedule_classes_dry_run_does_not_update(study_notion: StudyNotion) -> None:
+    response = {"results": [_class_page("aula-1", "2025-02-03", "2025-02-03")], "has_more": False}
+
+    with (
+        patch.object(study_notion.service, "query_database", new=AsyncMock(return_value=response)),
+        patch.object(study_notion.service, "update_page", new=AsyncMock()) as mock_update,
+    ):
+        result = await study_notion.reschedule_classes("section", datetime(2025, 1, 6), dry_run=True)
+
+    assert result["dry_run"] is True
+    assert result["changed"] == 1
+    assert result["updated"] == []
+    mock_update.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_reschedule_classes_rejects_conflicts_before_updating(study_notion: StudyNotion) -> None:
+    store = study_notion.service.store
+    store.register_database("personal-db", "Nome da tarefa", date_field="Data")
+    store.ingest(
+        {
+            "object": "page",
+            "id": "consulta",
+            "parent": {"database_id": "personal-db"},
+            "properties": {
+                "Nome da tarefa": {"title": [{"plain_text": "Consulta"}]},
+                "Data": {"date": {"start": "2025-02-03T19:30:00-03:00", "end": "2025-02-03T20:30:00-03:00"}},
+            },
+        }
+    )
+    response = {"results": [_class_page("aula-1", "2025-01-06", "2025-01-06")], "has_more": False}
+
+    with (
+        patch.object(study_notion.service, "query_database", new=AsyncMock(return_value=response)),
+        patch.object(study_notion.service, "update_page", new=AsyncMock()) as mock_update,
+    ):
+        report = await study_notion.reschedule_classes(
+            "section", datetime(2025, 2, 3), dry_run=True, check_conflicts="report"
+        )
+        with pytest.raises(ValueError, match="'Consulta'"):
+            await study_notion.reschedule_classes(
+                "section", datetime(2025, 2, 3), check_conflicts="reject"
+            )
+
+    assert report["conflicts"][0]["conflicts"][0]["page_id"] == "consulta"
+    mock_update.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_reschedule_classes_excludes_its_own_dashed_ids_from_conflicts(
+    study_notion: StudyNotion,
+) -> None:
+    # Stored classes keep their dashed API IDs; the index holds normalized ones
+    tuesday = _class_page(
+        "0a1b2c3d-0000-4000-8000-000000000001",
+        "2025-01-07T19:00:00.000-03:00",
+        "2025-01-07T20:00:00.000-03:00",
+    )
+    wednesday = _class_page(
+        "0a1b2c3d-0000-4000-8000-000000000002",
+        "2025-01-08T19:00:00.000-03:00",
+        "2025-01-08T20:00:00.000-03:00",
+    )
+    study_notion.service.store.ingest_many([tuesday, wednesday], "study_db")
+    assert len(study_notion.service.store.schedule) == 2
+    response = {"results": [tuesday, wednesday], "has_more": False}
+
+    with (
+        patch.object(study_notion.service, "query_database", new=AsyncMock(return_value=response)),
+        patch.object(study_notion.service, "update_page", new=AsyncMock(return_value={})) as mock_update,
+    ):
+        # Wednesday's class moves onto Tuesday's old slot: not a conflict
+        result = await study_notion.reschedule_classes(
+            "section", datetime(2025, 1, 6), check_conflicts="reject"
+        )
+
+    assert result["conflicts"] == []
+    assert mock_update.await_count == 2
+
+
+def _rollup_page(page_id: str, parent: str | None, tempo: str, status: str = "Para Fazer") -> dict:
+    properties = {
+        "Project name": {"title": [{"plain_text": page_id}]},
+        "Tempo Total": {"rich_text": [{"plain_text": tempo}]},
+        "Status": {"status": {"name": status}},
+    }
+    if parent:
+        properties["Parent item"] = {"relation": [{"id": parent}]}
+    return {"object": "page", "id": page_id, "properties": properties}
+
+
+@pytest.mark.asyncio
+async def test_recompute_rollups_updates_only_changed_parents(study_notion: StudyNotion) -> None:
+    pages = [
+        _rollup_page("course", None, "03:00:00"),
+        _rollup_page("phase", "course", "03:00:00"),
+        _rollup_page("section-a", "phase", "01:00:00"),
+        _rollup_page("section-b", "phase", "02:00:00"),
+        _rollup_page("aula-1", "section-a", "01:30:00", status="Concluido"),
+        _rollup_page("aula-2", "section-b", "02:00:00"),
+        _rollup_page("outro-curso", None, "10:00:00"),
+    ]
+    response = {"object": "list", "results": pages, "has_more": False}
+
+    with (
+        patch.object(study_notion.service, "_request", new=AsyncMock(return_value=response)),
+        patch.object(study_notion.service, "update_page", new=AsyncMock(return_value={})) as mock_update,
+    ):
+        result = await study_notion.recompute_rollups("course")
+
+    assert result["nodes"] == 6
+    assert result["total"] == "03:30:00"
+    assert result["remaining_seconds"] == 2 * 3600
+    assert [(change["id"], change["to"]) for change in result["changes"]] == [
+        ("course", "03:30:00"),
+        ("phase", "03:30:00"),
+        ("section-a", "01:30:00"),
+    ]
+    assert mock_update.await_count == 3
@@ -4,6 +4,7 @@ Tests for WorkNotion
 Tests for work-specific Notion implementation.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -99,3 +100,96 @@ async def test_validation_emoji_in_title(work_notion):
 
     with pytest.raises(ValidationError, match="emojis"):
         await work_notion.create_card(title="🚀 My Project")
+
+
+@pytest.mark.asyncio
+async def test_create_sprint_reports_task_errors_in_input_order(work_notion):
+    """Test sprint tasks are created concurrently with a per-task error report"""
+
+    async def fake_subitem(parent_id, title, **_):
+        if title == "Task 2":
+            raise RuntimeError("Notion API error 500")
+        return {"id": f"id-{title}", "parent": parent_id}
+
+    tasks = [{"title": f"Task {index}"} for index in range(4)]
+    with (
+        patch.object(work_notion, "create_card", new=AsyncMock(return_value={"id": "sprint"})),
+        patch.object(work_notion, "create_subitem", side_effect=fake_subitem),
+    ):
+        result = await work_notion.create_sprint(title="Sprint 1", tasks=tasks)
+
+    assert [task and task["id"] for task in result["tasks"]] == ["id-Task 0", "id-Task 1", None, "id-Task 3"]
+    assert result["errors"] == [{"index": 2, "title": "Task 2", "error": "Notion API error 500"}]
+
+
+@pytest.mark.asyncio
+async def test_create_sprint_does_not_count_cancelled_tasks_as_created(work_notion):
+    """Test a cancelled task creation is reported as an error"""
+
+    async def fake_subitem(parent_id, title, **_):
+        if title == "Task 1":
+            raise asyncio.CancelledError()
+        return {"id": f"id-{title}"}
+
+    tasks = [{"title": f"Task {index}"} for index in range(2)]
+    with (
+        patch.object(work_notion, "create_card", new=AsyncMock(return_value={"id": "sprint"})),
+        patch.object(work_notion, "create_subitem", side_effect=fake_subitem),
+    ):
+        result = await work_notion.create_sprint(title="Sprint 1", tasks=tasks)
+
+    assert result["tasks"] == [{"id": "id-Task 0"}, None]
+    assert [error["index"] for error in result["errors"]] == [1]
+
+
+@pytest.mark.asyncio
+async def test_create_sprint_validates_tasks_before_creating(work_notion):
+    """Test invalid tasks abort the sprint before any request"""
+    tasks = [{"title": "Ok"}, {"status": "Não iniciado"}, {"title": "Bad", "status": "Unknown"}]
+
+    with (
+        patch.object(work_notion.service, "create_page", new=AsyncMock()) as mock_create,
+        pytest.raises(ValueError, match="#1.*#2"),
+    ):
+        await work_notion.create_sprint(title="Sprint 1", tasks=tasks)
+
+    mock_create.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_idempotent_create_returns_known_card(work_notion):
+    """Idempotent create reuses a card already in the service store"""
+    title_field = work_notion.title_field
+    work_notion.service.store.ingest(
+        {
+            "object": "page",
+            "id": "existing-id",
+            "parent": {"database_id": "test_work_db"},
+            "properties": {title_field: {"title": [{"plain_text": "Landing Page"}]}},
+        }
+    )
+
+    with patch.object(work_notion.service, "create_page", new=AsyncMock()) as mock_create:
+        page = await work_notion.create_card(title="landing  page", idempotent=True)
+
+    assert page["id"] == "existing-id"
+    mock_create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_idempotent_creates_share_one_request(work_notion):
+    """Concurrent identical idempotent creates issue a single request"""
+
+    async def slow_create(**kwargs):
+        await asyncio.sleep(0.01)
+        return {"id": "new-id", "object": "page"}
+
+    with patch.object(
+        work_notion.service, "create_page", new=AsyncMock(side_effect=slow_create)
+    ) as mock_create:
+        pages = await asyncio.gather(
+            *(work_notion.create_card(title="Sprint Review", idempotent=True) for _ in range(3))
+        )
+
+    assert [page["id"] for page in pages] == ["new-id"] * 3
+    assert mock_create.await_count == 1
@@ -1,4 +1,5 @@
 """Tests for YoutuberNotion operations."""
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, patch
 
@@ -6,6 +7,7 @@ import pytest
 
 from notion_mcp.custom.youtuber_notion import YoutuberNotion
 from notion_mcp.services.notion_service import NotionService
+from notion_mcp.utils import ValidationError
 
 
 @pytest.fixture
@@ -41,10 +43,68 @@ async def test_schedule_recordings_creates_multiple_episodes(youtuber_notion: Yo
             start_recording=datetime(2025, 1, 6, 21, 0),
             recording_interval_days=2,
             publication_hour=10,
+            sinopse="Sinopse",
         )
 
     assert schedule["count"] == 3
     assert mock_episode.await_count == 3
+    assert mock_episode.await_args_list[0].kwargs["resumo_episodio"] == "Sinopse"
+
+
+@pytest.mark.asyncio
+async def test_schedule_recordings_takes_the_synopsis_from_the_series(youtuber_notion: YoutuberNotion) -> None:
+    series = {"id": "series", "properties": {"Resumo do Episodio": {"rich_text": [{"plain_text": "Da série"}]}}}
+
+    with (
+        patch.object(youtuber_notion.service, "get_page", new=AsyncMock(return_value=series)),
+        patch.object(youtuber_notion.service, "create_page", new=AsyncMock(return_value={"id": "ep"})) as mock_create,
+    ):
+        await youtuber_notion.schedule_recordings(
+            series_id="series",
+            total_episodes=2,
+            start_recording=datetime(2025, 1, 6, 21, 0),
+        )
+
+    descriptions = [
+        call.kwargs["properties"].get("Resumo do Episodio") for call in mock_create.await_args_list
+    ]
+    assert descriptions.count(None) == 1
+    assert mock_create.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_schedule_recordings_without_synopsis_creates_no_pages(youtuber_notion: YoutuberNotion) -> None:
+    with (
+        patch.object(youtuber_notion.service, "get_page", new=AsyncMock(return_value={"id": "series", "properties": {}})),
+        patch.object(youtuber_notion.service, "create_page", new=AsyncMock(return_value={"id": "ep"})) as mock_create,
+        pytest.raises(ValueError, match="synopsis"),
+    ):
+        await youtuber_notion.schedule_recordings(
+            series_id="series",
+            total_episodes=5,
+            start_recording=datetime(2025, 1, 6, 21, 0),
+        )
+
+    mock_create.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_create_series_with_invalid_episode_creates_no_pages(youtuber_notion: YoutuberNotion) -> None:
+    overrides = [{}, {}, {"status": "Unknown"}]
+
+    with (
+        patch.object(youtuber_notion.service, "create_page", new=AsyncMock(return_value={"id": "page"})) as mock_create,
+        pytest.raises(ValidationError, match="Unknown"),
+    ):
+        await youtuber_notion.create_series(
+            title="Nova Série",
+            sinopse="Sinopse",
+            total_episodes=3,
+            first_recording=datetime(2025, 1, 6, 21, 0),
+            episodes=overrides,
+        )
+
+    mock_create.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -83,3 +143,40 @@ async def test_query_schedule_passes_filters(youtuber_notion: YoutuberNotion) ->
     filters = call_kwargs["filter_conditions"]["and"]
     assert any(filt["property"] == "Status" for filt in filters)
     assert any(filt["property"] == "Data de Lançamento" for filt in filters)
+
+
+@pytest.mark.asyncio
+async def test_create_series_keeps_episode_order_with_concurrent_creation(youtuber_notion: YoutuberNotion) -> None:
+    async def fake_episode(parent_id: str, episode_number: int, **_: object) -> dict:
+        # Later episodes finish first
+        await asyncio.sleep(0.001 * (10 - episode_number))
+        return {"id": f"ep-{episode_number}"}
+
+    with (
+        patch.object(youtuber_notion, "create_card", new=AsyncMock(return_value={"id": "series"})),
+        patch.object(youtuber_notion, "create_episode", side_effect=fake_episode),
+    ):
+        result = await youtuber_notion.create_series(
+            title="Nova Série",
+            sinopse="Sinopse",
+            total_episodes=8,
+            first_recording=datetime(2025, 1, 6, 21, 0),
+        )
+
+    assert [episode["id"] for episode in result["episodes"]] == [f"ep-{number}" for number in range(1, 9)]
+
+
+@pytest.mark.asyncio
+async def test_create_series_validates_schedule_before_creating_series(youtuber_notion: YoutuberNotion) -> None:
+    overrides = [{}, {"publication_date": "2025-01-07T20:00:00"}]
+
+    with patch.object(youtuber_notion.service, "create_page", new=AsyncMock()) as mock_create, pytest.raises(ValueError):
+        await youtuber_notion.create_series(
+            title="Nova Série",
+            sinopse="Sinopse",
+            total_episodes=2,
+            first_recording=datetime(2025, 1, 6, 21, 0),
+            episodes=overrides,
+        )
+
+    mock_create.assert_not_awaited()
@@ -0,0 +1,94 @@
+"""Tests for deferred tool registration and lazily built tool sets."""
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from notion_mcp.runtime.app import DeferredToolsFastMCP, LazyToolSet, _register_batch_tool
+from notion_mcp.runtime.dispatch import build_tool
+from notion_mcp.runtime.jobs import JobManager
+from notion_mcp.tools.work_tools import WorkNotionTools
+
+
+@pytest.mark.asyncio
+async def test_tools_are_registered_once_on_the_first_tools_request() -> None:
+    handler = AsyncMock(return_value={"ok": True})
+
+    def registrar(app: DeferredToolsFastMCP) -> None:
+        app.add_prebuilt_tool(build_tool({"name": "notion_ping"}, handler))
+
+    registrar_mock = Mock(side_effect=registrar)
+    app = DeferredToolsFastMCP("test", tool_registrar=registrar_mock)
+    registrar_mock.assert_not_called()
+
+    first = await app.list_tools()
+    second = await app.list_tools()
+    await app.call_tool("notion_ping", {})
+
+    registrar_mock.assert_called_once_with(app)
+    assert [tool.name for tool in first] == [tool.name for tool in second] == ["notion_ping"]
+    handler.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_call_before_list_registers_the_tools() -> None:
+    handler = AsyncMock(return_value={"ok": True})
+    registrar_mock = Mock(
+        side_effect=lambda app: app.add_prebuilt_tool(build_tool({"name": "notion_ping"}, handler))
+    )
+    app = DeferredToolsFastMCP("test", tool_registrar=registrar_mock)
+
+    await app.call_tool("notion_ping", {})
+    await app.list_tools()
+
+    registrar_mock.assert_called_once_with(app)
+
+
+def test_lazy_tool_set_lists_tools_without_building_the_adapter() -> None:
+    adapter_factory = Mock()
+    tool_set = LazyToolSet(WorkNotionTools, adapter_factory)
+
+    names = [tool["name"] for tool in tool_set.get_tools()]
+
+    assert "work_create_project" in names
+    adapter_factory.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_lazy_tool_set_builds_the_adapter_once_on_first_call() -> None:
+    adapter = Mock()
+    adapter.update_status = AsyncMock(return_value={"id": "page"})
+    adapter_factory = Mock(return_value=adapter)
+    tool_set = LazyToolSet(WorkNotionTools, adapter_factory)
+
+    for _ in range(2):
+        result = await tool_set.handle_tool_call(
+            "work_update_status", {"page_id": "page", "status": "Em andamento"}
+        )
+
+    assert result == {"id": "page"}
+    adapter_factory.assert_called_once_with()
+    assert adapter.update_status.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_reaches_tools_registered_after_it() -> None:
+    early = AsyncMock(return_value={"id": "early"})
+    late = AsyncMock(return_value={"status": "done"})
+
+    def registrar(app: DeferredToolsFastMCP) -> None:
+        app.add_prebuilt_tool(build_tool({"name": "notion_ping"}, early))
+        _register_batch_tool(app, JobManager())
+        app.add_prebuilt_tool(build_tool({"name": "job_status"}, late))
+
+    app = DeferredToolsFastMCP("test", tool_registrar=registrar)
+
+    result = await app.call_tool(
+        "notion_batch",
+        {"calls": [{"tool": "notion_ping"}, {"tool": "job_status", "arguments": {}}]},
+    )
+
+    (content,) = result
+    assert json.loads(content.text)["succeeded"] == 2
+    early.assert_awaited_once()
+    late.assert_awaited_once()
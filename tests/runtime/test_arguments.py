@@ -0,0 +1,58 @@
+"""Tests for the compiled per-tool argument decoders."""
+import pytest
+
+from notion_mcp.runtime.arguments import ArgumentDecoder, parse_loose_json
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "fases": {"type": "array"},
+        "periodo": {"type": "object"},
+        "title": {"type": "string"},
+    },
+}
+
+
+def test_decoder_returns_typed_containers_untouched() -> None:
+    fases = [{"title": "Fase 1"}]
+    decode = ArgumentDecoder("study_create_course", SCHEMA)
+
+    arguments = decode({"fases": fases, "title": "Curso"})
+
+    assert arguments["fases"] is fases
+    assert arguments["title"] == "Curso"
+
+
+def test_decoder_parses_python_literal_strings() -> None:
+    decode = ArgumentDecoder("study_create_course", SCHEMA)
+    fases = [{"title": "Don't panic", "descricao": None, "ativa": True, "nota": "None yet"}]
+
+    arguments = decode({"fases": str(fases), "periodo": "{}'start': '2025-01-06', 'end': None}"})
+
+    assert arguments["fases"] == fases
+    assert arguments["periodo"] == {"start": "2025-01-06", "end": None}
+
+
+def test_decoder_keeps_unparseable_strings() -> None:
+    decode = ArgumentDecoder("study_create_course", SCHEMA)
+
+    arguments = decode({"periodo": "not a dict"})
+
+    assert arguments["periodo"] == "not a dict"
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("{start: '2025-01-06', items: [1, 2.5,],}", {"start": "2025-01-06", "items": [1, 2.5]}),
+        ('{"a": None, "b": [True, False]}', {"a": None, "b": [True, False]}),
+        ("['it\\'s', \"say \\\"hi\\\"\", '\\u00e9']", ["it's", 'say "hi"', "é"]),
+    ],
+)
+def test_parse_loose_json_variants(text: str, expected: object) -> None:
+    assert parse_loose_json(text) == expected
+
+
+def test_parse_loose_json_rejects_trailing_data() -> None:
+    with pytest.raises(ValueError):
+        parse_loose_json("{'a': 1} extra")
@@ -0,0 +1,94 @@
+"""Tests for server-side tool call batches."""
+import asyncio
+
+import pytest
+
+from notion_mcp.runtime.batch import BATCH_TOOL_DEFINITION, BatchExecutor
+from notion_mcp.runtime.dispatch import build_tool
+
+
+@pytest.mark.asyncio
+async def test_batch_resolves_references_and_keeps_input_order() -> None:
+    order = []
+
+    async def create_project(**arguments):
+        await asyncio.sleep(0.01)
+        order.append("project")
+        return {"id": "project-1", "title": arguments["title"]}
+
+    async def create_task(**arguments):
+        order.append(arguments["title"])
+        return {"id": f"task-{arguments['title']}", "parent": arguments["parent_id"]}
+
+    executor = BatchExecutor({"create_project": create_project, "create_task": create_task})
+
+    result = await executor.run(
+        [
+            {"tool": "create_task", "arguments": {"title": "a", "parent_id": {"$ref": "p.id"}}},
+            {"tool": "create_project", "id": "p", "arguments": {"title": "P"}},
+            {"tool": "create_task", "arguments": {"title": "b", "parent_id": "x"}},
+        ]
+    )
+
+    assert [entry["status"] for entry in result["results"]] == ["ok", "ok", "ok"]
+    assert result["results"][0]["result"] == {"id": "task-a", "parent": "project-1"}
+    assert order.index("project") < order.index("a")
+    assert order.index("b") < order.index("project")  # Independent call did not wait
+
+
+@pytest.mark.asyncio
+async def test_failed_dependency_skips_dependents_and_errors_are_reported() -> None:
+    async def boom(**_):
+        raise RuntimeError("notion down")
+
+    async def echo(**arguments):
+        return arguments
+
+    executor = BatchExecutor({"boom": boom, "echo": echo})
+
+    result = await executor.run(
+        [
+            {"tool": "boom", "id": "first"},
+            {"tool": "echo", "depends_on": ["first"]},
+            {"tool": "echo", "arguments": {"value": 1}},
+        ]
+    )
+
+    assert [entry["status"] for entry in result["results"]] == ["error", "skipped", "ok"]
+    assert result["results"][0]["error"] == "RuntimeError: notion down"
+    assert (result["succeeded"], result["failed"], result["skipped"]) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_malformed_batches_are_rejected_before_running() -> None:
+    calls = []
+
+    async def echo(**arguments):
+        calls.append(arguments)
+        return arguments
+
+    executor = BatchExecutor({"echo": echo})
+
+    with pytest.raises(ValueError, match="cycle"):
+        await executor.run(
+            [
+                {"tool": "echo", "id": "a", "depends_on": ["b"]},
+                {"tool": "echo", "id": "b", "arguments": {"x": {"$ref": "a.id"}}},
+            ]
+        )
+    with pytest.raises(ValueError, match="unknown tool"):
+        await executor.run([{"tool": "echo"}, {"tool": "missing"}])
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_batch_tool_goes_through_the_schema_dispatcher() -> None:
+    async def echo(**arguments):
+        return arguments
+
+    executor = BatchExecutor({"echo": echo})
+    tool = build_tool(BATCH_TOOL_DEFINITION, executor.handle)
+
+    result = await tool.run({"calls": '[{"tool": "echo", "arguments": {"a": 1}}]'})
+
+    assert result["results"][0]["result"] == {"a": 1}
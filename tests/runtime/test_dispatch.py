@@ -0,0 +1,107 @@
+"""Tests for the schema-driven tool dispatcher."""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from notion_mcp.runtime.dispatch import SchemaToolDispatcher, build_tool
+from notion_mcp.utils.concurrency import gather_bounded
+from notion_mcp.utils.progress import report_stage
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "parent_id": {"type": "string"},
+        "duration_minutes": {"type": "integer"},
+        "respect_weekends": {"type": "boolean"},
+        "periodo": {"type": "object"},
+    },
+    "required": ["parent_id"],
+}
+
+
+def test_prepare_coerces_scalars_and_drops_unknown_or_empty_fields() -> None:
+    dispatcher = SchemaToolDispatcher("study_create_class", SCHEMA, AsyncMock())
+
+    arguments = dispatcher.prepare(
+        {
+            "parent_id": "section",
+            "duration_minutes": "90",
+            "respect_weekends": "false",
+            "periodo": None,
+            "unexpected": "value",
+        }
+    )
+
+    assert arguments == {"parent_id": "section", "duration_minutes": 90, "respect_weekends": False}
+
+
+def test_prepare_parses_serialized_objects() -> None:
+    dispatcher = SchemaToolDispatcher("study_create_phase", SCHEMA, AsyncMock())
+
+    arguments = dispatcher.prepare({"parent_id": "course", "periodo": '{"start": "2025-01-06"}'})
+
+    assert arguments["periodo"] == {"start": "2025-01-06"}
+
+
+def test_prepare_rejects_missing_required_argument() -> None:
+    dispatcher = SchemaToolDispatcher("study_create_phase", SCHEMA, AsyncMock())
+
+    with pytest.raises(ValueError, match="parent_id"):
+        dispatcher.prepare({"duration_minutes": 30})
+
+
+@pytest.mark.asyncio
+async def test_build_tool_advertises_input_schema_and_forwards_arguments() -> None:
+    handler = AsyncMock(return_value={"id": "page"})
+    tool = build_tool({"name": "study_create_phase", "description": "Create", "inputSchema": SCHEMA}, handler)
+
+    result = await tool.run({"parent_id": "course", "duration_minutes": 45})
+
+    assert tool.parameters == SCHEMA
+    assert result == {"id": "page"}
+    handler.assert_awaited_once_with({"parent_id": "course", "duration_minutes": 45})
+
+
+class FakeContext:
+    def __init__(self, progress_token="token"):
+        self.request_context = SimpleNamespace(meta=SimpleNamespace(progressToken=progress_token))
+        self.reports = []
+
+    async def report_progress(self, progress, total=None, message=None):
+        self.reports.append((progress, total, message))
+
+
+async def _staged_handler(arguments):
+    report_stage("sections")
+
+    async def create(index):
+        return {"id": f"page-{index}"}
+
+    return await gather_bounded(create(index) for index in range(arguments["count"]))
+
+
+@pytest.mark.asyncio
+async def test_tool_call_with_progress_token_sends_progress_notifications() -> None:
+    schema = {"type": "object", "properties": {"count": {"type": "integer"}}}
+    tool = build_tool({"name": "bulk", "inputSchema": schema}, _staged_handler)
+    context = FakeContext()
+
+    result = await tool.run({"count": 5}, context=context)
+
+    assert len(result) == 5
+    assert context.reports, "expected at least one progress notification"
+    assert context.reports[-1] == (5, 5, "sections: 5/5")
+    progresses = [report[0] for report in context.reports]
+    assert progresses == sorted(progresses)
+
+
+@pytest.mark.asyncio
+async def test_tool_call_without_progress_token_sends_nothing() -> None:
+    schema = {"type": "object", "properties": {"count": {"type": "integer"}}}
+    tool = build_tool({"name": "bulk", "inputSchema": schema}, _staged_handler)
+    context = FakeContext(progress_token=None)
+
+    await tool.run({"count": 3}, context=context)
+
+    assert context.reports == []
@@ -0,0 +1,68 @@
+"""Tests for background jobs and the job tools."""
+import asyncio
+
+import pytest
+
+from notion_mcp.runtime.jobs import JobManager, JobTools, with_background
+from notion_mcp.utils.concurrency import gather_bounded
+
+
+async def _create_pages(count: int, delay: float = 0.0):
+    async def create(index: int):
+        await asyncio.sleep(delay)
+        return {"object": "page", "id": f"page-{index}", "properties": {"big": "x" * 100}}
+
+    return await gather_bounded(create(index) for index in range(count))
+
+
+@pytest.mark.asyncio
+async def test_background_call_returns_job_and_reports_progress() -> None:
+    jobs = JobManager()
+    tools = JobTools(jobs)
+    definition, handler = with_background(
+        {"name": "bulk", "inputSchema": {"type": "object", "properties": {}}},
+        lambda arguments: _create_pages(arguments["count"]),
+        jobs,
+    )
+
+    started = await handler({"count": 3, "background": True})
+    await jobs.get(started["job_id"]).task
+    result = await tools.handle_tool_call("job_result", {"job_id": started["job_id"]})
+
+    assert "background" in definition["inputSchema"]["properties"]
+    assert started["status"] == "running"
+    assert result["status"] == "succeeded"
+    assert result["progress"] == {"done": 3, "failed": 0, "total": 3}
+    assert [page["id"] for page in result["result"]] == ["page-0", "page-1", "page-2"]
+
+
+@pytest.mark.asyncio
+async def test_cancel_keeps_partial_results() -> None:
+    jobs = JobManager()
+    tools = JobTools(jobs)
+
+    job = jobs.start("bulk", lambda: _create_pages(20, delay=0.02))
+    await asyncio.sleep(0.03)
+    cancelled = await tools.handle_tool_call("job_cancel", {"job_id": job.job_id})
+
+    assert cancelled["status"] == "cancelled"
+    assert 0 < cancelled["progress"]["done"] < 20
+    assert cancelled["partial"][0] == {"object": "page", "id": "page-0"}
+
+
+@pytest.mark.asyncio
+async def test_failed_job_exposes_error_and_unknown_jobs_raise() -> None:
+    jobs = JobManager()
+    tools = JobTools(jobs)
+
+    async def boom():
+        raise RuntimeError("notion down")
+
+    job = jobs.start("bulk", boom)
+    await job.task
+    status = await tools.handle_tool_call("job_status", {})
+
+    assert status["jobs"][0]["status"] == "failed"
+    assert status["jobs"][0]["error"] == "RuntimeError: notion down"
+    with pytest.raises(ValueError, match="Unknown job"):
+        await tools.handle_tool_call("job_result", {"job_id": "missing"})
@@ -0,0 +1,66 @@
+"""Tests for registering prebuilt tools and resource templates on FastMCP."""
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.resources import ResourceTemplate
+
+from notion_mcp.runtime.dispatch import build_tool
+from notion_mcp.runtime.registry import (
+    add_prebuilt_tool,
+    add_resource_template,
+    enable_resource_subscriptions,
+    registered_tools,
+)
+
+
+@pytest.mark.asyncio
+async def test_prebuilt_tools_are_listed_and_replaced_by_name() -> None:
+    app = FastMCP("test")
+    first = build_tool({"name": "notion_get_page"}, AsyncMock())
+    second = build_tool({"name": "notion_get_page", "description": "Newer"}, AsyncMock())
+
+    assert add_prebuilt_tool(app, first) is False
+    assert add_prebuilt_tool(app, second) is True
+
+    assert registered_tools(app) == [second]
+    assert [tool.description for tool in await app.list_tools()] == ["Newer"]
+
+
+@pytest.mark.asyncio
+async def test_resource_templates_are_listed() -> None:
+    app = FastMCP("test")
+    template = ResourceTemplate.from_function(
+        lambda name: name, uri_template="notion://test/{name}", name="test"
+    )
+
+    add_resource_template(app, template)
+
+    assert [item.uriTemplate for item in await app.list_resource_templates()] == [
+        "notion://test/{name}"
+    ]
+
+
+def test_changed_fastmcp_internals_fail_loudly() -> None:
+    app = FastMCP("test")
+    app._tool_manager = object()
+
+    with pytest.raises(RuntimeError, match="_tool_manager._tools"):
+        registered_tools(app)
+
+
+def test_resource_subscriptions_are_advertised() -> None:
+    app = FastMCP("test")
+
+    enable_resource_subscriptions(app, Mock(), Mock())
+
+    options = app._mcp_server.create_initialization_options()
+    assert options.capabilities.resources.subscribe is True
+
+
+def test_changed_low_level_server_fails_loudly() -> None:
+    app = FastMCP("test")
+    app._mcp_server = object()
+
+    with pytest.raises(RuntimeError, match="_mcp_server"):
+        enable_resource_subscriptions(app, Mock(), Mock())
@@ -0,0 +1,121 @@
+"""Tests for cached database resources and their update notifications."""
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+from mcp import types
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from notion_mcp.runtime.resources import DatabaseResources
+from notion_mcp.services.service_pool import NotionServicePool
+from notion_mcp.utils import DatabaseType
+
+
+def _resources(schema):
+    pool = NotionServicePool("token")
+    pool.default.get_database = AsyncMock(side_effect=lambda database_id: dict(schema))
+    resources = DatabaseResources(pool, {DatabaseType.WORK: "db-work", DatabaseType.STUDIES: ""})
+    app = FastMCP("test")
+    resources.register(app)
+    return app, pool.default, resources
+
+
+@pytest.mark.asyncio
+async def test_database_resource_is_served_from_cache() -> None:
+    app, service, _ = _resources({"id": "db-work", "last_edited_time": "2025-01-01T00:00:00Z"})
+
+    async with create_connected_server_and_client_session(app._mcp_server) as client:
+        first = await client.read_resource("notion://database/work")
+        await client.read_resource("notion://database/work")
+
+    assert json.loads(first.contents[0].text)["id"] == "db-work"
+    assert service.get_database.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_schema_change_notifies_subscribed_sessions() -> None:
+    schema = {"id": "db-work", "last_edited_time": "2025-01-01T00:00:00Z"}
+    app, _, resources = _resources(schema)
+    updates = []
+
+    async def on_message(message) -> None:
+        if isinstance(message, types.ServerNotification):
+            updates.append(str(message.root.params.uri))
+
+    async with create_connected_server_and_client_session(
+        app._mcp_server, message_handler=on_message
+    ) as client:
+        initialized = await client.initialize()
+        await client.read_resource("notion://database/work")
+        await client.subscribe_resource("notion://database/work")
+
+        assert await resources.poll() == 0  # Unchanged
+        schema["last_edited_time"] = "2025-02-01T00:00:00Z"
+        assert await resources.poll() == 1
+        await asyncio.sleep(0.05)
+
+    assert initialized.capabilities.resources.subscribe is True
+    assert updates == ["notion://database/work"]
+
+
+def _class_page(index: int, status: str, start: str | None = None) -> dict:
+    properties = {
+        "Nome do projeto": {"title": [{"plain_text": f"Card {index}"}]},
+        "Status": {"status": {"name": status}},
+        "Periodo": {"date": {"start": start} if start else None},
+    }
+    return {"object": "page", "id": f"page-{index}", "properties": properties}
+
+
+@pytest.mark.asyncio
+async def test_card_list_resource_pages_through_the_store_without_api_calls() -> None:
+    app, service, resources = _resources({"id": "db-work"})
+    service._request = AsyncMock()
+    resources.pool.store.ingest_many(
+        [_class_page(index, "Em andamento", f"2025-03-{10 - index:02d}") for index in range(5)]
+        + [_class_page(9, "Concluído")],
+        database_id="db-work",
+    )
+
+    async with create_connected_server_and_client_session(app._mcp_server) as client:
+        uri = "notion://database/work/cards?status=Em%20andamento&limit=3"
+        first = json.loads((await client.read_resource(uri)).contents[0].text)
+        second = json.loads(
+            (await client.read_resource(f"{uri}&cursor={first['next_cursor']}")).contents[0].text
+        )
+        templates = await client.list_resource_templates()
+
+    assert first["total"] == 5
+    assert [card["id"] for card in first["cards"]] == ["page-4", "page-3", "page-2"]
+    assert [card["id"] for card in second["cards"]] == ["page-1", "page-0"]
+    assert second["next_cursor"] is None
+    assert first["cards"][0] == {
+        "id": "page-4",
+        "title": "Card 4",
+        "status": "Em andamento",
+        "start": "2025-03-06",
+        "end": None,
+        "parent": None,
+        "url": None,
+        "last_edited_time": None,
+    }
+    assert "notion://database/work/cards{?status,parent,limit,cursor}" in [
+        template.uriTemplate for template in templates.resourceTemplates
+    ]
+    service._request.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_bare_card_list_uri_lists_the_first_page() -> None:
+    app, _, resources = _resources({"id": "db-work"})
+    resources.pool.store.ingest_many(
+        [_class_page(index, "Em andamento") for index in range(2)], database_id="db-work"
+    )
+
+    bare = await app.read_resource("notion://database/work/cards")
+    blank = await app.read_resource("notion://database/work/cards?cursor=&unknown=1")
+
+    assert json.loads(bare[0].content)["total"] == 2
+    assert json.loads(blank[0].content)["total"] == 2
@@ -0,0 +1,90 @@
+"""Tests for the tool result size budget and continuation tokens."""
+import json
+
+import pytest
+
+from notion_mcp.runtime.dispatch import build_tool
+from notion_mcp.runtime.results import ResultCache, ResultTools
+from notion_mcp.utils.progress import ProgressTracker, bind_tracker, reset_tracker
+
+
+def _query_result(count: int) -> dict:
+    pages = [{"object": "page", "id": f"page-{index}", "body": "x" * 200} for index in range(count)]
+    return {"object": "list", "results": pages, "has_more": False}
+
+
+def test_small_results_are_returned_unchanged() -> None:
+    cache = ResultCache(budget_bytes=10_000)
+    result = _query_result(3)
+
+    assert cache.fit("notion_query_database", result) is result
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_large_result_is_paged_through_continuation_tool() -> None:
+    cache = ResultCache(budget_bytes=2_000)
+    tools = ResultTools(cache)
+
+    head = cache.fit("notion_query_database", _query_result(30))
+    continuation = head["continuation"]
+    collected = list(head["results"])
+    while continuation.get("next_offset") is not None:
+        page = await tools.handle_tool_call(
+            "notion_result_continue", {"token": continuation["token"]}
+        )
+        assert len(json.dumps(page)) <= 2_500
+        collected.extend(page["items"])
+        continuation = page
+
+    assert head["object"] == "list" and head["has_more"] is False
+    assert continuation["total"] == 30
+    assert [page["id"] for page in collected] == [f"page-{index}" for index in range(30)]
+
+
+def test_results_without_lists_are_served_as_text_chunks() -> None:
+    cache = ResultCache(budget_bytes=500)
+    result = {"id": "page", "description": "y" * 3_000}
+
+    head = cache.fit("notion_get_page", result)
+    text = head["chunk"]
+    offset = head["continuation"]["next_offset"]
+    while offset is not None:
+        page = cache.next(head["continuation"]["token"], offset)
+        text += page["chunk"]
+        offset = page["next_offset"]
+
+    assert json.loads(text) == result
+
+
+def test_expired_tokens_are_rejected() -> None:
+    now = [0.0]
+    cache = ResultCache(budget_bytes=500, ttl_seconds=10, clock=lambda: now[0])
+    token = cache.fit("bulk", _query_result(10))["continuation"]["token"]
+
+    now[0] = 11.0
+
+    with pytest.raises(ValueError, match="expired"):
+        cache.next(token)
+
+
+@pytest.mark.asyncio
+async def test_tool_results_are_budgeted_only_at_top_level() -> None:
+    cache = ResultCache(budget_bytes=1_000)
+
+    async def handler(arguments):
+        return _query_result(arguments["count"])
+
+    schema = {"type": "object", "properties": {"count": {"type": "integer"}}}
+    tool = build_tool({"name": "notion_query_database", "inputSchema": schema}, handler, cache)
+
+    truncated = await tool.run({"count": 20})
+    token = bind_tracker(ProgressTracker())  # As inside notion_batch
+    try:
+        nested = await tool.fn(count=20)
+    finally:
+        reset_tracker(token)
+
+    assert "continuation" in truncated
+    assert len(truncated["results"]) < 20
+    assert len(nested["results"]) == 20
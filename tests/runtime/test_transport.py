@@ -0,0 +1,63 @@
+"""Tests for runtime configuration (transport, tokens) and the runtime shared across sessions."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from notion_mcp.runtime.app import SharedRuntime
+from notion_mcp.runtime.config import NotionConfig, load_config, load_transport_config
+
+
+def test_transport_defaults_to_stdio(monkeypatch) -> None:
+    monkeypatch.delenv("MCP_TRANSPORT", raising=False)
+    monkeypatch.delenv("MCP_PORT", raising=False)
+
+    config = load_transport_config([])
+
+    assert config.transport == "stdio"
+    assert not config.shared
+
+
+def test_cli_flags_override_environment(monkeypatch) -> None:
+    monkeypatch.setenv("MCP_TRANSPORT", "sse")
+    monkeypatch.setenv("MCP_PORT", "9000")
+
+    assert load_transport_config([]).port == 9000
+    config = load_transport_config(["--transport", "streamable-http", "--port", "8123"])
+
+    assert (config.transport, config.port, config.shared) == ("streamable-http", 8123, True)
+
+
+def test_invalid_transport_is_rejected(monkeypatch) -> None:
+    monkeypatch.setenv("MCP_TRANSPORT", "websocket")
+
+    with pytest.raises(ValueError, match="MCP_TRANSPORT"):
+        load_transport_config([])
+
+
+@pytest.mark.asyncio
+async def test_shared_runtime_closes_only_when_last_holder_leaves() -> None:
+    service = MagicMock(close=AsyncMock())
+    jobs = MagicMock(shutdown=AsyncMock())
+    runtime = SharedRuntime(NotionConfig(token="t", database_ids={}), service, jobs)
+
+    async with runtime.hold():  # e.g., the HTTP server
+        async with runtime.hold():  # a client session
+            pass
+        service.close.assert_not_awaited()
+
+    service.close.assert_awaited_once()
+    jobs.shutdown.assert_awaited_once()
+
+
+def test_database_tokens_route_databases_to_their_integration(monkeypatch) -> None:
+    monkeypatch.delenv("NOTION_API_TOKEN", raising=False)
+    monkeypatch.setenv("NOTION_WORK_DATABASE_ID", "db-work")
+    monkeypatch.setenv("NOTION_WORK_API_TOKEN", "work-token")
+    for name in ("STUDIES", "PERSONAL", "YOUTUBER"):
+        monkeypatch.delenv(f"NOTION_{name}_DATABASE_ID", raising=False)
+        monkeypatch.delenv(f"NOTION_{name}_API_TOKEN", raising=False)
+
+    config = load_config()
+
+    assert config.token == "work-token"
+    assert config.tokens_by_database_id() == {"db-work": "work-token"}
@@ -0,0 +1,77 @@
+"""Tests for the in-memory card store and its dedup index."""
+from notion_mcp.services.card_store import CardStore, normalize_date
+
+
+def _page(page_id, title, parent=None, start=None, database_id="db-1", **extra):
+    properties = {"Name": {"title": [{"plain_text": title}]}}
+    if parent is not None:
+        properties["Parent"] = {"relation": [{"id": parent}]}
+    if start is not None:
+        properties["Date"] = {"date": {"start": start}}
+    return {
+        "object": "page",
+        "id": page_id,
+        "parent": {"database_id": database_id},
+        "properties": properties,
+        **extra,
+    }
+
+
+def _request(title, parent=None, start=None):
+    properties = {"Name": {"title": [{"text": {"content": title}}]}}
+    if parent is not None:
+        properties["Parent"] = {"relation": [{"id": parent}]}
+    if start is not None:
+        properties["Date"] = {"date": {"start": start}}
+    return properties
+
+
+def test_dedup_key_matches_response_and_request_shapes() -> None:
+    store = CardStore()
+    store.register_database("db1", "Name", "Parent", "Date")
+    store.ingest(
+        {
+            "object": "list",
+            "results": [
+                _page(
+                    "page-1",
+                    "Aula  01",
+                    parent="AB-CD",
+                    start="2025-01-06T22:30:00.000Z",
+                    database_id="d-b-1",
+                )
+            ],
+        }
+    )
+
+    key = store.dedup_key("db-1", _request(" aula 01 ", "abcd", "2025-01-06T19:30:00-03:00"))
+
+    assert store.find(key)["id"] == "page-1"
+    assert store.find(store.dedup_key("db1", _request("Aula 02", "abcd"))) is None
+
+
+def test_pages_are_indexed_when_database_registers_later() -> None:
+    store = CardStore()
+    store.ingest(_page("page-1", "Projeto"))
+    key_before = store.dedup_key("db-1", _request("Projeto"))
+
+    store.register_database("db-1", "Name")
+
+    assert key_before is None
+    assert store.find(store.dedup_key("db-1", _request("projeto")))["id"] == "page-1"
+
+
+def test_archived_pages_leave_the_index() -> None:
+    store = CardStore()
+    store.register_database("db-1", "Name")
+    store.ingest(_page("page-1", "Projeto"))
+
+    store.ingest(_page("page-1", "Projeto", archived=True))
+
+    assert len(store) == 0
+    assert store.find(store.dedup_key("db-1", _request("Projeto"))) is None
+
+
+def test_normalize_date_keeps_date_only_values() -> None:
+    assert normalize_date("2025-01-06") == "2025-01-06"
+    assert normalize_date("2025-01-06T19:30:00.123-03:00") == "2025-01-06T22:30:00+00:00"
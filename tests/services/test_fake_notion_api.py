@@ -0,0 +1,130 @@
+"""Tests for the in-process Notion API stand-in."""
+from __future__ import annotations
+
+import pytest
+
+from notion_mcp.services.fake_notion_api import FakeNotionAPI
+from notion_mcp.services.notion_service import (
+    NotionAPIError,
+    NotionRateLimitError,
+    NotionService,
+)
+
+
+def _card(service: NotionService, title: str, status: str, start: str) -> dict:
+    return {
+        "Name": service.build_title_property(title),
+        "Status": service.build_status_property(status),
+        "Período": service.build_date_property(start),
+    }
+
+
+@pytest.fixture
+async def api_and_service():
+    api = FakeNotionAPI(seed=1)
+    database_id = api.add_database(
+        "Studies", {"Name": "title", "Status": "status", "Período": "date"}
+    )
+    service = NotionService(token="fake-token", transport=api)
+    service.rate_limiter.rate = 0
+    try:
+        yield api, service, database_id
+    finally:
+        await service.close()
+
+
+@pytest.mark.asyncio
+async def test_query_filters_sorts_and_paginates(api_and_service) -> None:
+    api, service, database_id = api_and_service
+    for title, status, start in (
+        ("Aula 3", "Para Fazer", "2025-01-08"),
+        ("Aula 1", "Concluído", "2025-01-06"),
+        ("Aula 2", "Para Fazer", "2025-01-07"),
+        ("Aula 4", "Para Fazer", "2025-01-09"),
+    ):
+        await service.create_page(database_id, _card(service, title, status, start))
+
+    first = await service.query_database(
+        database_id,
+        filter_conditions={
+            "and": [
+                {"property": "Status", "status": {"equals": "Para Fazer"}},
+                {"property": "Período", "date": {"on_or_before": "2025-01-08"}},
+            ]
+        },
+        sorts=[{"property": "Período", "direction": "ascending"}],
+        page_size=1,
+    )
+    second = await service.query_database(
+        database_id,
+        filter_conditions={"property": "Status", "status": {"equals": "Para Fazer"}},
+        sorts=[{"property": "Período", "direction": "descending"}],
+    )
+
+    assert [page["properties"]["Período"]["date"]["start"] for page in first["results"]] == [
+        "2025-01-07"
+    ]
+    assert first["has_more"] is True
+    rest = await service.query_database(
+        database_id,
+        filter_conditions={
+            "and": [
+                {"property": "Status", "status": {"equals": "Para Fazer"}},
+                {"property": "Período", "date": {"on_or_before": "2025-01-08"}},
+            ]
+        },
+        sorts=[{"property": "Período", "direction": "ascending"}],
+        start_cursor=first["next_cursor"],
+    )
+    assert [page["properties"]["Período"]["date"]["start"] for page in rest["results"]] == [
+        "2025-01-08"
+    ]
+    assert rest["has_more"] is False
+    assert [page["properties"]["Período"]["date"]["start"] for page in second["results"]] == [
+        "2025-01-09",
+        "2025-01-08",
+        "2025-01-07",
+    ]
+    assert api.requests["POST databases/{id}/query"] == 3
+    # Responses feed the card store like the real API
+    assert len(list(service.store.pages(database_id))) == 4
+
+
+@pytest.mark.asyncio
+async def test_errors_use_notion_status_codes(api_and_service) -> None:
+    api, service, database_id = api_and_service
+
+    with pytest.raises(NotionAPIError, match="404"):
+        await service.get_page("00000000-0000-0000-0000-000000000000")
+    with pytest.raises(NotionAPIError, match="is not a property that exists"):
+        await service.create_page(database_id, {"Missing": service.build_number_property(1)})
+
+    api.rate_limit_per_second = 1
+    api.rate_limit_burst = 1
+    await service.get_me()
+    with pytest.raises(NotionRateLimitError):
+        await service.get_me()
+    assert api.statuses[429] == 1
+
+
+@pytest.mark.asyncio
+async def test_blocks_search_and_archive(api_and_service) -> None:
+    api, service, database_id = api_and_service
+    page = await service.create_page(
+        database_id, _card(service, "Python", "Para Fazer", "2025-01-06")
+    )
+
+    await service.append_blocks(
+        page["id"],
+        [{"type": "paragraph", "paragraph": {"rich_text": service.build_rich_text("Intro")}}],
+    )
+    children = await service.get_block_children(page["id"])
+    found = await service.search(
+        query="pyth", filter_conditions={"property": "object", "value": "page"}
+    )
+    await service.archive_page(page["id"])
+    after_archive = await service.query_database(database_id)
+
+    assert [block["type"] for block in children["results"]] == ["paragraph"]
+    assert [item["id"] for item in found["results"]] == [page["id"]]
+    assert after_archive["results"] == []
@@ -0,0 +1,27 @@
+"""Tests for the shared Notion request rate limiter."""
+import asyncio
+import time
+
+import pytest
+
+from notion_mcp.services.rate_limiter import AsyncRateLimiter
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_requests_after_burst() -> None:
+    limiter = AsyncRateLimiter(rate_per_second=50, burst=2)
+
+    started = time.monotonic()
+    waits = await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+    elapsed = time.monotonic() - started
+
+    assert waits[:2] == [0.0, 0.0]
+    assert all(wait > 0 for wait in waits[2:])
+    assert elapsed >= 0.035
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_disabled_with_zero_rate() -> None:
+    limiter = AsyncRateLimiter(rate_per_second=0)
+
+    assert await limiter.acquire() == 0.0
@@ -0,0 +1,62 @@
+"""Tests for the cross-database schedule index."""
+from notion_mcp.services.schedule_index import ScheduleIndex
+
+
+def _period(start, end=None):
+    return {"start": start, "end": end}
+
+
+def test_overlaps_are_found_across_timezones_and_touching_slots_are_not() -> None:
+    index = ScheduleIndex()
+    index.add("aula", _period("2025-01-06T22:00:00.000Z", "2025-01-06T23:00:00.000Z"), "studies")
+    index.add("gravacao", _period("2025-01-06T21:00:00-03:00", "2025-01-06T23:50:00-03:00"))
+
+    conflicts = index.find_conflicts([_period("2025-01-06T19:30:00", "2025-01-06T21:30:00")])
+    touching = index.find_conflicts(
+        [_period("2025-01-06T20:00:00-03:00", "2025-01-06T21:00:00-03:00")]
+    )
+
+    assert {clash["page_id"] for clash in conflicts[0]["conflicts"]} == {"aula", "gravacao"}
+    assert touching == []
+
+
+def test_date_only_and_long_periods_are_not_indexed() -> None:
+    index = ScheduleIndex()
+    index.add("curso", _period("2025-01-01T00:00:00-03:00", "2025-03-01T00:00:00-03:00"))
+    index.add("tarefa", _period("2025-01-06"))
+
+    assert len(index) == 0
+    assert index.find_conflicts([_period("2025-01-06T19:00:00", "2025-01-06T21:00:00")]) == []
+
+
+def test_planned_periods_are_checked_against_each_other_and_exclusions() -> None:
+    index = ScheduleIndex()
+    index.add("aula-1", _period("2025-01-06T19:00:00", "2025-01-06T21:00:00"))
+
+    conflicts = index.find_conflicts(
+        [
+            _period("2025-01-06T19:00:00", "2025-01-06T20:00:00"),
+            _period("2025-01-06T19:30:00", "2025-01-06T20:30:00"),
+        ],
+        exclude=["aula-1"],
+    )
+
+    assert conflicts[0]["conflicts"] == [{"index": 1}]
+    assert conflicts[1]["conflicts"] == [{"index": 0}]
+
+
+def test_instants_at_the_same_time_conflict() -> None:
+    index = ScheduleIndex()
+    index.add("lembrete", _period("2025-01-06T19:00:00-03:00"))
+    index.add("aula", _period("2025-01-06T20:00:00-03:00", "2025-01-06T21:00:00-03:00"))
+
+    indexed = index.find_conflicts([_period("2025-01-06T22:00:00.000Z")])
+    planned = index.find_conflicts(
+        [_period("2025-01-07T08:00:00"), _period("2025-01-07T08:00:00")]
+    )
+    inside = index.find_conflicts([_period("2025-01-06T20:00:00"), _period("2025-01-06T21:00:00")])
+
+    assert [clash["page_id"] for clash in indexed[0]["conflicts"]] == ["lembrete"]
+    assert [entry["conflicts"] for entry in planned] == [[{"index": 1}], [{"index": 0}]]
+    # An instant at the start of a class conflicts; one at its end only touches it
+    assert [entry["index"] for entry in inside] == [0]
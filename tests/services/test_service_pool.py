@@ -0,0 +1,61 @@
+"""Tests for the per-token NotionService pool."""
+from unittest.mock import AsyncMock
+
+import pytest
+
+from notion_mcp.exceptions import NotionAPIError
+from notion_mcp.services.service_pool import NotionServicePool
+
+
+def test_pool_keeps_one_service_and_limiter_per_token() -> None:
+    pool = NotionServicePool("default", {"db-work": "work-token", "db-study": "work-token"})
+
+    work = pool.for_database("db-work")
+
+    assert len(pool) == 2
+    assert work is pool.for_database("db-study")
+    assert work.token == "work-token"
+    assert work.rate_limiter is not pool.default.rate_limiter
+    assert pool.for_database("db-unknown") is pool.default
+    assert work.store is pool.store is pool.default.store
+
+
+@pytest.mark.asyncio
+async def test_pool_routes_pages_through_their_database() -> None:
+    pool = NotionServicePool("default", {"db-work": "work-token"})
+    work = pool.for_database("db-work")
+    work._request = AsyncMock(
+        return_value={"object": "page", "id": "page-1", "parent": {"database_id": "db-work"}}
+    )
+
+    await work.get_page("page-1")
+
+    assert await pool.for_page("page-1") is work
+
+
+@pytest.mark.asyncio
+async def test_pool_looks_up_pages_missing_from_the_store() -> None:
+    pool = NotionServicePool("default", {"db-work": "work-token"})
+    work = pool.for_database("db-work")
+    pool.default._request = AsyncMock(side_effect=NotionAPIError("Notion API error 404"))
+    work._request = AsyncMock(
+        return_value={"object": "page", "id": "page-2", "parent": {"database_id": "db-work"}}
+    )
+
+    assert await pool.for_page("page-2") is work
+    # Ingested by the lookup: routed from the store afterwards
+    assert await pool.for_page("page-2") is work
+    assert work._request.await_count == 1
+
+    work._request = AsyncMock(side_effect=NotionAPIError("Notion API error 404"))
+    with pytest.raises(NotionAPIError, match="not accessible to any configured integration"):
+        await pool.for_page("page-3")
+
+
+@pytest.mark.asyncio
+async def test_single_token_pool_does_not_look_up_pages() -> None:
+    pool = NotionServicePool("default")
+    pool.default._request = AsyncMock()
+
+    assert await pool.for_page("page-1") is pool.default
+    pool.default._request.assert_not_awaited()
@@ -0,0 +1,49 @@
+"""Tests for import checkpoint manifests."""
+import pytest
+
+from notion_mcp.utils.checkpoint import CheckpointManifest
+
+
+def test_nodes_are_written_once_per_level_and_resumed(tmp_path) -> None:
+    manifest = CheckpointManifest.for_import("db", "Curso", directory=tmp_path)
+
+    with manifest.saving():
+        manifest.record("course", "Curso", "page-1")
+        assert not manifest.path.exists()  # Buffered until the level ends
+    with pytest.raises(RuntimeError), manifest.saving():
+        manifest.record("0", "Fase 1", "page-2")
+        raise RuntimeError("network down")
+
+    resumed = CheckpointManifest.for_import("db", "Curso", directory=tmp_path)
+    assert resumed.get("course", "Curso") == "page-1"
+    assert resumed.get("0", "Fase 1") == "page-2"
+    assert resumed.get("0", "Renamed") is None
+
+
+def test_complete_removes_the_manifest(tmp_path) -> None:
+    manifest = CheckpointManifest.for_import("db", "Curso", directory=tmp_path)
+    with manifest.saving():
+        manifest.record("course", "Curso", "page-1")
+
+    manifest.complete()
+
+    assert not manifest.path.exists()
+    assert CheckpointManifest.for_import("db", "Curso", directory=tmp_path).page_ids() == set()
+
+
+def test_nodes_of_an_unfinished_level_are_replayed_from_the_journal(tmp_path) -> None:
+    manifest = CheckpointManifest.for_import("db", "Curso", directory=tmp_path)
+    level = manifest.saving()
+    level.__enter__()  # The process dies before the level ends
+    manifest.record("0.0.0", "Aula 0", "page-1")
+    manifest.record("0.0.1", "Aula 1", "page-2")
+    with open(manifest.journal, "a", encoding="utf-8") as journal:
+        journal.write('{"node": "0.0.2", "id"')  # Cut short
+
+    resumed = CheckpointManifest.for_import("db", "Curso", directory=tmp_path)
+
+    assert resumed.page_ids() == {"page-1", "page-2"}
+    fresh = CheckpointManifest.for_import("db", "Curso", resume=False, directory=tmp_path)
+    assert fresh.page_ids() == set()
+    assert not fresh.journal.exists()
+    level.__exit__(None, None, None)
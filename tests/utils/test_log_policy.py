@@ -0,0 +1,46 @@
+"""Tests for the tool-call logging policy."""
+import json
+from unittest.mock import MagicMock
+
+from notion_mcp.utils.log_policy import LazyArguments, ToolCallLogPolicy
+
+
+def test_truncate_caps_strings_lists_and_depth() -> None:
+    policy = ToolCallLogPolicy(max_chars=5, max_items=2, max_depth=3)
+
+    result = policy.truncate(
+        {
+            "title": "abcdefghij",
+            "fases": [{"sections": [{"classes": []}]}, {}, {}],
+        }
+    )
+
+    assert result["title"] == "abcde...(+5 chars)"
+    assert len(result["fases"]) == 3
+    assert result["fases"][0] == {"sections": "<list with 1 items>"}
+    assert result["fases"][-1] == "...(+1 items)"
+
+
+def test_sampling_logs_burst_then_every_nth_call() -> None:
+    policy = ToolCallLogPolicy(burst=2, sample_every=3)
+    log = MagicMock()
+
+    for _ in range(8):
+        policy.log_tool_call(log, "handling_study_tool", "study_create_class", {"title": "Aula"})
+
+    # Calls 1, 2, 5 and 8 are emitted
+    assert log.info.call_count == 4
+    assert log.info.call_args.kwargs["call_count"] == 8
+    assert log.info.call_args.kwargs["sampled_out"] == 2
+
+
+def test_lazy_arguments_serialize_only_when_rendered() -> None:
+    policy = ToolCallLogPolicy()
+    lazy = LazyArguments(policy, "study_create_course", {"title": "Curso"})
+
+    assert policy.stats() == {}
+
+    rendered = lazy.__structlog__()
+
+    assert rendered == {"title": "Curso"}
+    assert policy._bytes["study_create_course"] == len(json.dumps(rendered).encode("utf-8"))
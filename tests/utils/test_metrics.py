@@ -0,0 +1,76 @@
+"""Tests for the in-process metrics registry."""
+import pytest
+
+from notion_mcp.utils.metrics import MetricsRegistry, endpoint_template
+
+
+def _value(snapshot, counter, **labels):
+    for entry in snapshot["counters"].get(counter, []):
+        if all(entry.get(key) == str(value) for key, value in labels.items()):
+            return entry["value"]
+    return None
+
+
+def test_endpoint_template_replaces_ids() -> None:
+    assert endpoint_template("pages/1a2b3c4d-1a2b-1a2b-1a2b-1a2b3c4d5e6f") == "pages/{id}"
+    assert (
+        endpoint_template("/databases/1a2b3c4d1a2b1a2b1a2b1a2b3c4d5e6f/query")
+        == "databases/{id}/query"
+    )
+    assert endpoint_template("search") == "search"
+
+
+def test_tool_call_counts_requests_including_nested_calls() -> None:
+    metrics = MetricsRegistry()
+
+    with metrics.tool_call("notion_batch"):
+        metrics.record_request("POST", "pages", 200, 12.0)
+        with metrics.tool_call("study_create_class"):
+            metrics.record_request("POST", "pages", 429, 3.0)
+            metrics.record_request("POST", "pages", 200, 40.0, request_bytes=10, response_bytes=90)
+
+    snapshot = metrics.snapshot()
+    notion_calls = {
+        entry["tool"]: entry["sum"] for entry in snapshot["histograms"]["tool_notion_calls"]
+    }
+    assert notion_calls == {"notion_batch": 3, "study_create_class": 2}
+    assert _value(snapshot, "tool_calls_total", tool="notion_batch", status="ok") == 1
+    assert _value(snapshot, "notion_requests_total", endpoint="pages", status=429) == 1
+    assert _value(snapshot, "notion_rate_limited_total", tool="study_create_class") == 1
+    assert _value(snapshot, "notion_payload_bytes_total", direction="received") == 90
+
+
+def test_failed_tool_call_is_counted_as_error() -> None:
+    metrics = MetricsRegistry()
+
+    with pytest.raises(RuntimeError), metrics.tool_call("study_create_class"):
+        raise RuntimeError("boom")
+
+    snapshot = metrics.snapshot()
+    assert _value(snapshot, "tool_calls_total", tool="study_create_class", status="error") == 1
+
+
+def test_cache_hit_ratio() -> None:
+    metrics = MetricsRegistry()
+
+    for hit in (True, True, True, False):
+        metrics.record_cache("database_schema", hit)
+
+    assert metrics.snapshot()["cache_hit_ratio"] == {"database_schema": 0.75}
+
+
+def test_write_prometheus_renders_counters_and_histograms(tmp_path) -> None:
+    metrics = MetricsRegistry()
+    metrics.inc("notion_retries_total", reason="rate_limited")
+    metrics.observe("tool_latency_ms", 7, tool="notion_query")
+    target = tmp_path / "logs" / "metrics.prom"
+
+    metrics.write_prometheus(str(target))
+
+    text = target.read_text()
+    assert "# TYPE notion_mcp_notion_retries_total counter" in text
+    assert 'notion_mcp_notion_retries_total{reason="rate_limited"} 1' in text
+    assert 'notion_mcp_tool_latency_ms_bucket{tool="notion_query",le="5"} 0' in text
+    assert 'notion_mcp_tool_latency_ms_bucket{tool="notion_query",le="10"} 1' in text
+    assert 'notion_mcp_tool_latency_ms_count{tool="notion_query"} 1' in text
+    assert list(target.parent.iterdir()) == [target]
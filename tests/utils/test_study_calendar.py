@@ -0,0 +1,51 @@
+"""Tests for the precomputed study-slot calendar."""
+from datetime import date, datetime
+
+import pytest
+
+from notion_mcp.utils.formatters import get_next_business_day
+from notion_mcp.utils.study_calendar import StudySlotCalendar
+
+
+def test_assign_skips_weekends_and_applies_tuesday_hours() -> None:
+    calendar = StudySlotCalendar(date(2025, 3, 7))  # Friday
+
+    periods = calendar.assign([120, 90, 60])
+
+    assert [start for start, _ in periods] == [
+        datetime(2025, 3, 7, 19, 0),
+        datetime(2025, 3, 10, 19, 0),
+        datetime(2025, 3, 11, 19, 30),
+    ]
+    assert periods[1][1] == datetime(2025, 3, 10, 20, 30)
+
+
+def test_treatment_pause_keeps_default_tuesday_hours() -> None:
+    calendar = StudySlotCalendar(date(2025, 1, 1))
+
+    assert calendar.window(date(2025, 1, 7)).start.time().isoformat() == "19:00:00"
+    assert calendar.window(date(2025, 1, 21)).start.time().isoformat() == "19:30:00"
+    assert calendar.window(date(2025, 1, 4)) is None
+
+
+def test_assign_grows_past_the_horizon() -> None:
+    calendar = StudySlotCalendar(date(2025, 1, 6), horizon_days=7)
+
+    periods = calendar.assign([60] * 300)
+
+    assert len(periods) == 300
+    assert all(start.weekday() < 5 for start, _ in periods)
+    assert periods[-1][0].date() == date(2026, 2, 27)
+
+
+def test_assign_rejects_durations_beyond_the_slot() -> None:
+    calendar = StudySlotCalendar(date(2025, 3, 11))  # Tuesday: 19:30-21:00
+
+    with pytest.raises(ValueError, match="daily limit"):
+        calendar.assign([120])
+
+
+def test_next_business_day_is_arithmetic() -> None:
+    assert get_next_business_day(datetime(2025, 3, 7)) == datetime(2025, 3, 10)
+    assert get_next_business_day(datetime(2025, 3, 8)) == datetime(2025, 3, 10)
+    assert get_next_business_day(datetime(2025, 3, 10)) == datetime(2025, 3, 11)
@@ -0,0 +1,31 @@
+"""Tests for the phase timer."""
+from types import SimpleNamespace
+
+from notion_mcp.utils import timing
+from notion_mcp.utils.timing import PhaseTimer
+
+
+def test_phases_accumulate_and_total_covers_the_timer_lifetime(monkeypatch) -> None:
+    clock = iter([0.0, 1.0, 1.5, 2.0, 2.25, 5.0])
+    monkeypatch.setattr(timing, "time", SimpleNamespace(perf_counter=lambda: next(clock)))
+    timer = PhaseTimer()
+
+    with timer.phase("sections"):
+        pass
+    with timer.phase("sections"):
+        pass
+    timer.record("classes", 12.34)
+
+    assert timer.as_dict() == {"sections": 750.0, "classes": 12.3, "total": 5000.0}
+
+
+def test_failing_phase_is_still_recorded() -> None:
+    timer = PhaseTimer()
+
+    try:
+        with timer.phase("course"):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+
+    assert "course" in timer.as_dict()
@@ -0,0 +1,133 @@
+"""Tests for tracing spans and their JSONL export."""
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from notion_mcp.runtime.dispatch import SchemaToolDispatcher
+from notion_mcp.services.notion_service import NotionService
+from notion_mcp.utils.tracing import (
+    NOOP_SPAN,
+    STATUS_ERROR,
+    TRACER,
+    JsonlSpanExporter,
+    Tracer,
+)
+
+
+def _read_traces(path):
+    traces = []
+    for line in path.read_text().splitlines():
+        document = json.loads(line)
+        traces.append(document["resourceSpans"][0]["scopeSpans"][0]["spans"])
+    return traces
+
+
+def test_disabled_tracer_yields_noop_span() -> None:
+    with Tracer().span("anything") as span:
+        span.set_attribute("ignored", 1)
+
+    assert span is NOOP_SPAN
+
+
+def test_nested_spans_are_exported_together_when_the_root_ends(tmp_path) -> None:
+    path = tmp_path / "logs" / "traces.jsonl"
+    tracer = Tracer(JsonlSpanExporter(str(path)))
+
+    with tracer.span("root", size=3):
+        with tracer.span("child"):
+            pass
+        with pytest.raises(ValueError), tracer.span("failing"):
+            raise ValueError("bad input")
+    tracer.shutdown()
+
+    (spans,) = _read_traces(path)
+    by_name = {span["name"]: span for span in spans}
+    root = by_name["root"]
+    assert "parentSpanId" not in root
+    assert root["attributes"] == [{"key": "size", "value": {"intValue": "3"}}]
+    assert {span["traceId"] for span in spans} == {root["traceId"]}
+    assert by_name["child"]["parentSpanId"] == root["spanId"]
+    assert by_name["failing"]["status"] == {
+        "code": STATUS_ERROR,
+        "message": "ValueError: bad input",
+    }
+    assert int(root["endTimeUnixNano"]) >= int(root["startTimeUnixNano"])
+
+
+def test_spans_beyond_the_limit_are_dropped_and_counted(tmp_path) -> None:
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer(JsonlSpanExporter(str(path)), max_spans=3)
+
+    with tracer.span("root"):
+        for _ in range(5):
+            with tracer.span("child"):
+                pass
+    tracer.shutdown()
+
+    (spans,) = _read_traces(path)
+    assert len(spans) == 3
+    assert {"key": "tracing.dropped_spans", "value": {"intValue": "3"}} in spans[-1]["attributes"]
+
+
+@pytest.mark.asyncio
+async def test_background_spans_outliving_the_root_are_exported_in_one_batch(tmp_path) -> None:
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer(JsonlSpanExporter(str(path)))
+    release = asyncio.Event()
+
+    async def job():
+        with tracer.span("job"):
+            await release.wait()
+            for _ in range(3):
+                with tracer.span("step"):
+                    pass
+
+    with tracer.span("root"):
+        task = asyncio.create_task(job())
+        await asyncio.sleep(0)
+    assert not path.exists()
+
+    release.set()
+    await task
+    tracer.shutdown()
+
+    (spans,) = _read_traces(path)
+    assert [span["name"] for span in spans] == ["root", "step", "step", "step", "job"]
+
+
+@pytest.mark.asyncio
+async def test_tool_call_span_contains_the_http_request(tmp_path) -> None:
+    path = tmp_path / "traces.jsonl"
+    service = NotionService(token="secret-token")
+    await service.client.aclose()
+    service.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"id": "p1"})),
+        headers=service.headers,
+    )
+
+    async def handler(arguments):
+        return await service.get_page(arguments["page_id"])
+
+    dispatcher = SchemaToolDispatcher(
+        "notion_get_page",
+        {"type": "object", "properties": {"page_id": {"type": "string"}}},
+        handler,
+    )
+
+    TRACER.configure(JsonlSpanExporter(str(path)))
+    try:
+        await dispatcher(page_id="1a2b3c4d-1a2b-1a2b-1a2b-1a2b3c4d5e6f")
+    finally:
+        TRACER.configure(None)
+        await service.close()
+
+    (spans,) = _read_traces(path)
+    by_name = {span["name"]: span for span in spans}
+    tool = by_name["tools/call notion_get_page"]
+    http = by_name["GET pages/{id}"]
+    assert http["parentSpanId"] == tool["spanId"]
+    assert {"key": "http.response.status_code", "value": {"intValue": "200"}} in http["attributes"]
+    assert by_name["rate_limiter.acquire"]["parentSpanId"] == http["spanId"]
+    assert by_name["validate_arguments"]["parentSpanId"] == tool["spanId"]